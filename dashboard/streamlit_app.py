@@ -19,10 +19,25 @@ from sim.sim_helpers import (
     load_worlds_and_valuation,
     default_proposals,
     build_voters,
-    run_single_proposal,
 )
+from sim.file_cache import MtimeCache
+from sim.history_index import HistoryIndex
+from sim.jobs import FINISHED, JobParams, JobRunner
+from sim.markov import GovernanceChain
+from sim.metrics import METRICS, load_summary
+from sim.random_walk import WalkParams
+from sim.session import GovernanceSession
+from sim.storage import JsonStorage, Storage, open_storage
 from sim.model import KripkeModel
-from sim.visualize import graph_png_bytes, timeline_png_bytes
+from sim.visualize import (
+    LOD_MAX_NODES,
+    LayoutCache,
+    build_lod_view,
+    drill_down,
+    graph_png_bytes,
+    lod_graph_png_bytes,
+    timeline_png_bytes,
+)
 from scripts.init_graph import main as init_graph_script
 
 
@@ -31,29 +46,170 @@ st.title("PWSGT – Cyclic Possible World Governance (Simulation)")
 
 root = ROOT
 examples_dir, worlds_dir = ensure_examples_dirs(root)
+layout_cache = LayoutCache(os.path.join(examples_dir, ".layout_cache"))
+valuation_path = os.path.join(examples_dir, "valuation.json")
+graph_path = os.path.join(examples_dir, "graph.json")
+# Written by `run_vote_sim.py --metrics`
+metrics_path = os.path.join(examples_dir, "metrics.json")
+# PWSGT_STORAGE points the dashboard at another state backend: a SQLite
+# *.db file or another examples directory (see sim.storage.open_storage).
+storage_location = os.environ.get("PWSGT_STORAGE") or examples_dir
+# Records of history.json rendered inline on the Data tab; the full file is a download.
+HISTORY_PREVIEW = 20
 
 
-def read_active():
-    path = os.path.join(examples_dir, "active_world.json")
-    if not os.path.exists(path):
-        return {"active_world": "w1", "last_tx": None, "updated_at": None}
-    return json.load(open(path, 'r', encoding='utf-8'))
+@st.cache_resource
+def file_cache() -> MtimeCache:
+    """Process-wide cache shared by reruns and sessions; entries are keyed by
+    file path, mtime and size, so new simulation output invalidates them."""
+    return MtimeCache()
+
+
+cache = file_cache()
+
+
+@st.cache_resource
+def state_storage(location: str) -> Storage:
+    """One backend per location, shared by reruns, sessions and jobs."""
+    return open_storage(location)
+
+
+def state_paths(storage: Storage, *json_attrs: str) -> list:
+    """Files whose change invalidates values cached from ``storage``."""
+    if isinstance(storage, JsonStorage):
+        return [getattr(storage, attr) for attr in json_attrs]
+    return [storage.path, storage.path + "-wal"]
+
 
+state = state_storage(storage_location)
+# Everything the Kripke model is built from
+model_paths = state_paths(state, "worlds_dir", "valuation_path")
+history_paths = state_paths(state, "history_path")
+active_paths = state_paths(state, "active_path")
 
-def read_history():
-    path = os.path.join(examples_dir, "history.json")
+
+def _load_json(path: str, default):
     if not os.path.exists(path):
-        return []
-    return json.load(open(path, 'r', encoding='utf-8'))
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_active(location: str = storage_location):
+    storage = state_storage(location)
+    return cache.get(("active", location), state_paths(storage, "active_path"), storage.read_active)
+
+
+def read_history_index(location: str = storage_location) -> HistoryIndex:
+    storage = state_storage(location)
+    return cache.get(("history", location), state_paths(storage, "history_path"), lambda: HistoryIndex(storage.iter_history()))
+
+
+def read_json_artifact(path: str):
+    return cache.get(("json", path), [path], lambda: _load_json(path, None))
+
+
+def load_model(location: str = storage_location):
+    """Cached (store, worlds, model); treat as read-only."""
+    storage = state_storage(location)
+    return cache.get(
+        ("model", location), state_paths(storage, "worlds_dir", "valuation_path"),
+        lambda: load_worlds_and_valuation(examples_dir, storage),
+    )
+
+
+def chain_summary(voter_count: int, params, target: str):
+    """Cached Markov-chain analytics of the governance walk over the current frame."""
+    def compute():
+        store = load_model()[0]
+        return GovernanceChain.from_graph(store.G, build_voters(voter_count), params).summary(target)
+
+    return cache.get(("markov", voter_count, tuple(params.__dict__.items()), target), model_paths, compute)
 
 
 def reset_history():
-    json.dump([], open(os.path.join(examples_dir, "history.json"), 'w', encoding='utf-8'))
-    json.dump({"active_world": "w1", "last_tx": None, "updated_at": None}, open(os.path.join(examples_dir, "active_world.json"), 'w', encoding='utf-8'))
+    """Only the JSON layout can be reset; other backends keep their history."""
+    json.dump([], open(state.history_path, 'w', encoding='utf-8'))
+    json.dump({"active_world": "w1", "last_tx": None, "updated_at": None}, open(state.active_path, 'w', encoding='utf-8'))
+
+
+@st.cache_resource
+def job_runner() -> JobRunner:
+    return JobRunner(examples_dir, max_workers=2, storage=state)
+
+
+jobs = job_runner()
+
+
+@st.cache_resource
+def process_metrics():
+    """Enable stage timing once for this process; runs and jobs started here are recorded."""
+    METRICS.enable()
+    return METRICS
+
+
+process_metrics()
+
+
+def stage_rows(summary) -> list:
+    return [
+        {
+            "stage": name,
+            "count": s["count"],
+            "mean (ms)": round(s["mean_s"] * 1e3, 4),
+            "max (ms)": round(s["max_s"] * 1e3, 4),
+            "total (s)": round(s["total_s"], 4),
+            "share": f"{s['share']:.1%}",
+        }
+        for name, s in sorted(summary["spans"].items(), key=lambda kv: -kv[1]["total_s"])
+    ]
+
 
+def cycled_proposals(n: int):
+    """First ``n`` proposals of the example sequence, repeated with round suffixes."""
+    base = default_proposals()
+    out = []
+    for i in range(n):
+        prop_id, src, dst = base[i % len(base)]
+        out.append((prop_id if i < len(base) else f"{prop_id}-r{i // len(base)}", src, dst))
+    return out
 
-tab_overview, tab_run, tab_graph, tab_timeline, tab_data = st.tabs([
-    "Overview", "Configure & Run", "Graph", "Timeline", "Data",
+
+@st.fragment(run_every=1.0)
+def job_panel():
+    """Live job list; reruns on its own every second without rerunning the page."""
+    if not jobs.jobs:
+        return
+    st.subheader("Jobs")
+    for job in list(jobs.jobs.values()):
+        p = job.params
+        state = "committed" if job.committed else job.status
+        c1, c2, c3, c4 = st.columns([4, 1, 1, 1])
+        c1.progress(job.progress, text=f"{job.job_id} · seed {p.seed} · {job.done}/{job.total} · {state}")
+        if job.status not in FINISHED:
+            if c2.button("Cancel", key=f"cancel-{job.job_id}"):
+                job.cancel()
+        elif not job.committed:
+            if c3.button("Commit", key=f"commit-{job.job_id}"):
+                try:
+                    n = jobs.commit(job.job_id)
+                except RuntimeError as e:
+                    st.error(str(e))
+                else:
+                    st.success(f"Committed {n} transactions from job {job.job_id}.")
+        if c4.button("Discard" if not job.committed else "Remove", key=f"discard-{job.job_id}"):
+            jobs.discard(job.job_id)
+            st.rerun()
+        if job.error:
+            st.error(job.error)
+        if job.results:
+            passed = sum(1 for r in job.results if r["passed"])
+            with st.expander(f"Results for {job.job_id}: {passed}/{len(job.results)} passed"):
+                st.dataframe(job.results[-50:], use_container_width=True, hide_index=True)
+
+
+tab_overview, tab_run, tab_graph, tab_timeline, tab_data, tab_metrics, tab_analytics = st.tabs([
+    "Overview", "Configure & Run", "Graph", "Timeline", "Data", "Metrics", "Analytics",
 ])
 
 
@@ -81,9 +237,8 @@ with tab_overview:
         )
     col1, col2, col3 = st.columns(3)
     active = read_active()
-    history = read_history()
     col1.metric("Active World", active.get("active_world"))
-    col2.metric("Transitions", len(history))
+    col2.metric("Transitions", len(read_history_index()))
     col3.metric("Last TX", active.get("last_tx") or "—")
 
     st.subheader("Quick Actions")
@@ -91,7 +246,7 @@ with tab_overview:
     if c1.button("Initialize Example Graph", use_container_width=True):
         init_graph_script()
         st.success("Initialized worlds and graph in examples/.")
-    if c2.button("Reset History", use_container_width=True):
+    if c2.button("Reset History", use_container_width=True, disabled=not isinstance(state, JsonStorage)):
         reset_history()
         st.success("Cleared history and reset active world.")
 
@@ -111,7 +266,8 @@ with tab_run:
             - **Approval probability**: Chance each participating voter votes "for" (0.6 = 60%).
             - **Participation probability**: Chance each voter participates at all (0.95 = 95%).
             - **Voters**: Number of simulated voters with weights 1, 2, 3, ..., N.
-            - **Run N predefined proposals**: Execute the first N proposals from the example sequence (w1→w2, w2→w3, w3→w4, w4→w1, w2→w1, w3→w2).
+            - **Run N predefined proposals**: Execute N proposals from the example sequence (w1→w2, w2→w3, w3→w4, w4→w1, w2→w1, w3→w2), repeating it when N > 6.
+            - **Jobs**: Each run is a background job with its own copy of history. Watch progress, cancel it, then **Commit** its transactions to `examples/` or **Discard** them. Several jobs with different seeds can run side by side.
             """
         )
     st.subheader("Parameters")
@@ -122,58 +278,51 @@ with tab_run:
         approval_prob = st.slider("Approval probability", 0.0, 1.0, 0.6, 0.05)
         participation_prob = st.slider("Participation probability", 0.0, 1.0, 0.95, 0.05)
         voter_count = st.number_input("Voters", value=10, step=1, min_value=1, max_value=100)
-        n_steps = st.number_input("Run N predefined proposals", value=6, step=1, min_value=1, max_value=20)
+        n_steps = st.number_input("Run N predefined proposals", value=6, step=1, min_value=1, max_value=1_000_000)
         submitted = st.form_submit_button("Run Simulation")
 
     if submitted:
-        rng = random.Random(int(seed))
-        voters = build_voters(int(voter_count))
-        proposals = default_proposals()[: int(n_steps)]
-        last_result = None
-        for prop_id, src, dst in proposals:
-            tx, result = run_single_proposal(
-                examples_dir=examples_dir,
-                proposal_id=prop_id,
-                from_world=src,
-                to_world=dst,
+        job = jobs.submit(
+            cycled_proposals(int(n_steps)),
+            JobParams(
+                seed=int(seed),
                 quorum=float(quorum),
                 threshold=float(threshold),
-                rng=rng,
                 approval_probability=float(approval_prob),
                 participation_probability=float(participation_prob),
-                voters=voters,
-            )
-            last_result = (prop_id, src, dst, tx, result)
-        if last_result:
-            prop_id, src, dst, tx, result = last_result
-            if tx is None:
-                st.warning(f"Last proposal {prop_id} {src}->{dst} failed. Quorum={result.quorum_met}")
-            else:
-                st.success(f"Last TX {tx.tx_id}: {src}->{dst} passed.")
+                voter_count=int(voter_count),
+            ),
+        )
+        st.success(f"Started job {job.job_id} ({job.total} proposals) in the background.")
+
+    job_panel()
 
     st.divider()
     st.subheader("Run Custom Proposal")
-    store, worlds, model = load_worlds_and_valuation(examples_dir)
+    store, worlds, model = load_model()
     world_ids = sorted(worlds.keys())
     c1, c2, c3 = st.columns(3)
     from_w = c1.selectbox("From world", world_ids, index=0)
     to_w = c2.selectbox("To world", [w for w in world_ids if w != from_w], index=0)
     prop_id_custom = c3.text_input("Proposal ID", value="prop-custom")
     if st.button("Run Proposal"):
-        rng = random.Random(int(seed))
-        voters = build_voters(int(voter_count))
-        tx, result = run_single_proposal(
-            examples_dir=examples_dir,
-            proposal_id=prop_id_custom,
-            from_world=from_w,
-            to_world=to_w,
-            quorum=float(quorum),
-            threshold=float(threshold),
-            rng=rng,
-            approval_probability=float(approval_prob),
-            participation_probability=float(participation_prob),
-            voters=voters,
+        session = GovernanceSession(
+            examples_dir,
+            voters=build_voters(int(voter_count)),
+            rng=random.Random(int(seed)),
+            history_tail=0,
+            storage=state,
         )
+        with session:
+            tx, result = session.run_proposal(
+                prop_id_custom,
+                from_w,
+                to_w,
+                quorum=float(quorum),
+                threshold=float(threshold),
+                approval_probability=float(approval_prob),
+                participation_probability=float(participation_prob),
+            )
         if tx is None:
             st.warning(f"Proposal failed. Quorum={result.quorum_met}")
         else:
@@ -193,14 +342,38 @@ with tab_graph:
             - **Edges (arrows)**: Possible transitions between worlds.
             - **Yellow node**: The currently active world.
             - **Blue nodes**: Other worlds.
-            - **Layout**: Spring layout (may vary on refresh).
+            - **Grey nodes** (large graphs only): clusters of worlds collapsed into one node, labelled with their size; pick one to drill down.
+            - **Layout**: Spring layout for small graphs, spectral for large ones; positions are cached per graph structure, so they stay put across refreshes.
             """
         )
-    store, worlds, model = load_worlds_and_valuation(examples_dir)
+    store, worlds, model = load_model()
     props = sorted(list(model.valuation.keys()))
     labels = {w: model.summarize_world_label(w, props) for w in worlds}
     active = read_active().get("active_world", "w1")
-    st.image(graph_png_bytes(store.G, active, labels))
+    graph_paths = model_paths + active_paths
+    if store.G.number_of_nodes() <= LOD_MAX_NODES:
+        st.image(cache.get(
+            "graph_png", graph_paths,
+            lambda: graph_png_bytes(store.G, active, labels, layout_cache=layout_cache),
+        ))
+    else:
+        view = cache.get("lod_view", graph_paths, lambda: build_lod_view(store.G, active))
+        st.caption(
+            f"{store.G.number_of_nodes()} worlds collapsed into {len(view.clusters)} clusters; "
+            "the active world's neighbourhood is always shown in full."
+        )
+        by_size = sorted(view.clusters, key=lambda c: -len(view.clusters[c]))
+        choice = st.selectbox(
+            "Drill down into cluster",
+            ["(overview)"] + by_size,
+            format_func=lambda c: c if c == "(overview)" else f"{c} ({len(view.clusters[c])} worlds)",
+        )
+        if choice != "(overview)":
+            view = cache.get(("lod_view", choice), graph_paths, lambda: drill_down(store.G, view, choice, active))
+        st.image(cache.get(
+            ("lod_png", choice), graph_paths,
+            lambda: lod_graph_png_bytes(view, active, labels, layout_cache=layout_cache),
+        ))
 
 
 with tab_timeline:
@@ -214,18 +387,51 @@ with tab_timeline:
             """
             - **X-axis**: Transition number (chronological order).
             - **Y-axis**: World IDs (w1, w2, w3, w4).
-            - **Points**: Each successful transition, labeled with the destination world.
-            - **Table below**: Detailed transaction records with votes, quorum, timestamps.
+            - **Points**: Each successful transition, labeled with the destination world. Long histories are downsampled per pixel column (min/max kept) and drawn without per-point labels.
+            - **Table below**: Detailed transaction records with votes, quorum, timestamps; filter by world, proposal or time and page through the matches.
             """
         )
-    tl_bytes = timeline_png_bytes(os.path.join(examples_dir, "history.json"))
+    window_mode = st.radio("Window", ["All", "Last N transitions", "Time range"], horizontal=True)
+    last_n, since, until = None, None, None
+    if window_mode == "Last N transitions":
+        last_n = int(st.number_input("N", value=500, step=100, min_value=1))
+    elif window_mode == "Time range":
+        c1, c2 = st.columns(2)
+        since = c1.text_input("From (ISO 8601, e.g. 2025-01-01T00:00:00Z)", value="") or None
+        until = c2.text_input("Until (ISO 8601)", value="") or None
+    tl_bytes = cache.get(
+        ("timeline_png", last_n, since, until), history_paths,
+        lambda: timeline_png_bytes(state.iter_history(), last_n=last_n, since=since, until=until),
+    )
     if tl_bytes:
         st.image(tl_bytes)
     else:
         st.info("No timeline yet. Run a simulation to generate transitions.")
-    data = read_history()
-    if data:
-        st.dataframe(data, use_container_width=True, hide_index=True)
+    index = read_history_index()
+    if len(index):
+        st.subheader("Transactions")
+        f1, f2, f3, f4 = st.columns(4)
+        world_filter = f1.selectbox("World", ["(any)"] + index.worlds())
+        proposal_filter = f2.text_input("Proposal ID", value="").strip() or None
+        since_filter = f3.text_input("From", value="", help="ISO 8601, inclusive").strip() or None
+        until_filter = f4.text_input("Until", value="", help="ISO 8601, inclusive").strip() or None
+        matches = cache.get(
+            ("history_query", world_filter, proposal_filter, since_filter, until_filter), history_paths,
+            lambda: index.query(
+                world=None if world_filter == "(any)" else world_filter,
+                proposal=proposal_filter,
+                since=since_filter,
+                until=until_filter,
+            ),
+        )
+        p1, p2 = st.columns(2)
+        page_size = int(p1.selectbox("Rows per page", [25, 50, 100, 250], index=1))
+        n_pages = max((len(matches) + page_size - 1) // page_size, 1)
+        page = int(p2.number_input(f"Page (1–{n_pages})", value=1, min_value=1, max_value=n_pages, step=1))
+        rows = index.page(matches, page - 1, page_size)
+        first = (page - 1) * page_size
+        st.caption(f"Showing {first + 1 if rows else 0}–{first + len(rows)} of {len(matches)} matching transactions ({len(index)} total)")
+        st.dataframe(rows, use_container_width=True, hide_index=True)
 
 
 with tab_data:
@@ -250,19 +456,100 @@ with tab_data:
         st.write("active_world.json")
         st.json(read_active())
         st.write("valuation.json")
-        val_path = os.path.join(examples_dir, "valuation.json")
-        if os.path.exists(val_path):
-            st.json(json.load(open(val_path, 'r', encoding='utf-8')))
+        valuation_data = read_json_artifact(valuation_path)
+        if valuation_data is not None:
+            st.json(valuation_data)
         else:
             st.info("No valuation.json yet. Initialize the graph.")
     with colB:
         st.write("graph.json")
-        graph_path = os.path.join(examples_dir, "graph.json")
-        if os.path.exists(graph_path):
-            st.json(json.load(open(graph_path, 'r', encoding='utf-8')))
+        graph_data = read_json_artifact(graph_path)
+        if graph_data is not None:
+            st.json(graph_data)
         else:
             st.info("No graph.json yet. Initialize the graph.")
     st.write("history.json")
-    st.json(read_history())
+    index = read_history_index()
+    if len(index):
+        preview = index.records[-HISTORY_PREVIEW:]
+        st.caption(f"{len(index)} transactions; showing the last {len(preview)}. Use the Timeline tab to filter and page.")
+        st.json(preview)
+        if isinstance(state, JsonStorage):
+            with open(state.history_path, 'rb') as f:
+                st.download_button("Download history.json", f, file_name="history.json", mime="application/json")
+        else:
+            st.download_button("Download history.json", json.dumps(index.records, indent=2), file_name="history.json", mime="application/json")
+    else:
+        st.info("No history yet. Run a simulation to generate transitions.")
+
+
+with tab_metrics:
+    st.markdown(
+        """
+        Per-stage latency breakdown of the proposal pipeline: vote simulation, tallying, world reads, archiving and history writes.
+        """
+    )
+    source = st.radio("Source", ["This dashboard", "Last CLI run"], horizontal=True,
+                      help="CLI runs record metrics with `python scripts/run_vote_sim.py --metrics`.")
+    if source == "This dashboard":
+        summary = METRICS.summary()
+        if st.button("Reset metrics"):
+            METRICS.reset()
+            st.rerun()
+    else:
+        summary = cache.get("metrics", [metrics_path], lambda: load_summary(metrics_path))
+    if not summary or not summary["spans"]:
+        st.info("No stage timings recorded yet. Run proposals or a job, or run the CLI with --metrics.")
+    else:
+        rows = stage_rows(summary)
+        st.bar_chart({r["stage"]: r["total (s)"] for r in rows}, horizontal=True)
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        if summary["counters"]:
+            cols = st.columns(len(summary["counters"]))
+            for col, (name, value) in zip(cols, summary["counters"].items()):
+                col.metric(name, value)
+        if source == "This dashboard":
+            st.download_button("Download Prometheus metrics", METRICS.prometheus_text(), file_name="metrics.prom", mime="text/plain")
 
 
+with tab_analytics:
+    st.markdown(
+        """
+        Exact long-run behaviour of the governance random walk, from sparse linear solves over the frame's transition matrix: stationary distribution, expected proposals to reach a target world, and mean return times.
+        """
+    )
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        # Pass probability is sampled above ~45 voters; 100 keeps a rerun well under a second.
+        a_voters = int(st.number_input("Voters", value=10, step=1, min_value=1, max_value=100, key="an_voters"))
+        a_target = st.selectbox("Target world", sorted(load_model()[0].G.nodes), key="an_target")
+    with c2:
+        a_approval = st.slider("Approval probability", 0.0, 1.0, 0.6, 0.05, key="an_approval")
+        a_participation = st.slider("Participation probability", 0.0, 1.0, 0.9, 0.05, key="an_participation")
+    with c3:
+        a_quorum = st.slider("Quorum", 0.0, 1.0, 0.5, 0.05, key="an_quorum")
+        a_threshold = st.slider("Approval threshold", 0.0, 1.0, 0.5, 0.05, key="an_threshold")
+    a_params = WalkParams(quorum=a_quorum, threshold=a_threshold, approval_probability=a_approval,
+                          participation_probability=a_participation)
+    try:
+        chain = chain_summary(a_voters, a_params, a_target)
+    except ValueError as e:
+        st.error(str(e))
+    else:
+        m1, m2 = st.columns(2)
+        m1.metric("Proposal pass probability", f"{chain['pass_probability']:.4f}")
+        rt = chain["return_time"]
+        m2.metric(f"Mean return time to {a_target}", f"{rt:.2f}" if rt is not None else "∞")
+        walk = read_json_artifact(os.path.join(examples_dir, "walk_stats.json")) or {"worlds": {}}
+        rows = []
+        for w, row in chain["worlds"].items():
+            rows.append({
+                "world": w,
+                "stationary": row["stationary"],
+                f"hitting time to {a_target}": row["hitting_time"],
+                "return time": row["return_time"],
+                "simulated (walk_stats.json)": walk["worlds"].get(w, {}).get("stationary_estimate"),
+            })
+        st.bar_chart({r["world"]: r["stationary"] for r in rows})
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.caption("Empty hitting/return times are infinite. The simulated column is filled by `run_vote_sim.py --long-horizon`.")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+# Ensure project root is on path when running as a script
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sim.graph_store import GraphStore
+from sim.tokenize import DEFAULT_BUNDLE_BUDGET, pack_minting_bundles, write_minting_bundles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pack world CIP-25 metadata into size-budgeted minting bundles")
+    parser.add_argument("--policy-id", default="pwsgt-policy")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUNDLE_BUDGET, help="max encoded metadata bytes per bundle")
+    parser.add_argument("--out", default=None, help="output directory (default: examples/mint)")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(__file__))
+    examples_dir = os.path.join(root, "examples")
+    outdir = args.out or os.path.join(examples_dir, "mint")
+
+    worlds = GraphStore().load_worlds_from_dir(os.path.join(examples_dir, "worlds"))
+    ordered = (worlds[w] for w in sorted(worlds))
+    report = write_minting_bundles(pack_minting_bundles(ordered, args.policy_id, args.budget), outdir)
+    with open(os.path.join(outdir, "report.json"), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    bundles = len({r["bundle"] for r in report})
+    print(f"Packed {len(report)} worlds into {bundles} bundle(s) under {outdir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# Ensure project root is on path when running as a script
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sim.storage import JsonStorage, SqliteStorage, copy_storage, export_json
+
+
+def main() -> None:
+    root = os.path.dirname(os.path.dirname(__file__))
+    examples_dir = os.path.join(root, "examples")
+
+    parser = argparse.ArgumentParser(description="Move simulation state between the JSON layout and a SQLite database")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="load the JSON layout into a database")
+    imp.add_argument("db")
+    imp.add_argument("--from", dest="src", default=examples_dir, help="examples directory to read (default: examples/)")
+    exp = sub.add_parser("export", help="write a database out in the JSON layout")
+    exp.add_argument("db")
+    exp.add_argument("--to", dest="dst", default=examples_dir, help="examples directory to write (default: examples/)")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        if os.path.exists(args.db):
+            parser.error(f"{args.db} already exists; import into a new database")
+        with SqliteStorage(args.db) as db:
+            n = copy_storage(JsonStorage(args.src), db)
+        print(f"Imported {n} transactions from {args.src} into {args.db}")
+    else:
+        with SqliteStorage(args.db) as db:
+            n = export_json(db, args.dst)
+        print(f"Exported {n} transactions from {args.db} to {args.dst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# Ensure project root is on path when running as a script
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sim.holders import DEFAULT_CHUNK_ROWS, WeightSnapshot, ingest_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build and update token-holder weight snapshots")
+    fields = argparse.ArgumentParser(add_help=False)
+    fields.add_argument("--format", dest="fmt", choices=("csv", "jsonl"), default=None, help="input format (default: from the file extension)")
+    fields.add_argument("--address-field", default="address")
+    fields.add_argument("--weight-field", default="weight")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ing = sub.add_parser("ingest", parents=[fields], help="aggregate holder CSV/JSONL files into a snapshot")
+    ing.add_argument("sources", nargs="+")
+    ing.add_argument("--out", required=True, help="snapshot file to write")
+    ing.add_argument("--epoch", type=int, default=0)
+    ing.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rows aggregated in memory before spilling a sorted run")
+    diff = sub.add_parser("diff", parents=[fields], help="apply signed per-address weight changes to a snapshot")
+    diff.add_argument("snapshot")
+    diff.add_argument("diffs", nargs="+")
+    diff.add_argument("--epoch", type=int, default=None, help="epoch after the diff (default: current + 1)")
+    info = sub.add_parser("info", help="summarize a snapshot")
+    info.add_argument("snapshot")
+    info.add_argument("--top", type=int, default=10, help="largest holders to list")
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        stats = ingest_snapshot(
+            args.sources,
+            args.out,
+            epoch=args.epoch,
+            fmt=args.fmt,
+            address_field=args.address_field,
+            weight_field=args.weight_field,
+            chunk_rows=args.chunk_rows,
+        )
+        print(f"{stats['rows']} rows -> {stats['holders']} holders, total weight {stats['total_weight']} ({args.out})")
+    elif args.command == "diff":
+        stats = WeightSnapshot(args.snapshot).apply_diff(
+            args.diffs, epoch=args.epoch, fmt=args.fmt, address_field=args.address_field, weight_field=args.weight_field
+        )
+        how = "rewritten" if stats["rewritten"] else "in place"
+        print(f"Epoch {stats['epoch']}: {stats['updated']} updated, {stats['added']} added ({how}); total weight {stats['total_weight']}")
+    else:
+        snap = WeightSnapshot(args.snapshot)
+        print(f"{args.snapshot}: epoch {snap.epoch}, {len(snap)} holders, total weight {snap.total_weight}")
+        for i in snap.weights.argsort()[::-1][:args.top].tolist():
+            print(f"  {snap.address(i)}  {int(snap.weights[i])}")
+
+
+if __name__ == "__main__":
+    main()
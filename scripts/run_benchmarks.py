@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# Ensure project root is on path when running as a script
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sim.bench import (
+    BENCHMARKS,
+    DEFAULT_NOISE_FLOOR_S,
+    DEFAULT_TOLERANCE,
+    BenchConfig,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmarks,
+    write_results,
+)
+
+
+def main() -> None:
+    root = os.path.dirname(os.path.dirname(__file__))
+    default_baseline = os.path.join(root, "benchmarks", "baseline.json")
+
+    parser = argparse.ArgumentParser(description="Benchmark the simulation hot paths and compare against a baseline")
+    parser.add_argument("--worlds", type=int, default=BenchConfig.worlds)
+    parser.add_argument("--voters", type=int, default=BenchConfig.voters)
+    parser.add_argument("--history", type=int, default=BenchConfig.history)
+    parser.add_argument("--repeat", type=int, default=BenchConfig.repeat, help="timed runs per benchmark (after one warm-up)")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="run only these benchmarks (repeatable)")
+    parser.add_argument("--out", default=os.path.join(root, "benchmarks", "results.json"), help="results JSON path")
+    parser.add_argument("--baseline", default=default_baseline)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown before flagging, as a fraction")
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR_S, help="smallest absolute slowdown to flag, in seconds")
+    parser.add_argument("--update-baseline", action="store_true", help="write these results as the new baseline")
+    args = parser.parse_args()
+
+    config = BenchConfig(worlds=args.worlds, voters=args.voters, history=args.history, repeat=args.repeat)
+    results = run_benchmarks(
+        config,
+        names=args.only,
+        progress=lambda r: print(f"{r.key:45s} median {r.median_s * 1e3:10.3f} ms  {r.ops_per_s:14.1f} ops/s"),
+    )
+    write_results(args.out, config, results)
+    print(f"Results written to {args.out}")
+
+    if args.update_baseline:
+        write_results(args.baseline, config, results)
+        print(f"Baseline updated: {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    rows = compare_to_baseline(results, load_baseline(args.baseline), args.tolerance, args.noise_floor)
+    regressions = [r for r in rows if r["regressed"]]
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else "ok"
+        print(f"{row['key']:45s} x{row['ratio']:<7} {flag}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# Ensure project root is on path when running as a script
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sim.scenarios import run_scenarios, scenario_grid
+
+
+def _floats(text: str):
+    return [float(x) for x in text.split(",")]
+
+
+def _ints(text: str):
+    return [int(x) for x in text.split(",")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a grid of governance scenarios on a process pool")
+    parser.add_argument("--seeds", type=int, default=8, help="number of seeds (0..N-1) per parameter point")
+    parser.add_argument("--steps", type=int, default=1000, help="proposals per scenario")
+    parser.add_argument("--voters", type=_ints, default=[10], help="comma-separated voter counts")
+    parser.add_argument("--quorum", type=_floats, default=[0.5], help="comma-separated quorums")
+    parser.add_argument("--threshold", type=_floats, default=[0.5], help="comma-separated thresholds")
+    parser.add_argument("--approval", type=_floats, default=[0.6], help="comma-separated approval probabilities")
+    parser.add_argument("--participation", type=_floats, default=[0.9], help="comma-separated participation probabilities")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default=None, help="output directory (default: examples/scenarios)")
+    parser.add_argument("--keep-shards", action="store_true")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(__file__))
+    examples_dir = os.path.join(root, "examples")
+    outdir = args.out or os.path.join(examples_dir, "scenarios")
+
+    scenarios = scenario_grid(
+        range(args.seeds), args.steps, args.voters, args.quorum, args.threshold, args.approval, args.participation
+    )
+    results = run_scenarios(examples_dir, scenarios, outdir, workers=args.workers, keep_shards=args.keep_shards)
+    passed = sum(r["passed"] for r in results)
+    print(f"Ran {len(results)} scenario(s) on {args.workers} worker(s); {passed} transitions passed. Output in {outdir}")
+
+
+if __name__ == "__main__":
+    main()
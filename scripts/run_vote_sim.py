@@ -6,44 +6,96 @@ import json
 import os
 import sys
 import random
-from typing import Dict
+from typing import Optional
 
 # Ensure project root is on path when running as a script
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from sim.archiver import MockArchiver
-from sim.cardano_sim import CardanoSimulator
-from sim.graph_store import GraphStore
-from sim.model import KripkeModel, Transition
-from sim.voting import Voter, Proposal, simulate_votes_random, evaluate_proposal
-
-
-def load_worlds_and_valuation(examples_dir: str):
-    store = GraphStore()
-    worlds = store.load_worlds_from_dir(os.path.join(examples_dir, "worlds"))
-    with open(os.path.join(examples_dir, "valuation.json"), 'r', encoding='utf-8') as f:
-        valuation = {k: set(v) for k, v in json.load(f).items()}
-    model = KripkeModel(worlds, store.edges(), valuation)
-    return store, worlds, model
-
-
-def default_proposals():
-    # Six proposals including reversals
-    return [
-        ("prop-001", "w1", "w2"),
-        ("prop-002", "w2", "w3"),
-        ("prop-003", "w3", "w4"),
-        ("prop-004", "w4", "w1"),  # reset
-        ("prop-005", "w2", "w1"),  # reverse edge
-        ("prop-006", "w3", "w2"),  # reverse edge
-    ]
-
+from sim.admission import ADMISSION_MODES, ADMISSION_OFF
+from sim.metrics import METRICS, span
+from sim.session import GovernanceSession
+from sim.sim_helpers import build_voters, default_proposals, load_worlds_and_valuation
+
+
+def run_long_horizon(examples_dir: str, args: argparse.Namespace) -> None:
+    # numpy is only needed for this mode; keep the default path light
+    from sim.random_walk import GovernanceWalk, WalkParams
+
+    _, _, model = load_worlds_and_valuation(examples_dir)
+    params = WalkParams(
+        quorum=args.quorum,
+        threshold=args.threshold,
+        approval_probability=args.approval,
+        participation_probability=args.participation,
+    )
+    if args.holders:
+        from sim.holders import WeightSnapshot
+
+        voters = WeightSnapshot(args.holders)
+        print(f"Loaded {len(voters)} holders (epoch {voters.epoch}) from {args.holders}")
+    else:
+        voters = build_voters(args.voters)
+    walk = GovernanceWalk(model, voters, params, start_world=args.start, seed=args.seed)
+    if args.resume and os.path.exists(args.checkpoint):
+        walk.load_checkpoint(args.checkpoint)
+        print(f"Resumed from {args.checkpoint} at step {walk.steps}")
+    with span("walk.run"):
+        # STEPS is the walk's total length, so a resumed walk only runs the remainder.
+        walk.run(max(0, args.long_horizon - walk.steps), checkpoint_path=args.checkpoint, checkpoint_every=args.checkpoint_every)
+    stats = walk.stats()
+    with open(args.stats_out, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2)
+    for w, s in stats["worlds"].items():
+        print(f"{w}: pi~{s['stationary_estimate']:.4f} visits={s['visits']} mean_return={s['mean_return_time']}")
+    print(f"Long-horizon walk: {stats['steps']} steps. Stats in {args.stats_out}")
+
+
+def write_metrics(examples_dir: str, prom_path: Optional[str] = None) -> None:
+    json_path = os.path.join(examples_dir, "metrics.json")
+    prom_path = prom_path or os.path.join(examples_dir, "metrics.prom")
+    METRICS.write_json(json_path)
+    METRICS.write_prometheus(prom_path)
+    for name, s in METRICS.summary()["spans"].items():
+        print(f"{name:16s} {s['count']:8d} x {s['mean_s'] * 1e6:10.1f} us = {s['total_s']:.4f} s ({s['share']:.0%})")
+    print(f"Metrics written to {json_path} and {prom_path}")
+
+
+def run_proposals(examples_dir: str, args: argparse.Namespace, rng: random.Random) -> None:
+    storage = None
+    if args.db:
+        from sim.storage import SqliteStorage
+
+        storage = SqliteStorage(args.db)
+    else:
+        # Initial active world defaults to w1 if not present
+        active_path = os.path.join(examples_dir, "active_world.json")
+        if not os.path.exists(active_path):
+            with open(active_path, 'w', encoding='utf-8') as f:
+                json.dump({"active_world": "w1", "last_tx": None, "updated_at": None}, f, indent=2)
+
+    with GovernanceSession(examples_dir, voters=build_voters(10), rng=rng, flush_every=args.flush_every, storage=storage, admission=args.admission) as session:
+        for prop_id, src, dst in default_proposals():
+            tx, result = session.run_proposal(
+                prop_id,
+                src,
+                dst,
+                quorum=args.quorum,
+                threshold=args.threshold,
+                approval_probability=0.6,
+                participation_probability=0.95,
+            )
+            if tx is not None:
+                print(f"TX {tx.tx_id}: {src} -> {dst} (passed)")
+            elif result is None:
+                print(f"Proposal {prop_id} {src}->{dst} rejected before voting")
+            else:
+                print(f"Proposal {prop_id} {src}->{dst} failed (quorum={result.quorum_met}, support={result.votes_for}/{result.votes_for+result.votes_against})")
 
-def build_voters(n: int = 10) -> Dict[str, Voter]:
-    voters: Dict[str, Voter] = {}
-    for i in range(1, n + 1):
-        voters[f"v{i}"] = Voter(voter_id=f"v{i}", weight=i)  # weights 1..n
-    return voters
+    if storage is not None:
+        storage.close()
+        print(f"Simulation complete. State saved in {args.db}")
+    else:
+        print("Simulation complete. See examples/history.json and examples/active_world.json")
 
 
 def main() -> None:
@@ -51,53 +103,41 @@ def main() -> None:
     parser.add_argument("--seed", type=int, default=42)
     parser.add_argument("--quorum", type=float, default=0.5)
     parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--flush-every", type=int, default=1000, help="append buffered transactions to history every N passes (0: only at exit)")
+    parser.add_argument("--db", default=None, help="SQLite database to read and write instead of the JSON files under examples/")
+    parser.add_argument("--admission", choices=ADMISSION_MODES, default=ADMISSION_OFF, help="reject proposals off the accessibility relation (static) or not from the active world (strict) before voting")
+    parser.add_argument("--metrics", action="store_true", help="time pipeline stages; writes examples/metrics.json and a Prometheus text file")
+    parser.add_argument("--metrics-prom", default=None, help="Prometheus text file path (default: examples/metrics.prom)")
+    walk = parser.add_argument_group("long-horizon mode")
+    walk.add_argument("--long-horizon", type=int, default=0, metavar="STEPS", help="random-walk STEPS proposals along legal edges, keeping only statistics (in total, counting a resumed checkpoint)")
+    walk.add_argument("--voters", type=int, default=10)
+    walk.add_argument("--holders", default=None, metavar="SNAPSHOT", help="weight snapshot from scripts/holders.py to vote with instead of --voters")
+    walk.add_argument("--approval", type=float, default=0.6)
+    walk.add_argument("--participation", type=float, default=0.95)
+    walk.add_argument("--start", default="w1")
+    walk.add_argument("--checkpoint", default=None, help="checkpoint file (default: examples/walk_checkpoint.json)")
+    walk.add_argument("--checkpoint-every", type=int, default=1_000_000)
+    walk.add_argument("--resume", action="store_true", help="continue from --checkpoint if it exists")
+    walk.add_argument("--stats-out", default=None, help="statistics JSON (default: examples/walk_stats.json)")
     args = parser.parse_args()
 
     rng = random.Random(args.seed)
     root = os.path.dirname(os.path.dirname(__file__))
     examples_dir = os.path.join(root, "examples")
-    store, worlds, model = load_worlds_and_valuation(examples_dir)
-
-    # Initial active world defaults to w1 if not present
-    active_path = os.path.join(examples_dir, "active_world.json")
-    if not os.path.exists(active_path):
-        with open(active_path, 'w', encoding='utf-8') as f:
-            json.dump({"active_world": "w1", "last_tx": None, "updated_at": None}, f, indent=2)
-
-    voters = build_voters(10)
-    proposals = default_proposals()
-    archiver = MockArchiver()
-    chain = CardanoSimulator(examples_dir)
-
-    for prop_id, src, dst in proposals:
-        proposal = Proposal(proposal_id=prop_id, from_world=src, to_world=dst, quorum=args.quorum, threshold=args.threshold)
-        votes = simulate_votes_random(voters, rng, approval_probability=0.6, participation_probability=0.95)
-        result = evaluate_proposal(proposal, voters, votes)
-        if result.passed:
-            # Simulate uploading both worlds' JSON as Arweave payloads
-            src_data = json.load(open(os.path.join(examples_dir, "worlds", f"{src}.json"), 'r', encoding='utf-8'))
-            dst_data = json.load(open(os.path.join(examples_dir, "worlds", f"{dst}.json"), 'r', encoding='utf-8'))
-            ar_src = archiver.upload_json(src_data)
-            ar_dst = archiver.upload_json(dst_data)
-            tx = chain.submit_transition(
-                proposal_id=prop_id,
-                from_world=src,
-                to_world=dst,
-                arweave_from=ar_src,
-                arweave_to=ar_dst,
-                votes_for=result.votes_for,
-                votes_against=result.votes_against,
-                quorum=proposal.quorum,
-                signers=["gov_key1", "gov_key2"],
-            )
-            print(f"TX {tx.tx_id}: {src} -> {dst} (passed)")
-        else:
-            print(f"Proposal {prop_id} {src}->{dst} failed (quorum={result.quorum_met}, support={result.votes_for}/{result.votes_for+result.votes_against})")
 
-    print("Simulation complete. See examples/history.json and examples/active_world.json")
+    if args.metrics:
+        METRICS.enable()
+    try:
+        if args.long_horizon:
+            args.checkpoint = args.checkpoint or os.path.join(examples_dir, "walk_checkpoint.json")
+            args.stats_out = args.stats_out or os.path.join(examples_dir, "walk_stats.json")
+            run_long_horizon(examples_dir, args)
+        else:
+            run_proposals(examples_dir, args, rng)
+    finally:
+        if args.metrics:
+            write_metrics(examples_dir, args.metrics_prom)
 
 
 if __name__ == "__main__":
     main()
-
-
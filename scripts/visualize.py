@@ -1,21 +1,26 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import sys
 
-import networkx as nx
-
 # Ensure project root is on path when running as a script
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from sim.graph_store import GraphStore
 from sim.model import KripkeModel, Transition
-from sim.visualize import draw_graph_png, draw_timeline
+from sim.visualize import LayoutCache, draw_graph_png, draw_timeline
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--last-n", type=int, default=None, help="only plot the most recent N transitions")
+    parser.add_argument("--since", default=None, help="only plot transitions at or after this ISO timestamp")
+    parser.add_argument("--until", default=None, help="only plot transitions at or before this ISO timestamp")
+    args = parser.parse_args()
+
     root = os.path.dirname(os.path.dirname(__file__))
     examples_dir = os.path.join(root, "examples")
     worlds_dir = os.path.join(examples_dir, "worlds")
@@ -44,11 +49,18 @@ def main() -> None:
 
     # Draw graph
     out_graph = os.path.join(examples_dir, "graph.png")
-    draw_graph_png(store.G, active_world, labels, out_graph)
+    layout_cache = LayoutCache(os.path.join(examples_dir, ".layout_cache"))
+    draw_graph_png(store.G, active_world, labels, out_graph, layout_cache=layout_cache)
 
     # Draw timeline
     out_timeline = os.path.join(examples_dir, "timeline.png")
-    draw_timeline(os.path.join(examples_dir, "history.json"), out_timeline)
+    draw_timeline(
+        os.path.join(examples_dir, "history.json"),
+        out_timeline,
+        last_n=args.last_n,
+        since=args.since,
+        until=args.until,
+    )
 
     print("Wrote:", out_graph, out_timeline)
 
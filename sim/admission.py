@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .model import KripkeModel
+
+ADMITTED = "admitted"
+UNKNOWN_WORLD = "unknown_world"
+NO_EDGE = "no_edge"
+NECESSARY_UNMET = "necessary_unmet"
+NOT_ACTIVE = "not_active"
+
+# Session admission modes: no checks, frame checks only, frame checks plus the active world.
+ADMISSION_OFF, ADMISSION_STATIC, ADMISSION_STRICT = "off", "static", "strict"
+ADMISSION_MODES = (ADMISSION_OFF, ADMISSION_STATIC, ADMISSION_STRICT)
+
+
+class AdmissionGuard:
+    """Validates proposals against the frame before any voting happens.
+
+    A proposal ``from -> to`` is admitted when both worlds exist, ``to`` is an
+    R-successor of ``from``, every proposition in ``to``'s ``necessary`` list
+    holds in ``to``, and (if an active world is given) ``from`` is the active
+    world; checks run in that order and the first failure is the reason.
+    Worlds are numbered once; edges are kept as a set of ``src * n + dst``
+    integers and the valuation as one proposition bitset per world, so a
+    check is a few dict/set lookups.
+    """
+
+    def __init__(self, model: KripkeModel) -> None:
+        ids = sorted(model.worlds)
+        self.index: Dict[str, int] = {w: i for i, w in enumerate(ids)}
+        n = self._n = len(ids)
+        self.edge_keys = {self.index[u] * n + self.index[v] for u, succ in model.relations.items() for v in succ}
+        bit = {p: 1 << i for i, p in enumerate(sorted(model.valuation))}
+        truth = [0] * n
+        for p, ws in model.valuation.items():
+            for w in ws:
+                if w in self.index:
+                    truth[self.index[w]] |= bit[p]
+        self.valuation_bits = truth
+        required = [0] * n
+        unsatisfiable = [False] * n
+        for w, world in model.worlds.items():
+            for p in world.necessary:
+                if p in bit:
+                    required[self.index[w]] |= bit[p]
+                else:
+                    unsatisfiable[self.index[w]] = True
+        self.necessary_bits = required
+        # Targets whose necessary propositions all hold, as a flag per world.
+        self.target_ok = [
+            not unsatisfiable[i] and truth[i] & required[i] == required[i] for i in range(n)
+        ]
+
+    def check(self, from_world: str, to_world: str, active_world: Optional[str] = None) -> str:
+        """``ADMITTED`` or the first failed check's reason."""
+        src = self.index.get(from_world)
+        dst = self.index.get(to_world)
+        if src is None or dst is None:
+            return UNKNOWN_WORLD
+        if src * self._n + dst not in self.edge_keys:
+            return NO_EDGE
+        if not self.target_ok[dst]:
+            return NECESSARY_UNMET
+        if active_world is not None and from_world != active_world:
+            return NOT_ACTIVE
+        return ADMITTED
+
+    def check_batch(
+        self,
+        proposals: Sequence[Tuple[str, str, str]],
+        active_world: Optional[str] = None,
+    ) -> List[str]:
+        """Reasons for ``(proposal_id, from, to)`` triples, in order."""
+        index, n, edges, target_ok = self.index, self._n, self.edge_keys, self.target_ok
+        reasons = []
+        append = reasons.append
+        for _, from_world, to_world in proposals:
+            src = index.get(from_world)
+            dst = index.get(to_world)
+            if src is None or dst is None:
+                append(UNKNOWN_WORLD)
+            elif src * n + dst not in edges:
+                append(NO_EDGE)
+            elif not target_ok[dst]:
+                append(NECESSARY_UNMET)
+            elif active_world is not None and from_world != active_world:
+                append(NOT_ACTIVE)
+            else:
+                append(ADMITTED)
+        return reasons
+
+    def admit(
+        self,
+        proposals: Sequence[Tuple[str, str, str]],
+        active_world: Optional[str] = None,
+    ) -> Tuple[List[Tuple[str, str, str]], List[Tuple[Tuple[str, str, str], str]]]:
+        """Split proposals into (admitted, [(rejected proposal, reason)])."""
+        admitted, rejected = [], []
+        for proposal, reason in zip(proposals, self.check_batch(proposals, active_world)):
+            if reason == ADMITTED:
+                admitted.append(proposal)
+            else:
+                rejected.append((proposal, reason))
+        return admitted, rejected
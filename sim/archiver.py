@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from typing import Any, Dict
 
+from .model import World, canonical_json_bytes
+
+
+def placeholder_uri(payload: bytes) -> str:
+    digest = hashlib.sha256(payload).hexdigest()[:16]
+    return f"ar://placeholder-{digest}"
+
 
 class MockArchiver:
     """Deterministic mock Arweave uploader.
@@ -12,9 +18,14 @@ class MockArchiver:
     """
 
     def upload_json(self, data: Dict[str, Any]) -> str:
-        payload = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        digest = hashlib.sha256(payload).hexdigest()[:16]
-        return f"ar://placeholder-{digest}"
+        return self.upload_bytes(canonical_json_bytes(data))
+
+    def upload_bytes(self, payload: bytes) -> str:
+        return placeholder_uri(payload)
+
+    def upload_world(self, world: World) -> str:
+        """Archive a world using its cached canonical encoding."""
+        return self.upload_bytes(world.canonical_bytes)
 
 
 # Real client hook (example, commented):
@@ -30,5 +41,7 @@ class MockArchiver:
 #         tx.sign()
 #         tx.send()
 #         return f"ar://{tx.id}"
-
-
+#
+# For batched asyncio uploads see sim/async_archiver.py; to plug a real gateway
+# into AsyncArchiverClient, point host/port at it and map /tx and /bundle onto
+# signed data-item uploads (e.g. ANS-104 bundles).
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+# Asyncio archive uploader and a local stand-in gateway. Kept apart from
+# archiver.py so synchronous callers don't pay for importing asyncio.
+
+import asyncio
+import json
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+from .archiver import placeholder_uri
+from .model import World, canonical_json_bytes
+
+
+class ArchiveGatewayServer:
+    """Local in-process HTTP stand-in for an Arweave-style gateway.
+
+    Endpoints:
+    - ``POST /tx``: one canonical JSON payload, responds ``{"id": ...}``
+    - ``POST /bundle``: payloads each prefixed by a 4-byte big-endian length, responds ``{"ids": [...]}``
+
+    Ids are ``placeholder-<sha256[:16]>`` so URIs match ``MockArchiver``.
+    ``fail_first`` makes the first N requests answer 503, for exercising retries.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fail_first: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self.fail_first = fail_first
+        self.requests = 0
+        self.connections = 0
+        self.payloads = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self) -> "ArchiveGatewayServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "ArchiveGatewayServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = await _read_headers(reader)
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                self.requests += 1
+                status, response = self._route(method, path, body)
+                writer.write(_http_message(f"HTTP/1.1 {status}", response))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method: str, path: str, body: bytes) -> Tuple[str, bytes]:
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            return "503 Service Unavailable", b'{"error":"busy"}'
+        if method != "POST":
+            return "405 Method Not Allowed", b'{"error":"method"}'
+        if path == "/tx":
+            self.payloads += 1
+            return "200 OK", json.dumps({"id": _gateway_id(body)}).encode("utf-8")
+        if path == "/bundle":
+            try:
+                items = _split_bundle(body)
+            except ValueError:
+                return "400 Bad Request", b'{"error":"framing"}'
+            self.payloads += len(items)
+            return "200 OK", json.dumps({"ids": [_gateway_id(p) for p in items]}).encode("utf-8")
+        return "404 Not Found", b'{"error":"path"}'
+
+
+class GatewayError(RuntimeError):
+    """Raised when an upload still fails after all retries, or is refused with a client error."""
+
+
+class AsyncArchiverClient:
+    """Asyncio uploader with batching, bounded concurrency, retries and keep-alive.
+
+    Concurrent ``upload_json`` calls made within ``batch_window`` seconds are
+    bundled into a single ``/bundle`` request (up to ``max_batch`` payloads).
+    At most ``max_concurrency`` requests are in flight, each over a pooled
+    keep-alive connection. Failed requests are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        max_concurrency: int = 8,
+        max_batch: int = 32,
+        batch_window: float = 0.002,
+        retries: int = 3,
+        backoff: float = 0.05,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.retries = retries
+        self.backoff = backoff
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._pending: List[Tuple[bytes, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+
+    async def upload_json(self, data: Dict[str, Any]) -> str:
+        return await self.upload_bytes(canonical_json_bytes(data))
+
+    async def upload_world(self, world: World) -> str:
+        return await self.upload_bytes(world.canonical_bytes)
+
+    async def upload_bytes(self, payload: bytes) -> str:
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self._pending.append((payload, fut))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await fut
+
+    async def upload_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        return list(await asyncio.gather(*(self.upload_json(d) for d in items)))
+
+    async def close(self) -> None:
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def __aenter__(self) -> "AsyncArchiverClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            batch, self._pending = self._pending[: self.max_batch], self._pending[self.max_batch:]
+            task = asyncio.ensure_future(self._send_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send_batch(self, batch: List[Tuple[bytes, asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                ids = [(await self._request("/tx", batch[0][0]))["id"]]
+            else:
+                ids = (await self._request("/bundle", _frame_bundle([p for p, _ in batch])))["ids"]
+            if len(ids) != len(batch):
+                raise GatewayError(f"gateway returned {len(ids)} ids for {len(batch)} payloads")
+        except Exception as exc:  # propagate to every waiter in the batch
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), tx_id in zip(batch, ids):
+            if not fut.done():
+                fut.set_result(f"ar://{tx_id}")
+
+    async def _request(self, path: str, body: bytes) -> Dict[str, Any]:
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * (2 ** (attempt - 1)))
+            async with self._sem:
+                try:
+                    status, response = await self._roundtrip(path, body)
+                except (OSError, asyncio.IncompleteReadError) as exc:
+                    last_error = exc
+                    continue
+            if status == 200:
+                return json.loads(response)
+            if status < 500:
+                # Client errors are not retried; report the gateway's answer as-is.
+                raise GatewayError(f"gateway returned {status} for {path}: {response.decode('utf-8', 'replace')}")
+            last_error = GatewayError(f"gateway returned {status} for {path}")
+        raise GatewayError(f"upload to {path} failed after {self.retries + 1} attempts") from last_error
+
+    async def _roundtrip(self, path: str, body: bytes) -> Tuple[int, bytes]:
+        if self._idle:
+            reader, writer = self._idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            head = f"POST {path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: keep-alive"
+            writer.write(_http_message(head, body))
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("gateway closed connection")
+            headers = await _read_headers(reader)
+            response = await reader.readexactly(int(headers.get("content-length", "0")))
+        except BaseException:
+            writer.close()
+            raise
+        self._idle.append((reader, writer))
+        return int(status_line.split()[1]), response
+
+
+def _gateway_id(payload: bytes) -> str:
+    return placeholder_uri(payload)[len("ar://"):]
+
+
+def _frame_bundle(payloads: List[bytes]) -> bytes:
+    return b"".join(struct.pack(">I", len(p)) + p for p in payloads)
+
+
+def _split_bundle(body: bytes) -> List[bytes]:
+    items: List[bytes] = []
+    pos = 0
+    while pos < len(body):
+        if pos + 4 > len(body):
+            raise ValueError("truncated bundle length prefix")
+        (size,) = struct.unpack_from(">I", body, pos)
+        pos += 4
+        if pos + size > len(body):
+            raise ValueError("truncated bundle payload")
+        items.append(body[pos:pos + size])
+        pos += size
+    return items
+
+
+def _http_message(head: str, body: bytes) -> bytes:
+    return f"{head}\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from .voting import Voter, VoteResult
+
+# Ballot matrix encoding (int8): one row per proposal, one column per voter.
+ABSTAIN, FOR, AGAINST = 0, 1, -1
+# Ballot cells tallied per matrix product; bounds the temporary mask/float copies.
+CHUNK_CELLS = 1 << 22
+# Float64 tallies are exact while every sum stays below 2**53.
+_EXACT_FLOAT_LIMIT = 1 << 53
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass
+class BatchVoteResults:
+    """``VoteResult`` fields as arrays, one entry per proposal."""
+
+    votes_for: np.ndarray
+    votes_against: np.ndarray
+    total_possible_weight: int
+    quorum_met: np.ndarray
+    passed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.votes_for)
+
+    def __getitem__(self, i: int) -> VoteResult:
+        return VoteResult(
+            votes_for=int(self.votes_for[i]),
+            votes_against=int(self.votes_against[i]),
+            total_possible_weight=self.total_possible_weight,
+            quorum_met=bool(self.quorum_met[i]),
+            passed=bool(self.passed[i]),
+        )
+
+    def to_results(self) -> List[VoteResult]:
+        return [self[i] for i in range(len(self))]
+
+
+def voter_weights(voters: Mapping[str, Voter]) -> Tuple[List[str], np.ndarray]:
+    """Voter ids in column order and their int64 weights."""
+    ids = list(voters)
+    return ids, np.array([voters[v].weight for v in ids], dtype=np.int64)
+
+
+def ballot_matrix(votes: Sequence[Dict[str, bool]], voter_ids: Sequence[str]) -> np.ndarray:
+    """Encode per-proposal ``votes`` dicts (missing voters abstain) as an int8 ballot matrix."""
+    column = {v: j for j, v in enumerate(voter_ids)}
+    ballots = np.zeros((len(votes), len(voter_ids)), dtype=np.int8)
+    for i, cast in enumerate(votes):
+        for voter_id, approve in cast.items():
+            ballots[i, column[voter_id]] = FOR if approve else AGAINST
+    return ballots
+
+
+def decide(
+    votes_for: np.ndarray,
+    votes_against: np.ndarray,
+    total_weight: float,
+    quorum: ArrayLike,
+    threshold: ArrayLike,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """``(quorum_met, passed)`` arrays with ``evaluate_proposal``'s rules.
+
+    No quorum without any possible weight; zero participation has support 0.
+    """
+    participating = votes_for + votes_against
+    if total_weight > 0:
+        quorum_met = participating / total_weight >= quorum
+    else:
+        quorum_met = np.zeros(np.shape(participating), dtype=bool)
+    support = np.divide(votes_for, participating, out=np.zeros(np.shape(participating)), where=participating > 0)
+    return quorum_met, quorum_met & (support >= threshold)
+
+
+def evaluate_batch(
+    ballots: np.ndarray,
+    weights: np.ndarray,
+    quorum: ArrayLike = 0.5,
+    threshold: ArrayLike = 0.5,
+) -> BatchVoteResults:
+    """Evaluate every row of a ballot matrix against one electorate.
+
+    ``quorum`` and ``threshold`` are scalars or per-proposal arrays. For and
+    against weights of a chunk of rows come from a single weighted product of
+    the stacked ``FOR``/``AGAINST`` masks with ``weights``.
+    """
+    ballots = np.asarray(ballots)
+    weights = np.asarray(weights, dtype=np.int64)
+    if ballots.ndim != 2 or ballots.shape[1] != len(weights):
+        raise ValueError(f"ballots must be (proposals, {len(weights)}), got {ballots.shape}")
+    n = ballots.shape[0]
+    quorum = np.broadcast_to(np.asarray(quorum, dtype=np.float64), (n,))
+    threshold = np.broadcast_to(np.asarray(threshold, dtype=np.float64), (n,))
+    total = int(weights.sum())
+    exact_float = int(np.abs(weights).sum()) < _EXACT_FLOAT_LIMIT
+    w = weights.astype(np.float64) if exact_float else weights
+
+    tallies = np.empty((2, n), dtype=np.int64)
+    rows = max(1, CHUNK_CELLS // max(len(weights), 1))
+    for start in range(0, n, rows):
+        chunk = ballots[start:start + rows]
+        masks = np.stack((chunk == FOR, chunk == AGAINST))
+        product = masks.astype(w.dtype) @ w
+        tallies[:, start:start + rows] = np.rint(product) if exact_float else product
+    votes_for, votes_against = tallies
+    quorum_met, passed = decide(votes_for, votes_against, total, quorum, threshold)
+    return BatchVoteResults(votes_for, votes_against, total, quorum_met, passed)
@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .archiver import MockArchiver
+from .cardano_sim import CardanoSimulator, now_iso
+from .graph_store import GraphStore
+from .model import KripkeModel, Transition, World
+from .sim_helpers import build_voters
+from .voting import simulate_votes_random, tally_votes
+
+RESULTS_VERSION = 1
+# A benchmark regresses when its best run exceeds the baseline's best run by this
+# fraction; the minimum is far less sensitive to scheduler noise than the median.
+DEFAULT_TOLERANCE = 0.25
+# ...and by at least this many seconds, so microsecond-scale cases don't flap.
+DEFAULT_NOISE_FLOOR_S = 0.001
+# Modules a non-plotting simulation process imports at startup; they must stay
+# free of heavy dependencies (see tests/test_startup.py).
+STARTUP_MODULES = ("sim.sim_helpers", "sim.graph_store", "sim.visualize", "sim.tokenize", "sim.archiver")
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    worlds: int = 200
+    voters: int = 100
+    history: int = 1000
+    props: int = 4
+    repeat: int = 5
+    seed: int = 0
+
+
+@dataclass
+class BenchCase:
+    """One prepared benchmark: ``run`` is timed, ``reset`` (if any) runs untimed before each repetition."""
+
+    run: Callable[[], Any]
+    ops: int
+    reset: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class BenchResult:
+    name: str
+    params: Dict[str, int]
+    ops: int
+    runs_s: List[float] = field(default_factory=list)
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.runs_s)
+
+    @property
+    def min_s(self) -> float:
+        return min(self.runs_s)
+
+    @property
+    def ops_per_s(self) -> float:
+        return self.ops / self.median_s if self.median_s > 0 else float("inf")
+
+    @property
+    def key(self) -> str:
+        return result_key(self.name, self.params)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "ops": self.ops,
+            "runs_s": [round(r, 6) for r in self.runs_s],
+            "median_s": round(self.median_s, 6),
+            "min_s": round(self.min_s, 6),
+            "ops_per_s": round(self.ops_per_s, 2),
+        }
+
+
+def result_key(name: str, params: Dict[str, int]) -> str:
+    return name + "[" + ",".join(f"{k}={params[k]}" for k in sorted(params)) + "]"
+
+
+# name -> (config fields the benchmark scales with, factory(config, workdir) -> BenchCase)
+Factory = Callable[[BenchConfig, str], BenchCase]
+BENCHMARKS: Dict[str, Tuple[Tuple[str, ...], Factory]] = {}
+
+
+def benchmark(name: str, params: Sequence[str]) -> Callable[[Factory], Factory]:
+    def register(factory: Factory) -> Factory:
+        BENCHMARKS[name] = (tuple(params), factory)
+        return factory
+    return register
+
+
+# --- synthetic inputs ---
+
+def synthetic_worlds(n: int) -> List[World]:
+    """Bidirectional ring w1 <-> w2 <-> ... <-> wn <-> w1, like the example frame at scale.
+
+    A ring keeps ``simple_cycles`` polynomial (n two-cycles plus both directions of the ring).
+    """
+    ids = [f"w{i + 1}" for i in range(n)]
+    worlds = []
+    for i, wid in enumerate(ids):
+        edges = sorted({ids[(i + 1) % n], ids[(i - 1) % n]} - {wid})
+        worlds.append(World(wid, f"World {i + 1}", f"synthetic world {i + 1}", necessary=["p0"], edges=edges))
+    return worlds
+
+
+def synthetic_valuation(worlds: Sequence[World], props: int, seed: int) -> Dict[str, set]:
+    rng = random.Random(seed)
+    return {f"p{j}": {w.world_id for w in worlds if rng.random() < 0.5} for j in range(props)}
+
+
+def synthetic_history(n: int, worlds: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        src = rng.randrange(worlds)
+        records.append({
+            "tx_id": f"tx-{i:08d}",
+            "proposal_id": f"prop-{i:06d}",
+            "from_world": f"w{src + 1}",
+            "to_world": f"w{(src + 1) % worlds + 1}",
+            "arweave_from": "ar://placeholder-0000000000000000",
+            "arweave_to": "ar://placeholder-0000000000000000",
+            "votes_for": rng.randrange(100),
+            "votes_against": rng.randrange(100),
+            "quorum": 0.5,
+            "timestamp": f"2025-01-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            "signers": ["gov_key1", "gov_key2"],
+            "notes": "benchmark",
+        })
+    return records
+
+
+def _write_history(path: str, records: List[Dict[str, Any]]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2)
+
+
+def _edges(worlds: Iterable[World]) -> List[Transition]:
+    return [Transition(w.world_id, dst) for w in worlds for dst in w.edges]
+
+
+def _synthetic_store(cfg: BenchConfig, workdir: str) -> GraphStore:
+    worlds_dir = os.path.join(workdir, "worlds")
+    GraphStore().write_world_jsons(synthetic_worlds(cfg.worlds), worlds_dir)
+    store = GraphStore()
+    store.load_worlds_from_dir(worlds_dir)
+    return store
+
+
+# --- benchmarks ---
+
+@benchmark("model.build", params=("worlds",))
+def _bench_model_build(cfg: BenchConfig, workdir: str) -> BenchCase:
+    worlds = synthetic_worlds(cfg.worlds)
+    by_id = {w.world_id: w for w in worlds}
+    edges = _edges(worlds)
+    valuation = synthetic_valuation(worlds, cfg.props, cfg.seed)
+    return BenchCase(lambda: KripkeModel(by_id, edges, valuation), ops=1)
+
+
+@benchmark("model.modal", params=("worlds",))
+def _bench_model_modal(cfg: BenchConfig, workdir: str) -> BenchCase:
+    worlds = synthetic_worlds(cfg.worlds)
+    model = KripkeModel({w.world_id: w for w in worlds}, _edges(worlds), synthetic_valuation(worlds, cfg.props, cfg.seed))
+    props = sorted(model.valuation)
+
+    def run() -> None:
+        for w in model.worlds:
+            for p in props:
+                model.is_necessary(p, w)
+                model.is_possible(p, w)
+
+    return BenchCase(run, ops=2 * len(model.worlds) * len(props))
+
+
+@benchmark("graph.load_worlds", params=("worlds",))
+def _bench_graph_load(cfg: BenchConfig, workdir: str) -> BenchCase:
+    worlds_dir = os.path.join(workdir, "worlds")
+    GraphStore().write_world_jsons(synthetic_worlds(cfg.worlds), worlds_dir)
+    return BenchCase(lambda: GraphStore().load_worlds_from_dir(worlds_dir), ops=cfg.worlds)
+
+
+@benchmark("graph.simple_cycles", params=("worlds",))
+def _bench_graph_cycles(cfg: BenchConfig, workdir: str) -> BenchCase:
+    store = _synthetic_store(cfg, workdir)
+    store.G  # build the DiGraph outside the timed region
+    return BenchCase(store.simple_cycles, ops=1)
+
+
+@benchmark("voting.simulate_tally", params=("voters",))
+def _bench_voting(cfg: BenchConfig, workdir: str) -> BenchCase:
+    voters = build_voters(cfg.voters)
+    rng = random.Random(cfg.seed)
+    rounds = 200
+
+    def run() -> None:
+        for _ in range(rounds):
+            tally_votes(simulate_votes_random(voters, rng), voters)
+
+    return BenchCase(run, ops=rounds)
+
+
+@benchmark("voting.evaluate_batch", params=("voters",))
+def _bench_evaluate_batch(cfg: BenchConfig, workdir: str) -> BenchCase:
+    import numpy as np
+
+    from .batch_voting import ABSTAIN, AGAINST, FOR, evaluate_batch, voter_weights
+
+    _, weights = voter_weights(build_voters(cfg.voters))
+    rng = np.random.default_rng(cfg.seed)
+    proposals = 2000
+    ballots = rng.choice(np.array([ABSTAIN, FOR, AGAINST], dtype=np.int8), size=(proposals, cfg.voters))
+    quorum, threshold = rng.random(proposals), rng.random(proposals)
+    return BenchCase(lambda: evaluate_batch(ballots, weights, quorum, threshold), ops=proposals)
+
+
+@benchmark("cardano.submit_transition", params=("history",))
+def _bench_submit(cfg: BenchConfig, workdir: str) -> BenchCase:
+    records = synthetic_history(cfg.history, max(cfg.worlds, 2), cfg.seed)
+    sim = CardanoSimulator(workdir)
+    submits = 50
+
+    def run() -> None:
+        for i in range(submits):
+            sim.submit_transition(f"bench-{i}", "w1", "w2", "ar://a", "ar://b", 5, 1, 0.5, ["gov_key1"])
+
+    return BenchCase(run, ops=submits, reset=lambda: _write_history(sim.history_path, records))
+
+
+@benchmark("archiver.upload_json", params=("worlds",))
+def _bench_upload(cfg: BenchConfig, workdir: str) -> BenchCase:
+    payloads = [asdict(w) for w in synthetic_worlds(cfg.worlds)]
+    archiver = MockArchiver()
+
+    def run() -> None:
+        for data in payloads:
+            archiver.upload_json(data)
+
+    return BenchCase(run, ops=len(payloads))
+
+
+@benchmark("versioned.commit", params=("worlds",))
+def _bench_versioned_commit(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .versioned import FrameHistory
+
+    worlds = synthetic_worlds(cfg.worlds)
+    model = KripkeModel({w.world_id: w for w in worlds}, _edges(worlds), synthetic_valuation(worlds, cfg.props, cfg.seed))
+    ids = sorted(model.worlds)
+    commits = 500
+
+    def run() -> None:
+        history = FrameHistory.from_model(model)
+        for i in range(commits):
+            src, dst = ids[i % len(ids)], ids[(i * 7) % len(ids)]
+            history.commit(active_world=dst, add_edges=[(src, dst)], set_true=[("p0", dst)])
+
+    return BenchCase(run, ops=commits)
+
+
+@benchmark("bisimulation.minimize", params=("worlds",))
+def _bench_bisimulation(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .bisimulation import minimize
+
+    worlds = synthetic_worlds(cfg.worlds)
+    model = KripkeModel({w.world_id: w for w in worlds}, _edges(worlds), synthetic_valuation(worlds, cfg.props, cfg.seed))
+    return BenchCase(lambda: minimize(model), ops=len(worlds))
+
+
+@benchmark("admission.check_batch", params=("worlds",))
+def _bench_admission(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .admission import AdmissionGuard
+
+    worlds = synthetic_worlds(cfg.worlds)
+    model = KripkeModel({w.world_id: w for w in worlds}, _edges(worlds), synthetic_valuation(worlds, cfg.props, cfg.seed))
+    guard = AdmissionGuard(model)
+    ids = sorted(model.worlds)
+    rng = random.Random(cfg.seed)
+    # Roughly half legal ring steps, half random (mostly non-edge) pairs.
+    proposals = [
+        (f"p{i}", ids[k], ids[(k + 1) % len(ids)] if i % 2 else rng.choice(ids))
+        for i, k in enumerate(rng.randrange(len(ids)) for _ in range(10_000))
+    ]
+    return BenchCase(lambda: guard.check_batch(proposals), ops=len(proposals))
+
+
+@benchmark("holders.ingest", params=("voters",))
+def _bench_holders_ingest(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .holders import ingest_snapshot
+
+    rng = random.Random(cfg.seed)
+    rows = cfg.voters * 100
+    # Every address appears about twice; small chunks force spilled runs and a merge.
+    source = os.path.join(workdir, "holders.csv")
+    with open(source, 'w', encoding='utf-8') as f:
+        f.write("address,weight\n")
+        f.writelines(f"addr{rng.randrange(rows // 2)},{rng.randrange(1, 10**9)}\n" for _ in range(rows))
+    out = os.path.join(workdir, "holders.bin")
+    return BenchCase(lambda: ingest_snapshot(source, out, chunk_rows=rows // 4), ops=rows)
+
+
+@benchmark("scheduler.run", params=("worlds", "voters"))
+def _bench_scheduler(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .scheduler import ProposalScheduler, random_schedule
+    from .session import GovernanceSession
+
+    _synthetic_store(cfg, workdir)
+    # Never flushed: the benchmark measures scheduling, voting and archiving, not history writes.
+    session = GovernanceSession(workdir, voters=build_voters(cfg.voters), flush_every=0, history_tail=0)
+    proposals = random_schedule(session.model, 1000, random.Random(cfg.seed), arrival_rate=10, mean_window=50)
+
+    def run() -> None:
+        scheduler = ProposalScheduler(session, random.Random(cfg.seed))
+        scheduler.extend(proposals)
+        scheduler.run_sync()
+
+    return BenchCase(run, ops=len(proposals))
+
+
+@benchmark("markov.summary", params=("worlds", "voters"))
+def _bench_markov(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .markov import GovernanceChain
+
+    graph = _synthetic_store(cfg, workdir).G
+    voters = build_voters(cfg.voters)
+    return BenchCase(lambda: GovernanceChain.from_graph(graph, voters).summary("w1"), ops=graph.number_of_nodes())
+
+
+@benchmark("startup.import_sim", params=())
+def _bench_startup(cfg: BenchConfig, workdir: str) -> BenchCase:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # A fresh interpreter each run: includes interpreter startup, which is what users wait for.
+    cmd = [sys.executable, "-c", "import " + ", ".join(STARTUP_MODULES)]
+    return BenchCase(lambda: subprocess.run(cmd, cwd=root, check=True), ops=1)
+
+
+@benchmark("render.graph", params=("worlds",))
+def _bench_render_graph(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .visualize import graph_png_bytes
+
+    store = _synthetic_store(cfg, workdir)
+    labels = {w: w for w in store.G.nodes}
+    return BenchCase(lambda: graph_png_bytes(store.G, "w1", labels), ops=1)
+
+
+@benchmark("render.timeline", params=("history",))
+def _bench_render_timeline(cfg: BenchConfig, workdir: str) -> BenchCase:
+    from .visualize import timeline_png_bytes
+
+    path = os.path.join(workdir, "timeline_history.json")
+    _write_history(path, synthetic_history(cfg.history, max(cfg.worlds, 2), cfg.seed))
+    return BenchCase(lambda: timeline_png_bytes(path), ops=1)
+
+
+# --- harness ---
+
+def run_benchmarks(
+    config: BenchConfig,
+    names: Optional[Iterable[str]] = None,
+    progress: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    """Run the selected benchmarks (all by default); each gets a fresh temp directory and one warm-up run."""
+    selected = list(names) if names is not None else list(BENCHMARKS)
+    unknown = [n for n in selected if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {unknown}")
+    results = []
+    for name in selected:
+        params, factory = BENCHMARKS[name]
+        with tempfile.TemporaryDirectory(prefix="pwsgt-bench-") as workdir:
+            case = factory(config, workdir)
+            result = BenchResult(name, {p: getattr(config, p) for p in params}, case.ops)
+            for i in range(config.repeat + 1):
+                if case.reset is not None:
+                    case.reset()
+                start = time.perf_counter()
+                case.run()
+                elapsed = time.perf_counter() - start
+                if i > 0:
+                    result.runs_s.append(elapsed)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+def results_document(config: BenchConfig, results: List[BenchResult]) -> Dict[str, Any]:
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": now_iso(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": asdict(config),
+        "results": [r.to_dict() for r in results],
+    }
+
+
+def write_results(path: str, config: BenchConfig, results: List[BenchResult]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results_document(config, results), f, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    """Baseline results keyed by ``name[param=value,...]``."""
+    with open(path, 'r', encoding='utf-8') as f:
+        doc = json.load(f)
+    return {result_key(r["name"], r["params"]): r for r in doc.get("results", [])}
+
+
+def compare_to_baseline(
+    results: List[BenchResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    noise_floor_s: float = DEFAULT_NOISE_FLOOR_S,
+) -> List[Dict[str, Any]]:
+    """One row per result with a matching baseline entry.
+
+    ``regressed`` when ``min_s`` is over ``1 + tolerance`` times the baseline's
+    and also more than ``noise_floor_s`` slower in absolute terms.
+    """
+    rows = []
+    for r in results:
+        base = baseline.get(r.key)
+        if base is None or base["min_s"] <= 0:
+            continue
+        # Compare at the stored precision so a result never regresses against itself.
+        min_s = round(r.min_s, 6)
+        ratio = min_s / base["min_s"]
+        rows.append({
+            "key": r.key,
+            "min_s": min_s,
+            "baseline_min_s": base["min_s"],
+            "ratio": round(ratio, 3),
+            "regressed": ratio > 1 + tolerance and min_s - base["min_s"] > noise_floor_s,
+        })
+    return rows
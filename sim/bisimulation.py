@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Set, Tuple, Union
+
+from .model import KripkeModel, Transition
+
+# Formulas: a proposition name, or a tuple
+#   ("not", f) | ("and", f, g) | ("or", f, g) | ("box", f) | ("dia", f)
+Formula = Union[str, Tuple[Any, ...]]
+
+
+def evaluate_formula(model: KripkeModel, formula: Formula) -> Set[str]:
+    """Worlds of ``model`` where ``formula`` holds (□ vacuously true and ◇ false without successors)."""
+    if isinstance(formula, str):
+        return set(model.valuation.get(formula, set())) & set(model.worlds)
+    op = formula[0]
+    if op == "not":
+        return set(model.worlds) - evaluate_formula(model, formula[1])
+    if op == "and":
+        return evaluate_formula(model, formula[1]) & evaluate_formula(model, formula[2])
+    if op == "or":
+        return evaluate_formula(model, formula[1]) | evaluate_formula(model, formula[2])
+    if op == "box":
+        sat = evaluate_formula(model, formula[1])
+        return {w for w, succ in model.relations.items() if succ <= sat}
+    if op == "dia":
+        sat = evaluate_formula(model, formula[1])
+        return {w for w, succ in model.relations.items() if not succ.isdisjoint(sat)}
+    raise ValueError(f"Unknown modal operator {op!r}")
+
+
+def bisimulation_partition(model: KripkeModel) -> List[List[str]]:
+    """Coarsest partition of the worlds into bisimilar classes (Paige–Tarjan).
+
+    Worlds are equivalent when they satisfy the same propositions and their
+    successors fall into the same classes. Runs in O(m log n): every world is
+    re-examined only when it lies in the smaller half of a split compound block.
+    Classes and their members are returned sorted.
+    """
+    ids = sorted(model.worlds)
+    index = {w: i for i, w in enumerate(ids)}
+    n = len(ids)
+    preds: List[List[int]] = [[] for _ in range(n)]
+    outdeg = [0] * n
+    for w, succ in model.relations.items():
+        x = index[w]
+        outdeg[x] = len(succ)
+        for v in succ:
+            preds[index[v]].append(x)
+    labels: Dict[str, Set[str]] = {w: set() for w in ids}
+    for prop, ws in model.valuation.items():
+        for w in ws:
+            if w in labels:
+                labels[w].add(prop)
+
+    # Initial partition: same propositions, and either some or no successors
+    # (i.e. already stable with respect to the universe).
+    groups: Dict[Tuple[frozenset, bool], List[int]] = {}
+    for x, w in enumerate(ids):
+        groups.setdefault((frozenset(labels[w]), outdeg[x] > 0), []).append(x)
+    blocks: List[Set[int]] = [set(g) for g in groups.values()]
+    block_of = [0] * n
+    for b, members in enumerate(blocks):
+        for x in members:
+            block_of[x] = b
+    # Compound blocks group Q-blocks; the partition is stable once each is a single block.
+    compound: List[Set[int]] = [set(range(len(blocks)))]
+    compound_of = [0] * len(blocks)
+    pending: Set[int] = {0} if len(blocks) > 1 else set()
+    # count[x][c] = number of successors of x inside compound block c
+    count: List[Dict[int, int]] = [{0: outdeg[x]} if outdeg[x] else {} for x in range(n)]
+
+    while pending:
+        c = pending.pop()
+        members = compound[c]
+        # Splitter: the smaller of two blocks of the compound block becomes its own compound block.
+        it = iter(members)
+        b1, b2 = next(it), next(it)
+        b = b1 if len(blocks[b1]) <= len(blocks[b2]) else b2
+        members.discard(b)
+        new_c = len(compound)
+        compound.append({b})
+        compound_of[b] = new_c
+        if len(members) > 1:
+            pending.add(c)
+
+        into_b: Dict[int, int] = {}
+        for y in blocks[b]:
+            for x in preds[y]:
+                into_b[x] = into_b.get(x, 0) + 1
+        # Three-way split of every touched block: no edge into B (stays put),
+        # edges only into B, edges into both B and the rest of the old compound block.
+        moved: Dict[Tuple[int, bool], int] = {}
+        for x, k in into_b.items():
+            d = block_of[x]
+            key = (d, count[x][c] == k)
+            target = moved.get(key)
+            if target is None:
+                target = moved[key] = len(blocks)
+                blocks.append(set())
+                compound_of.append(compound_of[d])
+            blocks[d].discard(x)
+            blocks[target].add(x)
+            block_of[x] = target
+            # count(x, S) becomes count(x, S \ B); count(x, B) is new
+            rest = count[x][c] - k
+            if rest:
+                count[x][c] = rest
+            else:
+                del count[x][c]
+            count[x][new_c] = k
+        for (d, _), nb in moved.items():
+            parent = compound_of[nb]
+            compound[parent].add(nb)
+            if not blocks[d]:
+                compound[parent].discard(d)
+            if len(compound[parent]) > 1:
+                pending.add(parent)
+
+    classes = [sorted(ids[x] for x in members) for members in blocks if members]
+    return sorted(classes)
+
+
+class BisimulationQuotient:
+    """Minimized model: one world per bisimulation class, named after its smallest member.
+
+    Modal queries and formulas are answered on ``model`` (the quotient) and
+    mapped back to the original worlds.
+    """
+
+    def __init__(self, original: KripkeModel, classes: List[List[str]]) -> None:
+        self.original = original
+        self.members: Dict[str, List[str]] = {cls[0]: cls for cls in classes}
+        self.representative: Dict[str, str] = {w: cls[0] for cls in classes for w in cls}
+        edges = {
+            (self.representative[u], self.representative[v])
+            for u, succ in original.relations.items()
+            for v in succ
+        }
+        valuation = {
+            p: {self.representative[w] for w in ws if w in self.representative}
+            for p, ws in original.valuation.items()
+        }
+        self.model = KripkeModel(
+            {rep: original.worlds[rep] for rep in self.members},
+            [Transition(u, v) for u, v in sorted(edges)],
+            valuation,
+        )
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Original worlds per quotient world (1.0 means nothing was merged)."""
+        return len(self.original.worlds) / len(self.model.worlds) if self.model.worlds else 1.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worlds": len(self.original.worlds),
+            "quotient_worlds": len(self.model.worlds),
+            "edges": sum(len(s) for s in self.original.relations.values()),
+            "quotient_edges": sum(len(s) for s in self.model.relations.values()),
+            "reduction_ratio": self.reduction_ratio,
+        }
+
+    def expand(self, reps: Set[str]) -> Set[str]:
+        """Original worlds belonging to the given quotient worlds."""
+        return {w for rep in reps for w in self.members[rep]}
+
+    def evaluate(self, formula: Formula) -> Set[str]:
+        """Original worlds where ``formula`` holds, computed on the quotient."""
+        return self.expand(evaluate_formula(self.model, formula))
+
+    def is_true(self, prop: str, world_id: str) -> bool:
+        return self.model.is_true(prop, self.representative[world_id])
+
+    def is_necessary(self, prop: str, world_id: str) -> bool:
+        return self.model.is_necessary(prop, self.representative[world_id])
+
+    def is_possible(self, prop: str, world_id: str) -> bool:
+        return self.model.is_possible(prop, self.representative[world_id])
+
+
+def minimize(model: KripkeModel) -> BisimulationQuotient:
+    return BisimulationQuotient(model, bisimulation_partition(model))
@@ -2,16 +2,74 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import uuid
+from collections import deque
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .storage import Storage
+
+_SEPARATORS = re.compile(r"[\s,]*")
+# Registry contents before any transition has been recorded.
+DEFAULT_ACTIVE = {"active_world": "w1", "last_tx": None, "updated_at": None}
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def _last_non_space(f: BinaryIO, end: int) -> Tuple[int, bytes]:
+    """Offset and value of the last non-whitespace byte before ``end`` (``(-1, b"")`` if none)."""
+    while end > 0:
+        start = max(end - 256, 0)
+        f.seek(start)
+        block = f.read(end - start)
+        stripped = block.rstrip()
+        if stripped:
+            return start + len(stripped) - 1, stripped[-1:]
+        end = start
+    return -1, b""
+
+
+def iter_history(history_path: str, chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """Yield history records one at a time without loading the whole JSON array."""
+    if not os.path.exists(history_path):
+        return
+    decoder = json.JSONDecoder()
+    with open(history_path, 'r', encoding='utf-8') as f:
+        buf = ""
+        started = False
+        while True:
+            chunk = f.read(chunk_size)
+            buf += chunk
+            pos = 0
+            if not started:
+                pos = _SEPARATORS.match(buf, pos).end()
+                if pos == len(buf):
+                    if not chunk:
+                        return
+                    continue
+                if buf[pos] != "[":
+                    raise ValueError(f"{history_path} is not a JSON array")
+                started = True
+                pos += 1
+            while True:
+                pos = _SEPARATORS.match(buf, pos).end()
+                if pos < len(buf) and buf[pos] == "]":
+                    return
+                try:
+                    record, pos = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    break  # record continues in the next chunk
+                yield record
+            buf = buf[pos:]
+            if not chunk:
+                raise ValueError(f"{history_path} ends before the closing ']'")
+
+
 @dataclass
 class TransitionTx:
     tx_id: str
@@ -29,10 +87,15 @@ class TransitionTx:
 
 
 class CardanoSimulator:
-    """Simulated Cardano transaction builder and active world registry manager."""
+    """Simulated Cardano transaction builder and active world registry manager.
+
+    History and the registry live in ``history.json``/``active_world.json``
+    under ``examples_dir`` unless a ``storage`` backend is given.
+    """
 
-    def __init__(self, examples_dir: str) -> None:
+    def __init__(self, examples_dir: str, storage: Optional[Storage] = None) -> None:
         self.examples_dir = examples_dir
+        self.storage = storage
         os.makedirs(self.examples_dir, exist_ok=True)
         self.history_path = os.path.join(self.examples_dir, "history.json")
         self.active_path = os.path.join(self.examples_dir, "active_world.json")
@@ -56,7 +119,66 @@ class CardanoSimulator:
         with open(self.active_path, 'w', encoding='utf-8') as f:
             json.dump(active, f, indent=2)
 
-    def submit_transition(
+    def _append_history(self, records: List[Dict[str, Any]]) -> None:
+        """Append to the on-disk JSON array in place, without re-reading it.
+
+        Produces the same bytes as rewriting the whole list with ``indent=2``.
+        """
+        body = ",\n".join(
+            "\n".join("  " + line for line in json.dumps(r, indent=2).split("\n")) for r in records
+        )
+        if not os.path.exists(self.history_path):
+            self._write_history(records)
+            return
+        with open(self.history_path, 'r+b') as f:
+            close_at, char = _last_non_space(f, f.seek(0, os.SEEK_END))
+            if char != b"]":
+                raise ValueError(f"{self.history_path} does not end with a JSON array")
+            last_at, char = _last_non_space(f, close_at)
+            if char == b"[":
+                f.seek(0)
+                f.truncate()
+                f.write(("[\n" + body + "\n]").encode("utf-8"))
+            else:
+                f.seek(last_at + 1)
+                f.truncate()
+                f.write((",\n" + body + "\n]").encode("utf-8"))
+
+    def append_transactions(self, records: List[Dict[str, Any]]) -> None:
+        """Append already-built transaction records and point the registry at the last one."""
+        if not records:
+            return
+        if self.storage is not None:
+            self.storage.append_transactions(records)
+            return
+        self._append_history(records)
+        self._write_active(records[-1]["to_world"], records[-1]["tx_id"])
+
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        if self.storage is not None:
+            return self.storage.iter_history()
+        return iter_history(self.history_path)
+
+    def tail_history(self, n: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """(total transaction count, last ``n`` records)."""
+        if self.storage is not None:
+            return self.storage.tail_history(n)
+        total = 0
+        tail: deque = deque(maxlen=n)
+        for record in iter_history(self.history_path):
+            tail.append(record)
+            total += 1
+        return total, list(tail)
+
+    def read_active(self) -> Dict[str, Any]:
+        if self.storage is not None:
+            return self.storage.read_active()
+        if not os.path.exists(self.active_path):
+            return dict(DEFAULT_ACTIVE)
+        with open(self.active_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def build_transition(
         self,
         proposal_id: str,
         from_world: str,
@@ -69,7 +191,8 @@ class CardanoSimulator:
         signers: List[str],
         notes: str = "simulation run",
     ) -> TransitionTx:
-        tx = TransitionTx(
+        """Build a transaction record without touching disk."""
+        return TransitionTx(
             tx_id=str(uuid.uuid4()),
             proposal_id=proposal_id,
             from_world=from_world,
@@ -83,10 +206,33 @@ class CardanoSimulator:
             signers=signers,
             notes=notes,
         )
-        history = self._read_history()
-        history.append(asdict(tx))
-        self._write_history(history)
-        self._write_active(to_world, tx.tx_id)
+
+    def submit_transition(
+        self,
+        proposal_id: str,
+        from_world: str,
+        to_world: str,
+        arweave_from: str,
+        arweave_to: str,
+        votes_for: int,
+        votes_against: int,
+        quorum: float,
+        signers: List[str],
+        notes: str = "simulation run",
+    ) -> TransitionTx:
+        tx = self.build_transition(
+            proposal_id=proposal_id,
+            from_world=from_world,
+            to_world=to_world,
+            arweave_from=arweave_from,
+            arweave_to=arweave_to,
+            votes_for=votes_for,
+            votes_against=votes_against,
+            quorum=quorum,
+            signers=signers,
+            notes=notes,
+        )
+        self.append_transactions([asdict(tx)])
         return tx
 
 
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Tuple
+
+# (path, mtime_ns, size); -1 marks a missing file or a directory's size
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def path_signature(paths: Iterable[str]) -> Signature:
+    """Stat-based fingerprint of files; a directory contributes each file directly inside it."""
+    sig = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            sig.append((path, -1, -1))
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            sig.append((path, st.st_mtime_ns, -1))
+            for entry in sorted(os.scandir(path), key=lambda e: e.name):
+                if entry.is_file():
+                    est = entry.stat()
+                    sig.append((entry.path, est.st_mtime_ns, est.st_size))
+        else:
+            sig.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+class MtimeCache:
+    """Memoizes values derived from files, invalidated when any source file changes.
+
+    ``get(key, paths, loader)`` returns the cached value for ``key`` if the
+    path/mtime/size signature of ``paths`` is unchanged, otherwise calls
+    ``loader()`` and stores the result. Values are shared, so callers must
+    treat them as read-only. At most ``max_entries`` keys are kept (LRU).
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Signature, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, paths: Iterable[str], loader: Callable[[], Any]) -> Any:
+        sig = path_signature(paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == sig:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        # Signature is taken before loading: a write racing the load just
+        # causes one extra reload on the next call.
+        value = loader()
+        with self._lock:
+            self._entries[key] = (sig, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -2,64 +2,96 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict
-from typing import Dict, List, Tuple, Iterable
-
-import networkx as nx
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Iterable
 
 from .model import World, Transition
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from .storage import Storage
+
 
 class GraphStore:
     """NetworkX DiGraph wrapper for worlds and transitions.
 
     Worlds are loaded from JSON files in a directory, following the schema described in README.
+    The DiGraph (and networkx itself) is only built on first access to ``G``;
+    ``edges()`` is served from the world definitions until then.
     """
 
     def __init__(self) -> None:
-        self.G = nx.DiGraph()
+        self._worlds: Dict[str, World] = {}
+        self._G: Optional[nx.DiGraph] = None
+        # (destination, world_id) -> content digest last loaded from / written to that destination
+        self.digests: Dict[Tuple[str, str], str] = {}
 
     def load_worlds_from_dir(self, worlds_dir: str) -> Dict[str, World]:
         worlds: Dict[str, World] = {}
+        destination = os.path.abspath(worlds_dir)
         if not os.path.isdir(worlds_dir):
             os.makedirs(worlds_dir, exist_ok=True)
         for fname in os.listdir(worlds_dir):
-            if not fname.endswith('.json'):
+            # CIP-25 metadata files (<id>.metadata.json) share the directory
+            if not fname.endswith('.json') or fname.endswith('.metadata.json'):
                 continue
             path = os.path.join(worlds_dir, fname)
             with open(path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            world = World(
-                world_id=data['world_id'],
-                name=data.get('name', data['world_id']),
-                description=data.get('description', ''),
-                necessary=data.get('necessary', []),
-                possible=data.get('possible', []),
-                edges=data.get('edges', []),
-                arweave_uri=data.get('arweave_uri', 'ar://placeholder'),
-                created_by=data.get('created_by', 'sim://anon'),
-                created_at=data.get('created_at', ''),
-            )
+            world = World.from_dict(data)
             worlds[world.world_id] = world
+            self.digests[(destination, world.world_id)] = world.digest
+        self._build_graph(worlds)
+        return worlds
+
+    def load_from_storage(self, storage: Storage) -> Dict[str, World]:
+        worlds = storage.load_worlds()
+        for world in worlds.values():
+            self.digests[(storage.location, world.world_id)] = world.digest
         self._build_graph(worlds)
         return worlds
 
     def _build_graph(self, worlds: Dict[str, World]) -> None:
-        self.G.clear()
-        for w in worlds.values():
-            self.G.add_node(w.world_id, world=w)
-        for w in worlds.values():
+        self._worlds = dict(worlds)
+        if self._G is not None:
+            self._G.clear()
+            self._populate(self._G)
+
+    def _populate(self, G: nx.DiGraph) -> None:
+        for w in self._worlds.values():
+            G.add_node(w.world_id, world=w)
+        for w in self._worlds.values():
             for dst in w.edges:
-                if dst in worlds:
-                    self.G.add_edge(w.world_id, dst)
+                if dst in self._worlds:
+                    G.add_edge(w.world_id, dst)
+
+    @property
+    def G(self) -> nx.DiGraph:
+        if self._G is None:
+            import networkx as nx
+
+            self._G = nx.DiGraph()
+            self._populate(self._G)
+        return self._G
 
     def edges(self) -> List[Transition]:
-        return [Transition(u, v) for u, v in self.G.edges()]
+        if self._G is not None:
+            return [Transition(u, v) for u, v in self._G.edges()]
+        seen: Dict[Tuple[str, str], None] = {}
+        for w in self._worlds.values():
+            for dst in w.edges:
+                if dst in self._worlds:
+                    seen[(w.world_id, dst)] = None
+        return [Transition(u, v) for u, v in seen]
 
     def simple_cycles(self) -> List[List[str]]:
+        import networkx as nx
+
         return list(nx.simple_cycles(self.G))
 
     def descendants(self, world_id: str) -> List[str]:
+        import networkx as nx
+
         return list(nx.descendants(self.G, world_id))
 
     def save_graph_summary(self, outfile: str) -> None:
@@ -72,11 +104,34 @@ class GraphStore:
         with open(outfile, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2)
 
-    def write_world_jsons(self, worlds: Iterable[World], worlds_dir: str) -> None:
+    def changed_worlds(self, worlds: Iterable[World], destination: str) -> List[World]:
+        """Worlds whose content differs from the version this store last loaded from / wrote to ``destination``."""
+        return [w for w in worlds if self.digests.get((destination, w.world_id)) != w.digest]
+
+    def write_world_jsons(self, worlds: Iterable[World], worlds_dir: str) -> List[str]:
+        """Write each world's canonical encoding, skipping files that are unchanged and still present.
+
+        Returns the ids of the worlds actually written.
+        """
         os.makedirs(worlds_dir, exist_ok=True)
+        destination = os.path.abspath(worlds_dir)
+        written: List[str] = []
         for w in worlds:
             path = os.path.join(worlds_dir, f"{w.world_id}.json")
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(w), f, indent=2)
+            if self.digests.get((destination, w.world_id)) == w.digest and os.path.exists(path):
+                continue
+            with open(path, 'wb') as f:
+                f.write(w.canonical_bytes)
+            self.digests[(destination, w.world_id)] = w.digest
+            written.append(w.world_id)
+        return written
+
+    def save_to_storage(self, worlds: Iterable[World], storage: Storage) -> List[str]:
+        """Like ``write_world_jsons`` for a storage backend: only worlds changed since the last load from / save to it are saved."""
+        changed = self.changed_worlds(worlds, storage.location)
+        storage.save_worlds(changed)
+        for w in changed:
+            self.digests[(storage.location, w.world_id)] = w.digest
+        return [w.world_id for w in changed]
 
 
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional
+
+from .cardano_sim import iter_history
+
+
+class HistoryIndex:
+    """Filterable, pageable view over the transition history.
+
+    Built in one streaming pass. Keeps posting lists per world (as source or
+    destination) and per proposal, plus the timestamp column, so filters are
+    answered without rescanning records. Timestamps are appended in order, so a
+    time range is a contiguous slice found by bisection.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()) -> None:
+        self.records: List[Dict[str, Any]] = []
+        self.timestamps: List[str] = []
+        self.by_world: Dict[str, List[int]] = {}
+        self.by_proposal: Dict[str, List[int]] = {}
+        self._sorted = True
+        self.extend(records)
+
+    @classmethod
+    def from_file(cls, history_path: str) -> "HistoryIndex":
+        return cls(iter_history(history_path))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        for rec in records:
+            i = len(self.records)
+            self.records.append(rec)
+            ts = rec.get("timestamp", "")
+            if self.timestamps and ts < self.timestamps[-1]:
+                self._sorted = False
+            self.timestamps.append(ts)
+            for w in {rec.get("from_world"), rec.get("to_world")}:
+                if w is not None:
+                    self.by_world.setdefault(w, []).append(i)
+            self.by_proposal.setdefault(rec.get("proposal_id", ""), []).append(i)
+
+    def worlds(self) -> List[str]:
+        return sorted(self.by_world)
+
+    def query(
+        self,
+        world: Optional[str] = None,
+        proposal: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[int]:
+        """Positions (chronological) of records matching every given filter.
+
+        ``world`` matches either endpoint; ``since``/``until`` are inclusive ISO-8601 bounds.
+        """
+        lo, hi = 0, len(self.records)
+        if self._sorted:
+            if since:
+                lo = bisect_left(self.timestamps, since)
+            if until:
+                hi = bisect_right(self.timestamps, until)
+
+        def in_time(i: int) -> bool:
+            if self._sorted:
+                return lo <= i < hi
+            ts = self.timestamps[i]
+            return not ((since and ts < since) or (until and ts > until))
+
+        postings = []
+        if world is not None:
+            postings.append(self.by_world.get(world, []))
+        if proposal is not None:
+            postings.append(self.by_proposal.get(proposal, []))
+        if not postings:
+            return [i for i in range(lo, hi) if in_time(i)]
+        postings.sort(key=len)
+        others = [set(p) for p in postings[1:]]
+        return [i for i in postings[0] if in_time(i) and all(i in o for o in others)]
+
+    def page(self, positions: List[int], page: int, page_size: int) -> List[Dict[str, Any]]:
+        """Records for the 0-based ``page`` of ``positions``."""
+        start = page * page_size
+        return [self.records[i] for i in positions[start:start + page_size]]
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .voting import Proposal, VoteResult, result_from_tally
+
+MAGIC = b"PWSW"
+FORMAT_VERSION = 1
+# magic, format version, holder count, epoch, total weight, address blob length
+_HEADER = struct.Struct("<4sIqqqq")
+HEADER_SIZE = 64
+# Holder rows aggregated in memory before a sorted run is spilled to disk.
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+Sources = Union[str, Sequence[str]]
+
+
+def _paths(sources: Sources) -> List[str]:
+    return [sources] if isinstance(sources, str) else list(sources)
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt is None:
+        ext = os.path.splitext(path)[1].lower()
+        fmt = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}.get(ext)
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Cannot read {path} as holders; use a .csv or .jsonl file (or pass fmt)")
+    return fmt
+
+
+def _parse_weight(value: Any) -> int:
+    if isinstance(value, (bool, float)):
+        raise ValueError(f"weight must be an integer, got {value!r}")
+    return int(value)
+
+
+def _csv_rows(f: Any, path: str, address_field: str, weight_field: str) -> Iterator[Tuple[int, str, Any]]:
+    reader = csv.reader(f)
+    header = next(reader, [])
+    if address_field not in header or weight_field not in header:
+        raise ValueError(f"{path}: header must name {address_field!r} and {weight_field!r} columns")
+    a, w = header.index(address_field), header.index(weight_field)
+    for n, row in enumerate(reader, start=1):
+        if len(row) <= max(a, w):
+            raise ValueError(f"{path}: bad holder row {n}: too few columns")
+        yield n, row[a], row[w]
+
+
+def _jsonl_rows(f: Any, path: str, address_field: str, weight_field: str) -> Iterator[Tuple[int, str, Any]]:
+    for n, line in enumerate(f, start=1):
+        if line.strip():
+            row = json.loads(line)
+            if address_field not in row or weight_field not in row:
+                raise ValueError(f"{path}: bad holder row {n}: missing {address_field!r} or {weight_field!r}")
+            yield n, str(row[address_field]), row[weight_field]
+
+
+def iter_holder_rows(
+    path: str,
+    fmt: Optional[str] = None,
+    address_field: str = "address",
+    weight_field: str = "weight",
+) -> Iterator[Tuple[str, int]]:
+    """Stream ``(address, weight)`` rows from a CSV (with a header) or JSONL holder file."""
+    rows = _csv_rows if _detect_format(path, fmt) == "csv" else _jsonl_rows
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for n, address, value in rows(f, path, address_field, weight_field):
+            address = address.strip()
+            if not address or "\n" in address:
+                raise ValueError(f"{path}: bad holder row {n}: empty or multi-line address")
+            try:
+                weight = _parse_weight(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"{path}: bad holder row {n}: {e}") from None
+            yield address, weight
+
+
+def _sum_sorted(items: Iterable[Tuple[str, int]]) -> Iterator[Tuple[str, int]]:
+    """Collapse runs of equal addresses in address-sorted items into one summed row."""
+    current, total = None, 0
+    for address, weight in items:
+        if address == current:
+            total += weight
+            continue
+        if current is not None:
+            yield current, total
+        current, total = address, weight
+    if current is not None:
+        yield current, total
+
+
+def _spill(chunk: Dict[str, int], directory: str, n: int) -> str:
+    path = os.path.join(directory, f"run-{n:05d}.tsv")
+    # Only "\n" ends a record: addresses may contain "\r" and other line breaks.
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.writelines(f"{weight}\t{address}\n" for address, weight in sorted(chunk.items()))
+    return path
+
+
+def _read_run(path: str) -> Iterator[Tuple[str, int]]:
+    with open(path, 'r', encoding='utf-8', newline='\n') as f:
+        for line in f:
+            weight, address = line.rstrip("\n").split("\t", 1)
+            yield address, int(weight)
+
+
+def _write_snapshot(path: str, items: Iterable[Tuple[str, int]], epoch: int) -> Dict[str, int]:
+    """Write address-sorted ``(address, weight)`` rows (zero weights dropped) atomically."""
+    weights = array("q")
+    offsets = array("q", [0])
+    total = 0
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp = path + ".tmp"
+    with tempfile.TemporaryFile(dir=directory) as blob:
+        size = 0
+        for address, weight in items:
+            if not weight:
+                continue
+            data = address.encode('utf-8')
+            blob.write(data)
+            size += len(data)
+            weights.append(weight)
+            offsets.append(size)
+            total += weight
+        if sys.byteorder != "little":
+            weights.byteswap()
+            offsets.byteswap()
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(weights), epoch, total, size).ljust(HEADER_SIZE, b"\0"))
+            f.write(weights.tobytes())
+            f.write(offsets.tobytes())
+            blob.seek(0)
+            shutil.copyfileobj(blob, f)
+    os.replace(tmp, path)
+    return {"holders": len(weights), "total_weight": total, "epoch": epoch}
+
+
+def ingest_snapshot(
+    sources: Sources,
+    out_path: str,
+    epoch: int = 0,
+    fmt: Optional[str] = None,
+    address_field: str = "address",
+    weight_field: str = "weight",
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Dict[str, int]:
+    """Aggregate holder files into a binary weight file at ``out_path``.
+
+    Rows are summed per address in chunks of ``chunk_rows``; each full chunk
+    is spilled as a sorted run and the runs are k-way merged, so memory stays
+    bounded by the chunk size however many rows the sources hold.
+    """
+    rows = 0
+    runs: List[str] = []
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(out_path))) as tmp:
+        chunk: Dict[str, int] = {}
+        in_chunk = 0
+        for path in _paths(sources):
+            for address, weight in iter_holder_rows(path, fmt, address_field, weight_field):
+                if weight < 0:
+                    raise ValueError(f"{path}: negative weight for {address}")
+                chunk[address] = chunk.get(address, 0) + weight
+                rows += 1
+                in_chunk += 1
+                if in_chunk >= chunk_rows:
+                    runs.append(_spill(chunk, tmp, len(runs)))
+                    chunk, in_chunk = {}, 0
+        if runs:
+            if chunk:
+                runs.append(_spill(chunk, tmp, len(runs)))
+            merged = _sum_sorted(heapq.merge(*(_read_run(p) for p in runs)))
+        else:
+            merged = iter(sorted(chunk.items()))
+        stats = _write_snapshot(out_path, merged, epoch)
+    stats.update(rows=rows, runs=len(runs))
+    return stats
+
+
+class WeightSnapshot:
+    """Holder weights memory-mapped from a file written by ``ingest_snapshot``.
+
+    Layout after a 64-byte header: the int64 weight column, int64 offsets
+    into the address blob, then the UTF-8 addresses in sorted order. Voting
+    works on ``weights`` and numpy masks over it, never on per-holder objects;
+    address lookups binary-search the blob. Other processes that opened the
+    file should ``refresh()`` after a diff to pick up the new header.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.refresh()
+
+    def refresh(self) -> None:
+        with open(self.path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{self.path} is not a weight snapshot")
+        magic, version, count, epoch, total, size = _HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a weight snapshot")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} has unsupported format version {version}")
+        self.count, self.epoch, self.total_weight = count, epoch, total
+        self.weights = self._map("<i8", HEADER_SIZE, count)
+        self._offsets = self._map("<i8", HEADER_SIZE + 8 * count, count + 1)
+        self._blob = self._map("u1", HEADER_SIZE + 16 * count + 8, size)
+
+    def _map(self, dtype: str, offset: int, count: int) -> np.ndarray:
+        if not count:
+            return np.zeros(0, dtype=dtype)
+        # a plain ndarray view skips np.memmap's per-slice bookkeeping
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(count,)).view(np.ndarray)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _key(self, i: int) -> bytes:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]].tobytes()
+
+    def address(self, i: int) -> str:
+        return self._key(i).decode('utf-8')
+
+    def addresses(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self.address(i)
+
+    def index_of(self, address: str) -> Optional[int]:
+        key = address.encode('utf-8')
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.count and self._key(lo) == key else None
+
+    def weight_of(self, address: str) -> int:
+        i = self.index_of(address)
+        return 0 if i is None else int(self.weights[i])
+
+    def simulate(
+        self,
+        rng: np.random.Generator,
+        approval_probability: float = 0.6,
+        participation_probability: float = 0.9,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Random ballots as masks ``(participates, approves)``, like ``simulate_votes_random``."""
+        participates = rng.random(self.count) <= participation_probability
+        approves = participates & (rng.random(self.count) <= approval_probability)
+        return participates, approves
+
+    def evaluate(self, proposal: Proposal, participates: np.ndarray, approves: np.ndarray) -> VoteResult:
+        """Exact integer tally of the ballot masks against the proposal's quorum and threshold."""
+        votes_for = int(self.weights[participates & approves].sum())
+        votes_against = int(self.weights[participates].sum()) - votes_for
+        return result_from_tally(proposal, votes_for, votes_against, self.total_weight)
+
+    def apply_diff(
+        self,
+        sources: Sources,
+        epoch: Optional[int] = None,
+        fmt: Optional[str] = None,
+        address_field: str = "address",
+        weight_field: str = "weight",
+    ) -> Dict[str, Any]:
+        """Apply signed per-address weight changes from diff files and bump the epoch.
+
+        Changes to existing holders are written into the mapped weight column
+        in place (a holder that drops to zero keeps its slot); only new
+        addresses force a rewrite, which merges them in and drops zero weights.
+        """
+        deltas: Dict[str, int] = {}
+        for path in _paths(sources):
+            for address, delta in iter_holder_rows(path, fmt, address_field, weight_field):
+                deltas[address] = deltas.get(address, 0) + delta
+        index: List[int] = []
+        changes: List[int] = []
+        added: Dict[str, int] = {}
+        for address, delta in deltas.items():
+            if not delta:
+                continue
+            i = self.index_of(address)
+            if i is not None:
+                index.append(i)
+                changes.append(delta)
+            elif delta < 0:
+                raise ValueError(f"Negative weight change for unknown holder {address}")
+            else:
+                added[address] = delta
+        idx = np.array(index, dtype=np.int64)
+        updated = self.weights[idx] + np.array(changes, dtype=np.int64)
+        if (updated < 0).any():
+            raise ValueError(f"Weight of {self.address(int(idx[np.argmax(updated < 0)]))} would go negative")
+        epoch = self.epoch + 1 if epoch is None else epoch
+        total = self.total_weight + sum(changes) + sum(added.values())
+
+        if added:
+            column = np.array(self.weights)
+            column[idx] = updated
+            current = ((self.address(i), int(column[i])) for i in range(self.count))
+            _write_snapshot(self.path, heapq.merge(current, sorted(added.items())), epoch)
+            self.refresh()
+        else:
+            if len(idx):
+                column = np.memmap(self.path, dtype="<i8", mode="r+", offset=HEADER_SIZE, shape=(self.count,))
+                column[idx] = updated
+                column.flush()
+                del column
+            size = int(self._offsets[-1])
+            with open(self.path, 'r+b') as f:
+                f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, self.count, epoch, total, size))
+            self.epoch, self.total_weight = epoch, total
+        return {
+            "updated": len(index),
+            "added": len(added),
+            "rewritten": bool(added),
+            "holders": self.count,
+            "epoch": self.epoch,
+            "total_weight": self.total_weight,
+        }
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cardano_sim import CardanoSimulator, iter_history
+from .session import GovernanceSession
+from .sim_helpers import build_voters
+from .storage import JsonStorage, Storage
+
+QUEUED, RUNNING, DONE, CANCELLED, FAILED = "queued", "running", "done", "cancelled", "failed"
+FINISHED = (DONE, CANCELLED, FAILED)
+
+
+@dataclass
+class JobParams:
+    seed: int = 42
+    quorum: float = 0.5
+    threshold: float = 0.5
+    approval_probability: float = 0.6
+    participation_probability: float = 0.95
+    voter_count: int = 10
+
+
+@dataclass
+class SimulationJob:
+    """A batch of proposals run in its own workspace until committed.
+
+    ``results`` grows as proposals complete, so callers can show partial output.
+    """
+
+    job_id: str
+    params: JobParams
+    proposals: List[Tuple[str, str, str]]
+    workspace: str
+    status: str = QUEUED
+    done: int = 0
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    committed: bool = False
+    discarded: bool = False
+    # The live active world and last transaction the workspace was seeded from.
+    start_world: Optional[str] = None
+    start_tx: Optional[str] = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def total(self) -> int:
+        return len(self.proposals)
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+
+class JobRunner:
+    """Runs simulation batches on a thread pool, off the caller's thread.
+
+    Each job simulates against a private workspace: the live worlds directory
+    is shared read-only, while history and active-world files start from an
+    empty history and the live active world. Nothing touches ``examples_dir``
+    until ``commit``, which appends the job's transactions to the live history
+    if they still start from the live active world. With a ``storage``
+    backend, workspaces are seeded from it and commits go to it instead.
+    """
+
+    def __init__(self, examples_dir: str, max_workers: int = 2, storage: Optional[Storage] = None) -> None:
+        self.examples_dir = examples_dir
+        self.storage = storage
+        self.jobs: Dict[str, SimulationJob] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sim-job")
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+
+    def submit(self, proposals: Sequence[Tuple[str, str, str]], params: JobParams) -> SimulationJob:
+        workspace, active = self._make_workspace()
+        job = SimulationJob(
+            job_id=uuid.uuid4().hex[:8],
+            params=params,
+            proposals=list(proposals),
+            workspace=workspace,
+            start_world=active["active_world"],
+            start_tx=active.get("last_tx"),
+        )
+        with self._lock:
+            self.jobs[job.job_id] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def cancel(self, job_id: str) -> None:
+        self.jobs[job_id].cancel()
+
+    def commit(self, job_id: str) -> int:
+        """Append a finished job's transactions to the live history; returns how many.
+
+        Refused if the live active world or last transaction has moved since
+        the job started, as its transactions would no longer continue the history.
+        """
+        job = self.jobs[job_id]
+        if job.status not in FINISHED:
+            raise RuntimeError(f"Job {job_id} is still {job.status}")
+        if job.committed:
+            raise RuntimeError(f"Job {job_id} was already committed")
+        records = list(iter_history(os.path.join(job.workspace, "history.json")))
+        with self._commit_lock:
+            chain = CardanoSimulator(self.examples_dir, self.storage)
+            live = chain.read_active()
+            if records and (live["active_world"], live.get("last_tx")) != (job.start_world, job.start_tx):
+                raise RuntimeError(
+                    f"Job {job_id} started from {job.start_world} but the active world is now {live['active_world']}; "
+                    "discard it and run it again"
+                )
+            chain.append_transactions(records)
+        job.committed = True
+        self.discard(job_id, keep_record=True)
+        return len(records)
+
+    def discard(self, job_id: str, keep_record: bool = False) -> None:
+        job = self.jobs[job_id]
+        job.cancel()
+        job.discarded = True
+        # A running job removes its own workspace once it stops (see _run).
+        if job.status in FINISHED:
+            shutil.rmtree(job.workspace, ignore_errors=True)
+        if not keep_record:
+            with self._lock:
+                self.jobs.pop(job_id, None)
+
+    def shutdown(self) -> None:
+        for job in list(self.jobs.values()):
+            job.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _make_workspace(self) -> Tuple[str, Dict[str, Any]]:
+        """A fresh workspace and the active-world record it was seeded with."""
+        workspace = tempfile.mkdtemp(prefix="pwsgt-job-")
+        if self.storage is not None:
+            local = JsonStorage(workspace)
+            local.save_worlds(self.storage.load_worlds().values())
+            local.save_valuation(self.storage.load_valuation())
+            active = self.storage.read_active()
+            local.write_active(active["active_world"], active.get("last_tx"))
+            return workspace, active
+        live_worlds = os.path.abspath(os.path.join(self.examples_dir, "worlds"))
+        try:
+            os.symlink(live_worlds, os.path.join(workspace, "worlds"), target_is_directory=True)
+        except OSError:
+            shutil.copytree(live_worlds, os.path.join(workspace, "worlds"))
+        active = os.path.join(self.examples_dir, "active_world.json")
+        if os.path.exists(active):
+            shutil.copy(active, os.path.join(workspace, "active_world.json"))
+        return workspace, CardanoSimulator(workspace).read_active()
+
+    def _run(self, job: SimulationJob) -> None:
+        try:
+            self._run_proposals(job)
+        finally:
+            if job.discarded:
+                shutil.rmtree(job.workspace, ignore_errors=True)
+
+    def _run_proposals(self, job: SimulationJob) -> None:
+        if job._cancel.is_set():
+            job.status = CANCELLED
+            return
+        job.status = RUNNING
+        p = job.params
+        cancelled = False
+        try:
+            # status only changes after the session has flushed, so a finished
+            # job's workspace history is complete when commit reads it
+            with GovernanceSession(
+                job.workspace,
+                voters=build_voters(p.voter_count),
+                rng=random.Random(p.seed),
+                flush_every=0,
+            ) as session:
+                for prop_id, src, dst in job.proposals:
+                    if job._cancel.is_set():
+                        cancelled = True
+                        break
+                    tx, result = session.run_proposal(
+                        prop_id,
+                        src,
+                        dst,
+                        quorum=p.quorum,
+                        threshold=p.threshold,
+                        approval_probability=p.approval_probability,
+                        participation_probability=p.participation_probability,
+                    )
+                    job.results.append({
+                        "proposal_id": prop_id,
+                        "from_world": src,
+                        "to_world": dst,
+                        "passed": result.passed,
+                        "quorum_met": result.quorum_met,
+                        "votes_for": result.votes_for,
+                        "votes_against": result.votes_against,
+                        "tx_id": tx.tx_id if tx is not None else None,
+                    })
+                    job.done += 1
+            job.status = CANCELLED if cancelled else DONE
+        except Exception as exc:
+            job.error = f"{type(exc).__name__}: {exc}"
+            job.status = FAILED
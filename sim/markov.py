@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import inspect
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import LinearOperator, gmres, spilu, spsolve
+
+from .batch_voting import decide
+from .random_walk import BATCH_CELLS, WalkParams
+from .voting import Voter
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Linear systems with more unknowns than this use ILU-preconditioned GMRES instead of sparse LU.
+DIRECT_SOLVE_LIMIT = 50_000
+# Relative residual for GMRES; hitting-time systems on large graphs are too
+# ill-conditioned for much tighter tolerances in float64.
+SOLVER_RTOL = 1e-8
+# SciPy 1.12 renamed gmres's ``tol`` to ``rtol`` (and removed ``tol`` in 1.14).
+_GMRES_RTOL = "rtol" if "rtol" in inspect.signature(gmres).parameters else "tol"
+# The pass probability is computed exactly over the (for, against) weight grid
+# when the grid has at most this many cells, and sampled otherwise.
+EXACT_GRID_CELLS = 1 << 20
+PASS_SAMPLES = 200_000
+
+
+def _exact_pass_probability(weights: np.ndarray, params: WalkParams) -> float:
+    total = int(weights.sum())
+    dist = np.zeros((total + 1, total + 1))
+    dist[0, 0] = 1.0
+    p_for = params.participation_probability * params.approval_probability
+    p_against = params.participation_probability * (1 - params.approval_probability)
+    for w in weights.tolist():
+        if not w:
+            continue
+        step = dist * (1 - params.participation_probability)
+        step[w:, :] += p_for * dist[:total + 1 - w, :]
+        step[:, w:] += p_against * dist[:, :total + 1 - w]
+        dist = step
+    grid = np.arange(total + 1, dtype=np.float64)
+    _, passed = decide(grid[:, None], grid[None, :], total, params.quorum, params.threshold)
+    return float(dist[passed].sum())
+
+
+def _sampled_pass_probability(weights: np.ndarray, params: WalkParams, samples: int, seed: int) -> float:
+    rng = np.random.default_rng(seed)
+    w = weights.astype(np.float64)
+    p_for = params.participation_probability * params.approval_probability
+    batch = max(1, BATCH_CELLS // max(len(w), 1))
+    passes = 0
+    for start in range(0, samples, batch):
+        n = min(batch, samples - start)
+        # One draw per ballot: below p*a votes for, below p participates.
+        u = rng.random((n, len(w)), dtype=np.float32)
+        votes_for = (u < p_for).astype(np.float64) @ w
+        participating = (u < params.participation_probability).astype(np.float64) @ w
+        _, passed = decide(votes_for, participating - votes_for, w.sum(), params.quorum, params.threshold)
+        passes += int(passed.sum())
+    return passes / samples
+
+
+def pass_probability(
+    voters: Mapping[str, Voter],
+    params: Optional[WalkParams] = None,
+    samples: int = PASS_SAMPLES,
+    seed: int = 0,
+) -> float:
+    """Probability that one proposal passes under the walk's voting model.
+
+    Exact (a distribution over for/against weights, one voter at a time) for
+    small electorates; otherwise estimated from ``samples`` simulated votes.
+    """
+    params = params or WalkParams()
+    weights = np.array([v.weight for v in voters.values()], dtype=np.int64)
+    total = int(weights.sum())
+    if total <= 0:
+        return 0.0
+    if (total + 1) ** 2 <= EXACT_GRID_CELLS:
+        return _exact_pass_probability(weights, params)
+    return _sampled_pass_probability(weights, params, samples, seed)
+
+
+def transition_matrix(
+    graph: nx.DiGraph,
+    pass_prob: float,
+    edge_pass: Optional[Mapping[Tuple[str, str], float]] = None,
+) -> Tuple[List[str], sp.csr_matrix]:
+    """Row-stochastic CSR matrix of the governance walk over ``graph`` (rows/columns in sorted world order).
+
+    A step proposes a uniformly chosen out-edge, which passes with
+    ``edge_pass[(u, v)]`` (default ``pass_prob``); otherwise the walk stays.
+    Worlds without successors are absorbing.
+    """
+    ids = sorted(graph.nodes)
+    index = {w: i for i, w in enumerate(ids)}
+    rows: List[int] = []
+    cols: List[int] = []
+    vals: List[float] = []
+    for i, u in enumerate(ids):
+        succ = sorted(graph.successors(u))
+        if not succ:
+            rows.append(i)
+            cols.append(i)
+            vals.append(1.0)
+            continue
+        share = 1.0 / len(succ)
+        stay = 0.0
+        for v in succ:
+            p = edge_pass.get((u, v), pass_prob) if edge_pass else pass_prob
+            rows.append(i)
+            cols.append(index[v])
+            vals.append(p * share)
+            stay += (1 - p) * share
+        if stay:
+            rows.append(i)
+            cols.append(i)
+            vals.append(stay)
+    n = len(ids)
+    return ids, sp.csr_matrix((vals, (rows, cols)), shape=(n, n))
+
+
+def _reaching(transposed: sp.csr_matrix, sources: Sequence[int], avoid: Optional[int] = None) -> np.ndarray:
+    """Mask of states with a path to any of ``sources`` not passing through ``avoid`` (BFS over the transposed matrix)."""
+    indptr, indices = transposed.indptr, transposed.indices
+    seen = np.zeros(transposed.shape[0], dtype=bool)
+    if avoid is not None:
+        seen[avoid] = True
+    seen[list(sources)] = True
+    queue = deque(sources)
+    while queue:
+        j = queue.popleft()
+        for i in indices[indptr[j]:indptr[j + 1]].tolist():
+            if not seen[i]:
+                seen[i] = True
+                queue.append(i)
+    if avoid is not None and avoid not in sources:
+        seen[avoid] = False
+    return seen
+
+
+class GovernanceChain:
+    """Markov chain of the active world under repeated proposals.
+
+    Long-run quantities come from sparse linear solves rather than
+    simulation: systems up to ``direct_limit`` unknowns use sparse LU, larger
+    ones ILU-preconditioned GMRES.
+    """
+
+    def __init__(self, world_ids: Sequence[str], matrix: sp.csr_matrix, direct_limit: int = DIRECT_SOLVE_LIMIT) -> None:
+        self.world_ids = list(world_ids)
+        self.index = {w: i for i, w in enumerate(self.world_ids)}
+        self.P = sp.csr_matrix(matrix)
+        self.direct_limit = direct_limit
+        self.pass_probability: Optional[float] = None
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: nx.DiGraph,
+        voters: Mapping[str, Voter],
+        params: Optional[WalkParams] = None,
+        edge_pass: Optional[Mapping[Tuple[str, str], float]] = None,
+        samples: int = PASS_SAMPLES,
+        seed: int = 0,
+    ) -> "GovernanceChain":
+        p = pass_probability(voters, params, samples, seed)
+        ids, matrix = transition_matrix(graph, p, edge_pass)
+        chain = cls(ids, matrix)
+        chain.pass_probability = p
+        return chain
+
+    def _solve(self, A: sp.spmatrix, b: np.ndarray) -> np.ndarray:
+        A = sp.csc_matrix(A)
+        if A.shape[0] <= self.direct_limit:
+            return np.atleast_1d(spsolve(A, b))
+        ilu = spilu(A, drop_tol=1e-8, fill_factor=30)
+        M = LinearOperator(A.shape, ilu.solve)
+        x, info = gmres(A, b, M=M, atol=0.0, restart=30, maxiter=100, **{_GMRES_RTOL: SOLVER_RTOL})
+        if info != 0:
+            raise RuntimeError(f"GMRES did not converge ({info}) on a {A.shape[0]}-state system")
+        return x
+
+    def _class_stationary(self, members: np.ndarray) -> np.ndarray:
+        """Stationary distribution of a closed, irreducible class (fixing the first state, then normalizing)."""
+        if len(members) == 1:
+            return np.ones(1)
+        # pi (P - I) = 0 with pi_0 = 1: drop the first equation and unknown
+        A = (self.P[members][:, members].T - sp.identity(len(members))).tocsr()
+        rest = self._solve(A[1:, 1:], -A[1:, 0].toarray().ravel())
+        pi = np.concatenate(([1.0], rest))
+        return pi / pi.sum()
+
+    def stationary_distribution(self, start: Optional[str] = None) -> Dict[str, float]:
+        """Long-run fraction of time in each world.
+
+        With several closed classes the limit depends on where the walk
+        starts, so ``start`` is required; the result mixes each class's
+        distribution by the probability of being absorbed into it.
+        """
+        n = len(self.world_ids)
+        n_classes, labels = connected_components(self.P, directed=True, connection="strong")
+        coo = self.P.tocoo()
+        leaving = labels[coo.row] != labels[coo.col]
+        open_classes = set(labels[coo.row[leaving]].tolist())
+        closed = [c for c in range(n_classes) if c not in open_classes]
+        pi = np.zeros(n)
+        if len(closed) == 1:
+            members = np.flatnonzero(labels == closed[0])
+            pi[members] = self._class_stationary(members)
+            return dict(zip(self.world_ids, pi.tolist()))
+        if start is None:
+            raise ValueError(f"Chain has {len(closed)} closed classes; pass start= to pick the limit")
+
+        s = self.index[start]
+        absorb: Dict[int, float]
+        if labels[s] in closed:
+            absorb = {labels[s]: 1.0}
+        else:
+            transient = np.flatnonzero(np.isin(labels, list(open_classes)))
+            position = {int(t): k for k, t in enumerate(transient)}
+            Q = self.P[transient][:, transient]
+            # Expected visits to each transient state from start: (I - Q)^T y = e_start
+            e = np.zeros(len(transient))
+            e[position[s]] = 1.0
+            visits = self._solve((sp.identity(len(transient)) - Q).T, e)
+            into = np.asarray(self.P[transient].T @ visits).ravel()
+            absorb = {c: float(into[labels == c].sum()) for c in closed}
+        for c, weight in absorb.items():
+            if weight > 0:
+                members = np.flatnonzero(labels == c)
+                pi[members] = weight * self._class_stationary(members)
+        return dict(zip(self.world_ids, pi.tolist()))
+
+    def hitting_times(self, target: str = "w1") -> Dict[str, float]:
+        """Expected number of proposals until the active world first becomes ``target``.
+
+        ``inf`` where the walk can miss ``target`` forever; 0 at ``target`` itself.
+        """
+        n = len(self.world_ids)
+        t = self.index[target]
+        transposed = self.P.T.tocsr()
+        can_reach = _reaching(transposed, [t])
+        never = np.flatnonzero(~can_reach).tolist()
+        # The walk stops at the target, so only paths to ``never`` that avoid it count.
+        surely = can_reach & ~_reaching(transposed, never, avoid=t) if never else can_reach
+        h = np.full(n, np.inf)
+        h[t] = 0.0
+        unknown = np.flatnonzero(surely & (np.arange(n) != t))
+        if len(unknown):
+            A = sp.identity(len(unknown)) - self.P[unknown][:, unknown]
+            h[unknown] = self._solve(A, np.ones(len(unknown)))
+        return dict(zip(self.world_ids, h.tolist()))
+
+    def return_time(self, target: str = "w1", hitting: Optional[Mapping[str, float]] = None) -> float:
+        """Expected proposals between consecutive visits to ``target`` (1/π by Kac's lemma)."""
+        hitting = hitting if hitting is not None else self.hitting_times(target)
+        t = self.index[target]
+        row = self.P.getrow(t)
+        h = np.array([hitting[self.world_ids[j]] if j != t else 0.0 for j in row.indices.tolist()])
+        return float(1.0 + (row.data * h).sum())
+
+    def summary(self, target: str = "w1") -> Dict[str, Any]:
+        """JSON-friendly analytics (``None`` for infinite times)."""
+        pi = self.stationary_distribution(start=target)
+        hitting = self.hitting_times(target)
+
+        def finite(x: float) -> Optional[float]:
+            return x if np.isfinite(x) else None
+
+        return {
+            "target": target,
+            "pass_probability": self.pass_probability,
+            "return_time": finite(self.return_time(target, hitting)),
+            "worlds": {
+                w: {
+                    "stationary": pi[w],
+                    "hitting_time": finite(hitting[w]),
+                    "return_time": 1.0 / pi[w] if pi[w] > 0 else None,
+                }
+                for w in self.world_ids
+            },
+        }
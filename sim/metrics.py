@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Pipeline stage names used by the instrumented code paths.
+STAGE_SESSION_LOAD = "session.load"
+STAGE_ADMISSION = "admission"
+STAGE_VOTE_SIMULATE = "vote.simulate"
+STAGE_VOTE_TALLY = "vote.tally"
+STAGE_WORLD_READ = "world.read"
+STAGE_ARCHIVE = "archive.upload"
+STAGE_HISTORY_WRITE = "history.write"
+
+# Set PWSGT_METRICS=1 to enable collection from process start.
+ENV_FLAG = "PWSGT_METRICS"
+
+
+@dataclass
+class SpanStats:
+    count: int = 0
+    total_s: float = 0.0
+    min_s: float = float("inf")
+    max_s: float = 0.0
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_s": self.total_s,
+            "mean_s": self.mean_s,
+            "min_s": self.min_s if self.count else 0.0,
+            "max_s": self.max_s,
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str) -> None:
+        self._metrics = metrics
+        self._name = name
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._metrics.observe(self._name, time.perf_counter() - self._start)
+
+
+class Metrics:
+    """Named timing spans and counters for pipeline stages.
+
+    While disabled, ``span()`` returns a shared no-op context manager and
+    ``count()``/``observe()`` return immediately, so instrumented code pays
+    one attribute check per call.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = {}
+            self.counters = {}
+
+    def span(self, name: str):
+        """Context manager timing one occurrence of stage ``name``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def observe(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.count += 1
+            stats.total_s += seconds
+            if seconds < stats.min_s:
+                stats.min_s = seconds
+            if seconds > stats.max_s:
+                stats.max_s = seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self) -> Dict[str, Any]:
+        """Spans (sorted by name) with their share of total instrumented time, plus counters."""
+        with self._lock:
+            spans = {name: stats.to_dict() for name, stats in sorted(self.spans.items())}
+            counters = dict(sorted(self.counters.items()))
+        total = sum(s["total_s"] for s in spans.values())
+        for s in spans.values():
+            s["share"] = s["total_s"] / total if total else 0.0
+        return {"spans": spans, "counters": counters, "total_s": total}
+
+    def write_json(self, path: str) -> None:
+        _atomic_write(path, json.dumps(self.summary(), indent=2))
+
+    def prometheus_text(self, prefix: str = "pwsgt") -> str:
+        """Prometheus text exposition format (stage latencies as summaries, counters as counters)."""
+        summary = self.summary()
+        lines: List[str] = [
+            f"# HELP {prefix}_stage_seconds Time spent in pipeline stages.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for name, s in summary["spans"].items():
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {s["total_s"]!r}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {s["count"]}')
+        lines += [
+            f"# HELP {prefix}_stage_seconds_max Slowest single occurrence of a pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds_max gauge",
+        ]
+        for name, s in summary["spans"].items():
+            lines.append(f'{prefix}_stage_seconds_max{{stage="{name}"}} {s["max_s"]!r}')
+        lines += [
+            f"# HELP {prefix}_events_total Pipeline event counters.",
+            f"# TYPE {prefix}_events_total counter",
+        ]
+        for name, value in summary["counters"].items():
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "pwsgt") -> None:
+        """Write a textfile-collector file; replaced atomically so scrapers never see a partial file."""
+        _atomic_write(path, self.prometheus_text(prefix))
+
+
+def _atomic_write(path: str, text: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+# Process-wide registry used by sim_helpers, GovernanceSession and the scripts.
+METRICS = Metrics(enabled=os.environ.get(ENV_FLAG) == "1")
+# Bound methods rather than wrappers: one call less on every instrumented stage.
+span = METRICS.span
+count = METRICS.count
+
+
+def load_summary(path: str) -> Optional[Dict[str, Any]]:
+    """Read a summary written by ``Metrics.write_json`` (None if missing)."""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Set, List, Iterable
+import hashlib
+import json
+from dataclasses import dataclass, field, asdict
+from functools import cached_property
+from typing import Any, Dict, Set, List, Iterable
+
+
+def canonical_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Canonical (sorted, compact) UTF-8 JSON encoding used for hashing and archiving."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 @dataclass(frozen=True)
@@ -21,6 +29,30 @@ class World:
     created_by: str = "sim://anon"
     created_at: str = ""
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "World":
+        return cls(
+            world_id=data['world_id'],
+            name=data.get('name', data['world_id']),
+            description=data.get('description', ''),
+            necessary=data.get('necessary', []),
+            possible=data.get('possible', []),
+            edges=data.get('edges', []),
+            arweave_uri=data.get('arweave_uri', 'ar://placeholder'),
+            created_by=data.get('created_by', 'sim://anon'),
+            created_at=data.get('created_at', ''),
+        )
+
+    @cached_property
+    def canonical_bytes(self) -> bytes:
+        """Canonical JSON encoding, computed once per instance (worlds are immutable)."""
+        return canonical_json_bytes(asdict(self))
+
+    @cached_property
+    def digest(self) -> str:
+        """Hex sha256 of ``canonical_bytes``."""
+        return hashlib.sha256(self.canonical_bytes).hexdigest()
+
 
 @dataclass(frozen=True)
 class Transition:
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .batch_voting import decide
+from .holders import WeightSnapshot
+from .model import KripkeModel
+from .voting import Voter
+
+# Rows of random draws generated per vectorized voting batch (scaled down for large electorates).
+BATCH_CELLS = 1 << 20
+
+
+@dataclass
+class WalkParams:
+    quorum: float = 0.5
+    threshold: float = 0.5
+    approval_probability: float = 0.6
+    participation_probability: float = 0.9
+
+
+class GovernanceWalk:
+    """Long-horizon random walk over the governance frame.
+
+    Each step proposes a uniformly chosen legal edge (an R-successor in the
+    Kripke frame) out of the active world, simulates a weighted vote and moves
+    along the edge if it passes; a world without successors just stays put.
+    Votes for a whole batch of steps are drawn and tallied with numpy — they
+    don't depend on the edge — so the sequential part of a step is only the
+    edge choice and the statistics update.
+
+    Statistics kept in memory: visits per world, attempts/passes per edge and
+    return times per world (steps between consecutive occupations, so a failed
+    proposal counts as a return after one step; the mean return time then
+    estimates 1/π(w) by Kac's lemma). Uses ``numpy.random.Generator`` seeded
+    with ``seed``, so runs are reproducible and checkpoints are resumable.
+    ``voters`` may be a ``WeightSnapshot`` for token-weighted electorates.
+    """
+
+    def __init__(
+        self,
+        model: KripkeModel,
+        voters: Union[Dict[str, Voter], WeightSnapshot],
+        params: Optional[WalkParams] = None,
+        start_world: str = "w1",
+        seed: int = 42,
+    ) -> None:
+        self.params = params or WalkParams()
+        self.world_ids: List[str] = sorted(model.worlds)
+        index = {w: i for i, w in enumerate(self.world_ids)}
+        # CSR adjacency: edges of world i are out_start[i]:out_start[i + 1]
+        self.edge_src: List[int] = []
+        self.edge_dst: List[int] = []
+        self.out_start: List[int] = [0]
+        for w in self.world_ids:
+            for dst in sorted(model.successors(w)):
+                self.edge_src.append(index[w])
+                self.edge_dst.append(index[dst])
+            self.out_start.append(len(self.edge_dst))
+        if isinstance(voters, WeightSnapshot):
+            # a float copy of the mapped weight column; no per-holder objects
+            self.weights = np.asarray(voters.weights, dtype=np.float64)
+        else:
+            self.weights = np.array([v.weight for v in voters.values()], dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+
+        self.current = index[start_world]
+        self.steps = 0
+        self.visits = [0] * len(self.world_ids)
+        self.edge_attempts = [0] * len(self.edge_dst)
+        self.edge_passes = [0] * len(self.edge_dst)
+        self.return_sum = [0] * len(self.world_ids)
+        self.return_count = [0] * len(self.world_ids)
+        self.last_seen = [-1] * len(self.world_ids)
+        self.last_seen[self.current] = 0
+
+    def _vote_batch(self, n: int) -> List[bool]:
+        p = self.params
+        shape = (n, len(self.weights))
+        participates = self.rng.random(shape) <= p.participation_probability
+        approves = self.rng.random(shape) <= p.approval_probability
+        votes_for = (participates & approves) @ self.weights
+        participating = participates @ self.weights
+        _, passed = decide(votes_for, participating - votes_for, self.weights.sum(), p.quorum, p.threshold)
+        return passed.tolist()
+
+    def run(self, steps: int, checkpoint_path: Optional[str] = None, checkpoint_every: int = 0) -> None:
+        batch = max(1, min(steps, BATCH_CELLS // max(len(self.weights), 1)))
+        out_start, edge_dst = self.out_start, self.edge_dst
+        visits, attempts, passes = self.visits, self.edge_attempts, self.edge_passes
+        ret_sum, ret_count, last_seen = self.return_sum, self.return_count, self.last_seen
+        cur, step = self.current, self.steps
+        remaining = steps
+        next_checkpoint = step + checkpoint_every if checkpoint_every else None
+        while remaining > 0:
+            n = min(batch, remaining)
+            passed = self._vote_batch(n)
+            picks = self.rng.random(n).tolist()
+            for k in range(n):
+                lo = out_start[cur]
+                deg = out_start[cur + 1] - lo
+                step += 1
+                if deg:
+                    e = lo + int(picks[k] * deg)
+                    attempts[e] += 1
+                    if passed[k]:
+                        passes[e] += 1
+                        cur = edge_dst[e]
+                visits[cur] += 1
+                seen = last_seen[cur]
+                if seen >= 0:
+                    ret_sum[cur] += step - seen
+                    ret_count[cur] += 1
+                last_seen[cur] = step
+            remaining -= n
+            self.current, self.steps = cur, step
+            if checkpoint_path and next_checkpoint is not None and step >= next_checkpoint:
+                self.save_checkpoint(checkpoint_path)
+                next_checkpoint = step + checkpoint_every
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+
+    def stats(self) -> Dict[str, Any]:
+        steps = max(self.steps, 1)
+        edges = []
+        for e, (src, dst) in enumerate(zip(self.edge_src, self.edge_dst)):
+            tried = self.edge_attempts[e]
+            edges.append({
+                "from": self.world_ids[src],
+                "to": self.world_ids[dst],
+                "attempts": tried,
+                "passes": self.edge_passes[e],
+                "pass_rate": self.edge_passes[e] / tried if tried else None,
+            })
+        worlds = {}
+        for i, w in enumerate(self.world_ids):
+            worlds[w] = {
+                "visits": self.visits[i],
+                "stationary_estimate": self.visits[i] / steps,
+                "mean_return_time": self.return_sum[i] / self.return_count[i] if self.return_count[i] else None,
+            }
+        return {
+            "steps": self.steps,
+            "active_world": self.world_ids[self.current],
+            "params": self.params.__dict__,
+            "worlds": worlds,
+            "edges": edges,
+        }
+
+    def _fingerprint(self) -> Dict[str, Any]:
+        """What a checkpoint's statistics depend on besides the world ids."""
+        return {
+            "edges": [[s, d] for s, d in zip(self.edge_src, self.edge_dst)],
+            "weights_sha256": hashlib.sha256(self.weights.tobytes()).hexdigest(),
+            "params": dict(self.params.__dict__),
+        }
+
+    def save_checkpoint(self, path: str) -> None:
+        state = {
+            "stats": self.stats(),
+            "world_ids": self.world_ids,
+            **self._fingerprint(),
+            "current": self.current,
+            "steps": self.steps,
+            "visits": self.visits,
+            "edge_attempts": self.edge_attempts,
+            "edge_passes": self.edge_passes,
+            "return_sum": self.return_sum,
+            "return_count": self.return_count,
+            "last_seen": self.last_seen,
+            "rng_state": self.rng.bit_generator.state,
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    def load_checkpoint(self, path: str) -> None:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state["world_ids"] != self.world_ids:
+            raise ValueError("Checkpoint was written for a different set of worlds")
+        # Resuming with other edges, voter weights or parameters would mix incompatible statistics.
+        for key, expected in self._fingerprint().items():
+            if state.get(key) != expected:
+                raise ValueError(f"Checkpoint was written with different {key.split('_')[0]}")
+        for key in ("current", "steps", "visits", "edge_attempts", "edge_passes", "return_sum", "return_count", "last_seen"):
+            setattr(self, key, state[key])
+        self.rng.bit_generator.state = state["rng_state"]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import random
+import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .archiver import MockArchiver
+from .model import KripkeModel, canonical_json_bytes
+from .sim_helpers import build_voters, load_worlds_and_valuation
+from .voting import Proposal, evaluate_proposal, simulate_votes_random
+
+# Scenario histories use a synthetic clock and name-based tx ids so merged
+# output depends only on the scenarios, never on scheduling or wall time.
+SCENARIO_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+SCENARIO_TX_NAMESPACE = uuid.UUID("6f1c3a52-8d0e-4f7b-9a51-3c2d7e4b9a10")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    scenario_id: str
+    seed: int
+    steps: int = 1000
+    voter_count: int = 10
+    quorum: float = 0.5
+    threshold: float = 0.5
+    approval_probability: float = 0.6
+    participation_probability: float = 0.9
+    start_world: str = "w1"
+
+
+def scenario_grid(
+    seeds: Iterable[int],
+    steps: int = 1000,
+    voter_counts: Sequence[int] = (10,),
+    quorums: Sequence[float] = (0.5,),
+    thresholds: Sequence[float] = (0.5,),
+    approval_probabilities: Sequence[float] = (0.6,),
+    participation_probabilities: Sequence[float] = (0.9,),
+) -> List[Scenario]:
+    """Cartesian product of parameter points, with stable zero-padded ids."""
+    points = list(itertools.product(seeds, voter_counts, quorums, thresholds, approval_probabilities, participation_probabilities))
+    width = max(len(str(len(points) - 1)), 4)
+    return [
+        Scenario(f"s{i:0{width}d}", seed, steps, voters, q, t, a, p)
+        for i, (seed, voters, q, t, a, p) in enumerate(points)
+    ]
+
+
+def run_scenario(scenario: Scenario, model: KripkeModel) -> Dict[str, Any]:
+    """Simulate one scenario in memory: ``steps`` proposals along legal edges of the active world.
+
+    Returns the summary and the scenario's transactions (``"history"``, history
+    records tagged with ``scenario_id``).
+    """
+    rng = random.Random(scenario.seed)
+    voters = build_voters(scenario.voter_count)
+    archiver = MockArchiver()
+    successors = {w: sorted(model.successors(w)) for w in model.worlds}
+    uris = {w: archiver.upload_world(world) for w, world in model.worlds.items()}
+    active = scenario.start_world
+    visits = {w: 0 for w in sorted(model.worlds)}
+    history: List[Dict[str, Any]] = []
+    attempts = 0
+    for step in range(scenario.steps):
+        options = successors[active]
+        if options:
+            dst = options[rng.randrange(len(options))]
+            proposal_id = f"{scenario.scenario_id}-p{step:06d}"
+            proposal = Proposal(proposal_id, active, dst, scenario.quorum, scenario.threshold)
+            votes = simulate_votes_random(voters, rng, scenario.approval_probability, scenario.participation_probability)
+            result = evaluate_proposal(proposal, voters, votes)
+            attempts += 1
+            if result.passed:
+                # Plain dict in TransitionTx field order (asdict deep-copies every field).
+                history.append({
+                    "tx_id": str(uuid.uuid5(SCENARIO_TX_NAMESPACE, proposal_id)),
+                    "proposal_id": proposal_id,
+                    "from_world": active,
+                    "to_world": dst,
+                    "arweave_from": uris[active],
+                    "arweave_to": uris[dst],
+                    "votes_for": result.votes_for,
+                    "votes_against": result.votes_against,
+                    "quorum": scenario.quorum,
+                    "timestamp": (SCENARIO_EPOCH + timedelta(seconds=step)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "signers": ["gov_key1", "gov_key2"],
+                    "notes": f"scenario {scenario.scenario_id}",
+                    "scenario_id": scenario.scenario_id,
+                })
+                active = dst
+        visits[active] += 1
+    summary = {
+        "scenario": asdict(scenario),
+        "attempts": attempts,
+        "passed": len(history),
+        "final_world": active,
+        "visits": visits,
+    }
+    return {"summary": summary, "history": history}
+
+
+# Worker-process state: the model is loaded once per worker by _init_worker.
+_worker_model: Optional[KripkeModel] = None
+
+
+def _init_worker(examples_dir: str) -> None:
+    global _worker_model
+    _, _, _worker_model = load_worlds_and_valuation(examples_dir)
+
+
+def _run_shard(scenario: Scenario, shard_dir: str) -> str:
+    assert _worker_model is not None
+    output = run_scenario(scenario, _worker_model)
+    base = os.path.join(shard_dir, scenario.scenario_id)
+    # One compact record per line, so merging is plain line concatenation.
+    with open(base + ".history.jsonl", 'w', encoding='utf-8') as f:
+        for record in output["history"]:
+            f.write(json.dumps(record) + "\n")
+    with open(base + ".summary.json", 'wb') as f:
+        f.write(canonical_json_bytes(output["summary"]))
+    return scenario.scenario_id
+
+
+def run_scenarios(
+    examples_dir: str,
+    scenarios: Sequence[Scenario],
+    out_dir: str,
+    workers: int = 1,
+    keep_shards: bool = False,
+) -> List[Dict[str, Any]]:
+    """Run scenarios on a process pool and merge their shards deterministically.
+
+    Every scenario writes ``<scenario_id>.history.jsonl`` and ``.summary.json``
+    under ``out_dir/shards``. Merging concatenates shards in ``scenario_id``
+    order into ``out_dir/history.json`` (a JSON array, one record per line)
+    and ``out_dir/results.json``, so the output is byte-identical for any
+    ``workers``. ``workers=1`` runs in-process.
+    """
+    ids = [s.scenario_id for s in scenarios]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Scenario ids must be unique")
+    shard_dir = os.path.join(out_dir, "shards")
+    os.makedirs(shard_dir, exist_ok=True)
+    if workers <= 1:
+        _init_worker(examples_dir)
+        for scenario in scenarios:
+            _run_shard(scenario, shard_dir)
+    else:
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(examples_dir,)) as pool:
+            list(pool.map(_run_shard, scenarios, itertools.repeat(shard_dir), chunksize=chunksize))
+    results = merge_shards(shard_dir, sorted(ids), out_dir)
+    if not keep_shards:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+    return results
+
+
+def merge_shards(shard_dir: str, scenario_ids: Sequence[str], out_dir: str) -> List[Dict[str, Any]]:
+    """Stream shards, in the given order, into merged history and results files."""
+    results: List[Dict[str, Any]] = []
+    first = True
+    with open(os.path.join(out_dir, "history.json"), 'w', encoding='utf-8') as out:
+        out.write("[")
+        for sid in scenario_ids:
+            with open(os.path.join(shard_dir, f"{sid}.history.jsonl"), 'r', encoding='utf-8') as f:
+                for line in f:
+                    out.write(("\n" if first else ",\n") + line.rstrip("\n"))
+                    first = False
+            with open(os.path.join(shard_dir, f"{sid}.summary.json"), 'r', encoding='utf-8') as f:
+                results.append(json.load(f))
+        out.write("]" if first else "\n]")
+    with open(os.path.join(out_dir, "results.json"), 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    return results
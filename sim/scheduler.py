@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .admission import ADMITTED
+from .cardano_sim import TransitionTx
+from .metrics import count
+from .model import KripkeModel
+from .session import GovernanceSession
+from .voting import Proposal, VoteResult, result_from_tally
+
+APPLIED = "applied"
+FAILED = "failed"
+CONFLICT = "conflict"  # passed, but another proposal from the same source won the close instant
+STALE = "stale"  # passed, but its source was no longer the active world when it closed
+REJECTED = "rejected"  # turned away by session admission when it opened
+
+# Event kinds, in the order they are processed at equal times.
+_OPEN, _BALLOT, _CLOSE = 0, 1, 2
+
+Ballot = Tuple[float, str, bool]
+
+
+@dataclass(frozen=True)
+class ScheduledProposal:
+    proposal_id: str
+    from_world: str
+    to_world: str
+    open_at: float
+    close_at: float
+    quorum: float = 0.5
+    threshold: float = 0.5
+    # Explicit (time, voter_id, approve) ballots; simulated at open when None.
+    ballots: Optional[Tuple[Ballot, ...]] = None
+
+
+@dataclass
+class ProposalOutcome:
+    proposal_id: str
+    status: str
+    closed_at: float
+    result: Optional[VoteResult] = None
+    tx: Optional[TransitionTx] = None
+    reason: Optional[str] = None  # admission reason, or the winning proposal_id of a conflict
+
+
+def _support(result: VoteResult) -> float:
+    participating = result.votes_for + result.votes_against
+    return result.votes_for / participating if participating else 0.0
+
+
+class ProposalScheduler:
+    """Discrete-event scheduler for proposals with overlapping voting windows.
+
+    Runs on a virtual clock: each proposal opens at ``open_at``, collects
+    ballots (explicit, or simulated from ``rng`` at open with uniformly
+    spread times) interleaved with every other open proposal in time order,
+    and is tallied when it closes. Proposals closing at the same instant are
+    resolved together: passed proposals are grouped by source world and the
+    winner of each group is the one with the highest support, then most
+    votes for, earliest open, smallest id. Only a winner whose source is the
+    session's active world is applied (archived and recorded); the others are
+    marked ``CONFLICT`` or ``STALE`` and never reach the archiver.
+
+    The heap holds one pending event per proposal (its open, next ballot or
+    close), so its size tracks open proposals rather than ballots. ``run`` is
+    a coroutine that yields to the event loop every ``yield_every`` events.
+    """
+
+    def __init__(
+        self,
+        session: GovernanceSession,
+        rng: Optional[random.Random] = None,
+        approval_probability: float = 0.6,
+        participation_probability: float = 0.9,
+        yield_every: int = 1000,
+    ) -> None:
+        self.session = session
+        self.rng = rng if rng is not None else random.Random()
+        self.approval_probability = approval_probability
+        self.participation_probability = participation_probability
+        self.yield_every = yield_every
+        self.weights: Dict[str, int] = {vid: v.weight for vid, v in session.voters.items()}
+        self.total_weight = sum(self.weights.values())
+        self.now = 0.0
+        self.proposals: List[ScheduledProposal] = []
+        self.outcomes: Dict[str, ProposalOutcome] = {}
+        self.open_count = 0
+        self.peak_open = 0
+        self.events = 0
+        self._heap: List[Tuple[float, int, int, int]] = []
+        self._seq = 0
+        self._ids: Set[str] = set()
+        # Per-proposal state, indexed like ``proposals``: sorted (time, weight, approve)
+        # ballots while open, the next ballot's position and the running tally.
+        self._ballots: List[Optional[List[Tuple[float, int, bool]]]] = []
+        self._cursor: List[int] = []
+        self._for: List[int] = []
+        self._against: List[int] = []
+
+    def _push(self, at: float, kind: int, idx: int) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (at, kind, self._seq, idx))
+
+    def add(self, proposal: ScheduledProposal) -> None:
+        if proposal.proposal_id in self._ids:
+            raise ValueError(f"Duplicate proposal id {proposal.proposal_id}")
+        if proposal.close_at <= proposal.open_at:
+            raise ValueError(f"{proposal.proposal_id}: close_at must be after open_at")
+        if proposal.open_at < self.now:
+            raise ValueError(f"{proposal.proposal_id}: opens before the scheduler clock ({self.now})")
+        if proposal.ballots is not None:
+            for at, voter_id, _ in proposal.ballots:
+                if not proposal.open_at <= at < proposal.close_at:
+                    raise ValueError(f"{proposal.proposal_id}: ballot at {at} outside its voting window")
+                if voter_id not in self.weights:
+                    raise ValueError(f"{proposal.proposal_id}: unknown voter {voter_id}")
+        self._ids.add(proposal.proposal_id)
+        self.proposals.append(proposal)
+        self._ballots.append(None)
+        self._cursor.append(0)
+        self._for.append(0)
+        self._against.append(0)
+        self._push(proposal.open_at, _OPEN, len(self.proposals) - 1)
+
+    def extend(self, proposals: Sequence[ScheduledProposal]) -> None:
+        for proposal in proposals:
+            self.add(proposal)
+
+    def _simulate_ballots(self, proposal: ScheduledProposal) -> List[Tuple[float, int, bool]]:
+        rng, span = self.rng, proposal.close_at - proposal.open_at
+        ballots = []
+        for weight in self.weights.values():
+            if rng.random() <= self.participation_probability:
+                ballots.append((proposal.open_at + rng.random() * span, weight, rng.random() <= self.approval_probability))
+        ballots.sort()
+        return ballots
+
+    def _open(self, idx: int) -> None:
+        proposal = self.proposals[idx]
+        reason = self.session.check_admission(proposal.from_world, proposal.to_world, require_active=False)
+        if reason != ADMITTED:
+            self.outcomes[proposal.proposal_id] = ProposalOutcome(proposal.proposal_id, REJECTED, self.now, reason=reason)
+            return
+        if proposal.ballots is None:
+            ballots = self._simulate_ballots(proposal)
+        else:
+            ballots = sorted((at, self.weights[vid], approve) for at, vid, approve in proposal.ballots)
+        self.open_count += 1
+        self.peak_open = max(self.peak_open, self.open_count)
+        if ballots:
+            self._ballots[idx] = ballots
+            self._push(ballots[0][0], _BALLOT, idx)
+        else:
+            self._push(proposal.close_at, _CLOSE, idx)
+
+    def _ballot(self, idx: int) -> Tuple[float, int]:
+        """Count the proposal's next ballot; returns the time and kind of its following event."""
+        ballots = self._ballots[idx]
+        k = self._cursor[idx]
+        _, weight, approve = ballots[k]
+        if approve:
+            self._for[idx] += weight
+        else:
+            self._against[idx] += weight
+        k += 1
+        if k < len(ballots):
+            self._cursor[idx] = k
+            return ballots[k][0], _BALLOT
+        self._ballots[idx] = None
+        return self.proposals[idx].close_at, _CLOSE
+
+    def _close(self, closing: List[int]) -> None:
+        """Tally and resolve every proposal closing at ``self.now``."""
+        active = self.session.active_world
+        passed: Dict[str, List[Tuple[ScheduledProposal, VoteResult]]] = {}
+        for idx in closing:
+            p = self.proposals[idx]
+            proposal = Proposal(p.proposal_id, p.from_world, p.to_world, p.quorum, p.threshold)
+            result = result_from_tally(proposal, self._for[idx], self._against[idx], self.total_weight)
+            self.open_count -= 1
+            count("proposals")
+            if result.passed:
+                passed.setdefault(p.from_world, []).append((p, result))
+            else:
+                self.outcomes[p.proposal_id] = ProposalOutcome(p.proposal_id, FAILED, self.now, result)
+        for source in sorted(passed):
+            group = sorted(passed[source], key=lambda pr: (-_support(pr[1]), -pr[1].votes_for, pr[0].open_at, pr[0].proposal_id))
+            if source != active:
+                # Nothing from a stale source can apply, so none of them lost a conflict.
+                for stale, res in group:
+                    self.outcomes[stale.proposal_id] = ProposalOutcome(stale.proposal_id, STALE, self.now, res)
+                continue
+            winner, result = group[0]
+            for loser, lost in group[1:]:
+                self.outcomes[loser.proposal_id] = ProposalOutcome(loser.proposal_id, CONFLICT, self.now, lost, reason=winner.proposal_id)
+            proposal = Proposal(winner.proposal_id, winner.from_world, winner.to_world, winner.quorum, winner.threshold)
+            tx = self.session.apply_passed(proposal, result)
+            self.outcomes[winner.proposal_id] = ProposalOutcome(winner.proposal_id, APPLIED, self.now, result, tx)
+
+    async def run(self, until: Optional[float] = None) -> List[ProposalOutcome]:
+        """Process events up to virtual time ``until`` (all of them when None); outcomes in resolution order."""
+        heap = self._heap
+        processed = 0
+        while heap and (until is None or heap[0][0] <= until):
+            at, kind, _, idx = heap[0]
+            self.now = at
+            if kind == _BALLOT:
+                # A ballot is always followed by another event of the same proposal.
+                next_at, next_kind = self._ballot(idx)
+                self._seq += 1
+                heapq.heapreplace(heap, (next_at, next_kind, self._seq, idx))
+            elif kind == _OPEN:
+                heapq.heappop(heap)
+                self._open(idx)
+            else:
+                heapq.heappop(heap)
+                closing = [idx]
+                while heap and heap[0][0] == at and heap[0][1] == _CLOSE:
+                    closing.append(heapq.heappop(heap)[3])
+                self._close(closing)
+            processed += 1
+            if processed % self.yield_every == 0:
+                await asyncio.sleep(0)
+        self.events += processed
+        return list(self.outcomes.values())
+
+    def run_sync(self, until: Optional[float] = None) -> List[ProposalOutcome]:
+        return asyncio.run(self.run(until))
+
+    def stats(self) -> Dict[str, Any]:
+        by_status: Dict[str, int] = {}
+        for outcome in self.outcomes.values():
+            by_status[outcome.status] = by_status.get(outcome.status, 0) + 1
+        return {
+            "proposals": len(self.proposals),
+            "resolved": len(self.outcomes),
+            "open": self.open_count,
+            "peak_open": self.peak_open,
+            "events": self.events,
+            "now": self.now,
+            "outcomes": by_status,
+        }
+
+
+def random_schedule(
+    model: KripkeModel,
+    count: int,
+    rng: random.Random,
+    arrival_rate: float = 10.0,
+    mean_window: float = 100.0,
+    quorum: float = 0.5,
+    threshold: float = 0.5,
+) -> List[ScheduledProposal]:
+    """``count`` proposals along random edges of the frame with Poisson arrivals.
+
+    About ``arrival_rate * mean_window`` proposals are open at once; window
+    lengths are uniform in [0.5, 1.5] × ``mean_window``.
+    """
+    sources = sorted(w for w in model.worlds if model.successors(w))
+    proposals = []
+    at = 0.0
+    for i in range(count):
+        at += rng.expovariate(arrival_rate)
+        src = rng.choice(sources)
+        dst = rng.choice(sorted(model.successors(src)))
+        window = mean_window * (0.5 + rng.random())
+        proposals.append(ScheduledProposal(f"sp{i:06d}", src, dst, at, at + window, quorum, threshold))
+    return proposals
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .admission import (
+    ADMISSION_MODES,
+    ADMISSION_OFF,
+    ADMISSION_STRICT,
+    ADMITTED,
+    NOT_ACTIVE,
+    AdmissionGuard,
+)
+from .archiver import MockArchiver
+from .cardano_sim import CardanoSimulator, TransitionTx
+from .metrics import (
+    STAGE_ADMISSION,
+    STAGE_ARCHIVE,
+    STAGE_HISTORY_WRITE,
+    STAGE_SESSION_LOAD,
+    STAGE_VOTE_SIMULATE,
+    STAGE_VOTE_TALLY,
+    count,
+    span,
+)
+from .model import World
+from .sim_helpers import build_voters, load_worlds_and_valuation
+from .versioned import FrameHistory
+from .voting import Proposal, Voter, VoteResult, evaluate_proposal, simulate_votes_random
+
+if TYPE_CHECKING:
+    from .storage import Storage
+
+
+class GovernanceSession:
+    """Long-lived in-memory governance state for running many proposals.
+
+    Worlds, the Kripke model, voters, the active world and the last
+    ``history_tail`` transactions are loaded once. Passed proposals are
+    archived from the worlds' cached encodings and buffered; buffered
+    transactions are appended to ``history.json`` (and the active-world
+    registry rewritten) every ``flush_every`` transactions, when
+    ``flush_interval`` seconds have passed since the last flush, and on
+    ``flush()``/``close()``. ``flush_every=0`` with no interval flushes only
+    on close. ``history_tail=0`` skips reading existing history entirely
+    (``transitions`` then counts only this session's transactions).
+    With a ``storage`` backend, everything is loaded from and flushed to it
+    instead of the JSON files. ``track_versions`` keeps a ``FrameHistory``
+    (``versions``) with one structurally shared snapshot per passed proposal.
+    ``admission="static"`` rejects proposals that are not edges of the frame
+    or whose target violates its ``necessary`` propositions before voting;
+    ``"strict"`` also requires ``from_world`` to be the active world.
+    """
+
+    def __init__(
+        self,
+        examples_dir: str,
+        voters: Optional[Dict[str, Voter]] = None,
+        rng: Optional[random.Random] = None,
+        archiver: Optional[MockArchiver] = None,
+        flush_every: int = 1,
+        flush_interval: Optional[float] = None,
+        history_tail: int = 100,
+        signers: Optional[List[str]] = None,
+        storage: Optional[Storage] = None,
+        track_versions: bool = False,
+        admission: str = ADMISSION_OFF,
+    ) -> None:
+        if admission not in ADMISSION_MODES:
+            raise ValueError(f"admission must be one of {ADMISSION_MODES}")
+        self.examples_dir = examples_dir
+        self.voters = voters if voters is not None else build_voters(10)
+        self.rng = rng if rng is not None else random.Random()
+        self.archiver = archiver if archiver is not None else MockArchiver()
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.signers = signers if signers is not None else ["gov_key1", "gov_key2"]
+        self.chain = CardanoSimulator(examples_dir, storage)
+
+        with span(STAGE_SESSION_LOAD):
+            self.store, self.worlds, self.model = load_worlds_and_valuation(examples_dir, storage)
+            self.history_tail: Deque[Dict[str, Any]] = deque(maxlen=history_tail)
+            self.transitions = 0
+            if history_tail:
+                self.transitions, tail = self.chain.tail_history(history_tail)
+                self.history_tail.extend(tail)
+            active = self.chain.read_active()
+            self.active_world, self.last_tx = active.get("active_world", "w1"), active.get("last_tx")
+        self.versions = FrameHistory.from_model(self.model, self.active_world) if track_versions else None
+        self.admission = admission
+        self.guard = AdmissionGuard(self.model) if admission != ADMISSION_OFF else None
+        # rejection reason -> number of proposals turned away before voting
+        self.rejections: Dict[str, int] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> "GovernanceSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def world(self, world_id: str) -> World:
+        return self.worlds[world_id]
+
+    def run_proposal(
+        self,
+        proposal_id: str,
+        from_world: str,
+        to_world: str,
+        quorum: float = 0.5,
+        threshold: float = 0.5,
+        approval_probability: float = 0.6,
+        participation_probability: float = 0.9,
+        votes: Optional[Dict[str, bool]] = None,
+    ) -> Tuple[Optional[TransitionTx], Optional[VoteResult]]:
+        """Vote on one proposal (simulated unless ``votes`` is given) and apply it if it passes.
+
+        With admission enabled, a rejected proposal returns ``(None, None)``
+        without voting, archiving or history writes; see ``rejections``.
+        """
+        if self.check_admission(from_world, to_world) != ADMITTED:
+            return None, None
+        return self._vote_and_apply(
+            proposal_id, from_world, to_world, quorum, threshold, approval_probability, participation_probability, votes
+        )
+
+    def check_admission(self, from_world: str, to_world: str, require_active: Optional[bool] = None) -> str:
+        """Admission reason for a proposal (``ADMITTED`` when admission is off); rejections are tallied.
+
+        ``require_active`` overrides whether the strict active-world check applies.
+        """
+        if self.guard is None:
+            return ADMITTED
+        if require_active is None:
+            require_active = self.admission == ADMISSION_STRICT
+        reason = self.guard.check(from_world, to_world, self.active_world if require_active else None)
+        if reason != ADMITTED:
+            self._reject(reason)
+        return reason
+
+    def _reject(self, reason: str) -> None:
+        self.rejections[reason] = self.rejections.get(reason, 0) + 1
+        count("proposals_rejected")
+
+    def _vote_and_apply(
+        self,
+        proposal_id: str,
+        from_world: str,
+        to_world: str,
+        quorum: float = 0.5,
+        threshold: float = 0.5,
+        approval_probability: float = 0.6,
+        participation_probability: float = 0.9,
+        votes: Optional[Dict[str, bool]] = None,
+    ) -> Tuple[Optional[TransitionTx], VoteResult]:
+        proposal = Proposal(proposal_id=proposal_id, from_world=from_world, to_world=to_world, quorum=quorum, threshold=threshold)
+        if votes is None:
+            with span(STAGE_VOTE_SIMULATE):
+                votes = simulate_votes_random(self.voters, self.rng, approval_probability=approval_probability, participation_probability=participation_probability)
+        with span(STAGE_VOTE_TALLY):
+            result = evaluate_proposal(proposal, self.voters, votes)
+        count("proposals")
+        if not result.passed:
+            return None, result
+        return self.apply_passed(proposal, result), result
+
+    def apply_passed(self, proposal: Proposal, result: VoteResult) -> TransitionTx:
+        """Archive both worlds of a passed proposal and record its transition."""
+        count("proposals_passed")
+        with span(STAGE_ARCHIVE):
+            ar_src = self.archiver.upload_world(self.worlds[proposal.from_world])
+            ar_dst = self.archiver.upload_world(self.worlds[proposal.to_world])
+        tx = self.chain.build_transition(
+            proposal_id=proposal.proposal_id,
+            from_world=proposal.from_world,
+            to_world=proposal.to_world,
+            arweave_from=ar_src,
+            arweave_to=ar_dst,
+            votes_for=result.votes_for,
+            votes_against=result.votes_against,
+            quorum=proposal.quorum,
+            signers=list(self.signers),
+        )
+        self._record(tx)
+        return tx
+
+    def run_proposals(
+        self,
+        proposals: Iterable[Tuple[str, str, str]],
+        **kwargs: Any,
+    ) -> List[Tuple[Optional[TransitionTx], Optional[VoteResult]]]:
+        """Run proposals in order; with admission, frame checks run once for the whole batch."""
+        if self.guard is None:
+            return [self._vote_and_apply(pid, src, dst, **kwargs) for pid, src, dst in proposals]
+        proposals = list(proposals)
+        with span(STAGE_ADMISSION):
+            reasons = self.guard.check_batch(proposals)
+        strict = self.admission == ADMISSION_STRICT
+        results: List[Tuple[Optional[TransitionTx], Optional[VoteResult]]] = []
+        for (pid, src, dst), reason in zip(proposals, reasons):
+            if reason == ADMITTED and strict and src != self.active_world:
+                reason = NOT_ACTIVE
+            if reason != ADMITTED:
+                self._reject(reason)
+                results.append((None, None))
+            else:
+                results.append(self._vote_and_apply(pid, src, dst, **kwargs))
+        return results
+
+    def _record(self, tx: TransitionTx) -> None:
+        record = asdict(tx)
+        self._pending.append(record)
+        self.history_tail.append(record)
+        self.transitions += 1
+        self.active_world, self.last_tx = tx.to_world, tx.tx_id
+        if self.versions is not None:
+            self.versions.apply_transition(record)
+        if self.flush_every and len(self._pending) >= self.flush_every:
+            self.flush()
+        elif self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> None:
+        if self._pending:
+            with span(STAGE_HISTORY_WRITE):
+                self.chain.append_transactions(self._pending)
+            count("history_flushes")
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
@@ -3,13 +3,28 @@ from __future__ import annotations
 import json
 import os
 import random
-from typing import Dict, Tuple, List
+from typing import TYPE_CHECKING, Dict, Tuple, List, Optional, Sequence
 
 from .archiver import MockArchiver
-from .cardano_sim import CardanoSimulator
+from .cardano_sim import CardanoSimulator, TransitionTx
 from .graph_store import GraphStore
-from .model import KripkeModel
-from .voting import Voter, Proposal, simulate_votes_random, evaluate_proposal
+from .metrics import (
+    STAGE_ARCHIVE,
+    STAGE_HISTORY_WRITE,
+    STAGE_VOTE_SIMULATE,
+    STAGE_VOTE_TALLY,
+    STAGE_WORLD_READ,
+    count,
+    span,
+)
+from .model import KripkeModel, World
+from .voting import Voter, Proposal, VoteResult, simulate_votes_random, evaluate_proposal
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .async_archiver import AsyncArchiverClient
+    from .storage import Storage
 
 
 def ensure_examples_dirs(root: str) -> Tuple[str, str]:
@@ -19,14 +34,19 @@ def ensure_examples_dirs(root: str) -> Tuple[str, str]:
     return examples_dir, worlds_dir
 
 
-def load_worlds_and_valuation(examples_dir: str):
+def load_worlds_and_valuation(examples_dir: str, storage: Optional[Storage] = None):
+    """(store, worlds, model) from the JSON layout under ``examples_dir``, or from ``storage`` if given."""
     store = GraphStore()
-    worlds = store.load_worlds_from_dir(os.path.join(examples_dir, "worlds"))
-    valuation_path = os.path.join(examples_dir, "valuation.json")
-    valuation = {}
-    if os.path.exists(valuation_path):
-        with open(valuation_path, 'r', encoding='utf-8') as f:
-            valuation = {k: set(v) for k, v in json.load(f).items()}
+    if storage is not None:
+        worlds = store.load_from_storage(storage)
+        valuation = storage.load_valuation()
+    else:
+        worlds = store.load_worlds_from_dir(os.path.join(examples_dir, "worlds"))
+        valuation_path = os.path.join(examples_dir, "valuation.json")
+        valuation = {}
+        if os.path.exists(valuation_path):
+            with open(valuation_path, 'r', encoding='utf-8') as f:
+                valuation = {k: set(v) for k, v in json.load(f).items()}
     model = KripkeModel(worlds, store.edges(), valuation)
     return store, worlds, model
 
@@ -46,6 +66,11 @@ def build_voters(n: int = 10) -> Dict[str, Voter]:
     return {f"v{i}": Voter(voter_id=f"v{i}", weight=i) for i in range(1, n + 1)}
 
 
+def _read_world(examples_dir: str, world_id: str) -> World:
+    with open(os.path.join(examples_dir, "worlds", f"{world_id}.json"), 'r', encoding='utf-8') as f:
+        return World.from_dict(json.load(f))
+
+
 def run_single_proposal(
     examples_dir: str,
     proposal_id: str,
@@ -59,27 +84,98 @@ def run_single_proposal(
     voters: Dict[str, Voter],
 ):
     proposal = Proposal(proposal_id=proposal_id, from_world=from_world, to_world=to_world, quorum=quorum, threshold=threshold)
-    votes = simulate_votes_random(voters, rng, approval_probability=approval_probability, participation_probability=participation_probability)
-    result = evaluate_proposal(proposal, voters, votes)
+    with span(STAGE_VOTE_SIMULATE):
+        votes = simulate_votes_random(voters, rng, approval_probability=approval_probability, participation_probability=participation_probability)
+    with span(STAGE_VOTE_TALLY):
+        result = evaluate_proposal(proposal, voters, votes)
+    count("proposals")
     if not result.passed:
         return None, result
+    count("proposals_passed")
     archiver = MockArchiver()
     chain = CardanoSimulator(examples_dir)
-    src_data = json.load(open(os.path.join(examples_dir, "worlds", f"{from_world}.json"), 'r', encoding='utf-8'))
-    dst_data = json.load(open(os.path.join(examples_dir, "worlds", f"{to_world}.json"), 'r', encoding='utf-8'))
-    ar_src = archiver.upload_json(src_data)
-    ar_dst = archiver.upload_json(dst_data)
-    tx = chain.submit_transition(
-        proposal_id=proposal_id,
-        from_world=from_world,
-        to_world=to_world,
+    with span(STAGE_WORLD_READ):
+        src_world = _read_world(examples_dir, from_world)
+        dst_world = _read_world(examples_dir, to_world)
+    with span(STAGE_ARCHIVE):
+        ar_src = archiver.upload_world(src_world)
+        ar_dst = archiver.upload_world(dst_world)
+    with span(STAGE_HISTORY_WRITE):
+        tx = chain.submit_transition(
+            proposal_id=proposal_id,
+            from_world=from_world,
+            to_world=to_world,
+            arweave_from=ar_src,
+            arweave_to=ar_dst,
+            votes_for=result.votes_for,
+            votes_against=result.votes_against,
+            quorum=quorum,
+            signers=["gov_key1", "gov_key2"],
+        )
+    return tx, result
+
+
+async def _archive_and_submit(
+    examples_dir: str,
+    chain: CardanoSimulator,
+    archiver: AsyncArchiverClient,
+    proposal: Proposal,
+    result: VoteResult,
+    previous: Optional[asyncio.Future],
+) -> TransitionTx:
+    import asyncio
+
+    ar_src, ar_dst = await asyncio.gather(
+        archiver.upload_world(_read_world(examples_dir, proposal.from_world)),
+        archiver.upload_world(_read_world(examples_dir, proposal.to_world)),
+    )
+    # History is append-only: keep submissions in proposal order.
+    if previous is not None:
+        await previous
+    return chain.submit_transition(
+        proposal_id=proposal.proposal_id,
+        from_world=proposal.from_world,
+        to_world=proposal.to_world,
         arweave_from=ar_src,
         arweave_to=ar_dst,
         votes_for=result.votes_for,
         votes_against=result.votes_against,
-        quorum=quorum,
+        quorum=proposal.quorum,
         signers=["gov_key1", "gov_key2"],
     )
-    return tx, result
 
 
+async def run_proposals_async(
+    examples_dir: str,
+    proposals: Sequence[Tuple[str, str, str]],
+    quorum: float,
+    threshold: float,
+    rng: random.Random,
+    approval_probability: float,
+    participation_probability: float,
+    voters: Dict[str, Voter],
+    archiver: AsyncArchiverClient,
+) -> List[Tuple[Optional[TransitionTx], VoteResult]]:
+    """Pipelined variant of ``run_single_proposal`` over many proposals.
+
+    Both world uploads of a passed proposal run concurrently and overlap with
+    tallying of the following proposals. Votes consume ``rng`` in proposal
+    order and transactions are submitted in proposal order, so history matches
+    the sequential runner.
+    """
+    import asyncio
+
+    chain = CardanoSimulator(examples_dir)
+    pending: List[Tuple[Optional[asyncio.Future], VoteResult]] = []
+    previous: Optional[asyncio.Future] = None
+    for proposal_id, src, dst in proposals:
+        proposal = Proposal(proposal_id=proposal_id, from_world=src, to_world=dst, quorum=quorum, threshold=threshold)
+        votes = simulate_votes_random(voters, rng, approval_probability=approval_probability, participation_probability=participation_probability)
+        result = evaluate_proposal(proposal, voters, votes)
+        task = None
+        if result.passed:
+            task = asyncio.ensure_future(_archive_and_submit(examples_dir, chain, archiver, proposal, result, previous))
+            previous = task
+        pending.append((task, result))
+        await asyncio.sleep(0)
+    return [((await task) if task is not None else None, result) for task, result in pending]
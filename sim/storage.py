@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .cardano_sim import DEFAULT_ACTIVE, CardanoSimulator, iter_history, now_iso
+from .graph_store import GraphStore
+from .model import World
+
+
+class Storage(ABC):
+    """Backend for worlds, valuation, transaction history and the active-world registry.
+
+    ``GraphStore.load_from_storage``, ``CardanoSimulator(storage=...)``,
+    ``load_worlds_and_valuation(storage=...)`` and ``GovernanceSession`` accept
+    any implementation. ``JsonStorage`` is the loose-file layout under
+    ``examples/``; ``SqliteStorage`` keeps everything in one database file.
+    """
+
+    @property
+    def location(self) -> str:
+        """Identifies where this backend keeps its data (used to key ``GraphStore`` write caches)."""
+        return f"{type(self).__name__}@{id(self):x}"
+
+    @abstractmethod
+    def load_worlds(self) -> Dict[str, World]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_worlds(self, worlds: Iterable[World]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_valuation(self) -> Dict[str, Set[str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_valuation(self, valuation: Dict[str, Iterable[str]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def append_transactions(self, records: List[Dict[str, Any]]) -> None:
+        """Append records and point the active world at the last one."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def tail_history(self, n: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """(total transaction count, last ``n`` records)."""
+        total = 0
+        tail: deque = deque(maxlen=n)
+        for record in self.iter_history():
+            tail.append(record)
+            total += 1
+        return total, list(tail)
+
+    @abstractmethod
+    def read_active(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_active(self, world_id: str, tx_id: Optional[str]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Storage":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class JsonStorage(Storage):
+    """The original layout: ``worlds/*.json``, ``valuation.json``, ``history.json``, ``active_world.json``.
+
+    Appends and the registry update are separate file writes, so they are not atomic together.
+    """
+
+    def __init__(self, examples_dir: str) -> None:
+        self.examples_dir = examples_dir
+        self.worlds_dir = os.path.join(examples_dir, "worlds")
+        self.valuation_path = os.path.join(examples_dir, "valuation.json")
+        self._chain = CardanoSimulator(examples_dir)
+        self.history_path = self._chain.history_path
+        self.active_path = self._chain.active_path
+
+    @property
+    def location(self) -> str:
+        return os.path.abspath(self.worlds_dir)
+
+    def load_worlds(self) -> Dict[str, World]:
+        return GraphStore().load_worlds_from_dir(self.worlds_dir)
+
+    def save_worlds(self, worlds: Iterable[World]) -> None:
+        GraphStore().write_world_jsons(worlds, self.worlds_dir)
+
+    def load_valuation(self) -> Dict[str, Set[str]]:
+        if not os.path.exists(self.valuation_path):
+            return {}
+        with open(self.valuation_path, 'r', encoding='utf-8') as f:
+            return {k: set(v) for k, v in json.load(f).items()}
+
+    def save_valuation(self, valuation: Dict[str, Iterable[str]]) -> None:
+        os.makedirs(self.examples_dir, exist_ok=True)
+        with open(self.valuation_path, 'w', encoding='utf-8') as f:
+            json.dump({k: sorted(v) for k, v in valuation.items()}, f, indent=2)
+
+    def append_transactions(self, records: List[Dict[str, Any]]) -> None:
+        self._chain.append_transactions(records)
+
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        return iter_history(self.history_path)
+
+    def tail_history(self, n: int) -> Tuple[int, List[Dict[str, Any]]]:
+        return self._chain.tail_history(n)
+
+    def read_active(self) -> Dict[str, Any]:
+        return self._chain.read_active()
+
+    def write_active(self, world_id: str, tx_id: Optional[str]) -> None:
+        self._chain._write_active(world_id, tx_id)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS worlds (
+    world_id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS edges (
+    src TEXT NOT NULL,
+    dst TEXT NOT NULL,
+    PRIMARY KEY (src, dst)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS edges_dst ON edges (dst);
+CREATE TABLE IF NOT EXISTS valuation (
+    prop TEXT NOT NULL,
+    world_id TEXT NOT NULL,
+    PRIMARY KEY (prop, world_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS valuation_world ON valuation (world_id);
+CREATE TABLE IF NOT EXISTS transactions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    tx_id TEXT NOT NULL UNIQUE,
+    proposal_id TEXT NOT NULL,
+    from_world TEXT NOT NULL,
+    to_world TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_from ON transactions (from_world);
+CREATE INDEX IF NOT EXISTS transactions_to ON transactions (to_world);
+CREATE INDEX IF NOT EXISTS transactions_proposal ON transactions (proposal_id);
+CREATE INDEX IF NOT EXISTS transactions_timestamp ON transactions (timestamp);
+CREATE TABLE IF NOT EXISTS active (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    active_world TEXT NOT NULL,
+    last_tx TEXT,
+    updated_at TEXT
+);
+"""
+
+
+class SqliteStorage(Storage):
+    """Single-file SQLite backend in WAL mode.
+
+    History appends and the active-world update commit in one transaction, so
+    readers never see a registry pointing at a transaction that is not there.
+    Records are stored whole (``data``) next to indexed columns for queries.
+    The connection may be shared between threads; writes are serialized.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        if os.path.dirname(os.path.abspath(path)):
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def location(self) -> str:
+        return "sqlite:" + os.path.abspath(self.path)
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def load_worlds(self) -> Dict[str, World]:
+        rows = self._conn.execute("SELECT data FROM worlds ORDER BY world_id").fetchall()
+        worlds = (World.from_dict(json.loads(data)) for (data,) in rows)
+        return {w.world_id: w for w in worlds}
+
+    def save_worlds(self, worlds: Iterable[World]) -> None:
+        with self._transaction() as cur:
+            for w in worlds:
+                cur.execute(
+                    "INSERT INTO worlds (world_id, digest, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT (world_id) DO UPDATE SET digest = excluded.digest, data = excluded.data",
+                    (w.world_id, w.digest, w.canonical_bytes.decode("utf-8")),
+                )
+                cur.execute("DELETE FROM edges WHERE src = ?", (w.world_id,))
+                cur.executemany("INSERT OR IGNORE INTO edges (src, dst) VALUES (?, ?)", [(w.world_id, d) for d in w.edges])
+
+    def edges(self) -> List[Tuple[str, str]]:
+        return self._conn.execute("SELECT src, dst FROM edges ORDER BY src, dst").fetchall()
+
+    def load_valuation(self) -> Dict[str, Set[str]]:
+        valuation: Dict[str, Set[str]] = {}
+        for prop, world_id in self._conn.execute("SELECT prop, world_id FROM valuation"):
+            valuation.setdefault(prop, set()).add(world_id)
+        return valuation
+
+    def save_valuation(self, valuation: Dict[str, Iterable[str]]) -> None:
+        with self._transaction() as cur:
+            cur.execute("DELETE FROM valuation")
+            cur.executemany(
+                "INSERT INTO valuation (prop, world_id) VALUES (?, ?)",
+                [(p, w) for p, ws in valuation.items() for w in ws],
+            )
+
+    def append_transactions(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        with self._transaction() as cur:
+            cur.executemany(
+                "INSERT INTO transactions (tx_id, proposal_id, from_world, to_world, timestamp, data) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (r["tx_id"], r["proposal_id"], r["from_world"], r["to_world"], r["timestamp"], json.dumps(r))
+                    for r in records
+                ],
+            )
+            self._set_active(cur, records[-1]["to_world"], records[-1]["tx_id"])
+
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        for (data,) in self._conn.execute("SELECT data FROM transactions ORDER BY seq"):
+            yield json.loads(data)
+
+    def tail_history(self, n: int) -> Tuple[int, List[Dict[str, Any]]]:
+        (total,) = self._conn.execute("SELECT COUNT(*) FROM transactions").fetchone()
+        if n <= 0:
+            return total, []
+        rows = self._conn.execute("SELECT data FROM transactions ORDER BY seq DESC LIMIT ?", (n,)).fetchall()
+        return total, [json.loads(data) for (data,) in reversed(rows)]
+
+    def query_history(
+        self,
+        world: Optional[str] = None,
+        proposal: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Indexed filter over history, in append order (same semantics as ``HistoryIndex.query``)."""
+        clauses, params = [], []
+        if world:
+            clauses.append("(from_world = ? OR to_world = ?)")
+            params += [world, world]
+        if proposal:
+            clauses.append("proposal_id = ?")
+            params.append(proposal)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp <= ?")
+            params.append(until)
+        sql = "SELECT data FROM transactions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq LIMIT ? OFFSET ?"
+        params += [limit if limit is not None else -1, offset]
+        return [json.loads(data) for (data,) in self._conn.execute(sql, params)]
+
+    def read_active(self) -> Dict[str, Any]:
+        row = self._conn.execute("SELECT active_world, last_tx, updated_at FROM active WHERE id = 0").fetchone()
+        if row is None:
+            return dict(DEFAULT_ACTIVE)
+        return {"active_world": row[0], "last_tx": row[1], "updated_at": row[2]}
+
+    def write_active(self, world_id: str, tx_id: Optional[str]) -> None:
+        with self._transaction() as cur:
+            self._set_active(cur, world_id, tx_id)
+
+    @staticmethod
+    def _set_active(cur: sqlite3.Cursor, world_id: str, tx_id: Optional[str]) -> None:
+        cur.execute(
+            "INSERT INTO active (id, active_world, last_tx, updated_at) VALUES (0, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET active_world = excluded.active_world, "
+            "last_tx = excluded.last_tx, updated_at = excluded.updated_at",
+            (world_id, tx_id, now_iso()),
+        )
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` (or ``ROLLBACK`` on error) under the storage's write lock."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.RLock) -> None:
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._lock.acquire()
+        self._cur = self._conn.cursor()
+        self._cur.execute("BEGIN IMMEDIATE")
+        return self._cur
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        try:
+            self._cur.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._lock.release()
+
+
+def copy_storage(src: Storage, dst: Storage) -> int:
+    """Copy worlds, valuation, history and the active world; returns the number of transactions copied."""
+    dst.save_worlds(src.load_worlds().values())
+    dst.save_valuation(src.load_valuation())
+    copied = 0
+    batch: List[Dict[str, Any]] = []
+    for record in src.iter_history():
+        batch.append(record)
+        if len(batch) >= 10_000:
+            dst.append_transactions(batch)
+            copied += len(batch)
+            batch = []
+    dst.append_transactions(batch)
+    copied += len(batch)
+    active = src.read_active()
+    dst.write_active(active["active_world"], active.get("last_tx"))
+    return copied
+
+
+def export_json(storage: Storage, examples_dir: str) -> int:
+    """Write ``storage`` out in the JSON layout (plus ``graph.json``); returns the transaction count."""
+    out = JsonStorage(examples_dir)
+    for path in (out.history_path, out.active_path):
+        if os.path.exists(path):
+            os.remove(path)
+    copied = copy_storage(storage, out)
+    store = GraphStore()
+    store.load_worlds_from_dir(out.worlds_dir)
+    store.save_graph_summary(os.path.join(examples_dir, "graph.json"))
+    return copied
+
+
+def open_storage(location: str) -> Storage:
+    """``*.db``/``*.sqlite``/``*.sqlite3`` files open as SQLite, anything else as a JSON examples directory."""
+    if location.endswith((".db", ".sqlite", ".sqlite3")):
+        return SqliteStorage(location)
+    return JsonStorage(location)
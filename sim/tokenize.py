@@ -1,9 +1,27 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Any, List
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Union
 
-from .model import World
+from .model import World, canonical_json_bytes
+
+# CIP-25 caps every metadata string at 64 bytes; longer values become arrays of chunks.
+CIP25_MAX_STR_BYTES = 64
+# Widest UTF-8 encoding of a single character; chunks can't be smaller.
+_MAX_CHAR_BYTES = 4
+# Transaction metadata labels: 721 carries the assets, ATTRIBUTE_TABLE_LABEL the
+# attribute lists shared by several assets of the same bundle.
+CIP25_LABEL = "721"
+ATTRIBUTE_TABLE_LABEL = "7211"
+# Leaves headroom under the 16 KiB max transaction size for inputs, outputs and witnesses.
+DEFAULT_BUNDLE_BUDGET = 12_000
+ATTRIBUTE_KEYS = ("necessary", "possible", "edges")
+
+_METADATA_CACHE_SIZE = 4096
+# world digest -> canonical metadata encoding, least recently used first
+_metadata_cache: Dict[str, bytes] = {}
 
 
 def cip25_like_metadata(world: World) -> Dict[str, Any]:
@@ -26,9 +44,158 @@ def cip25_like_metadata(world: World) -> Dict[str, Any]:
     }
 
 
+def metadata_bytes(world: World) -> bytes:
+    """Canonical encoding of ``cip25_like_metadata(world)``, memoized by world digest (LRU)."""
+    digest = world.digest
+    cached = _metadata_cache.pop(digest, None)
+    if cached is None:
+        if len(_metadata_cache) >= _METADATA_CACHE_SIZE:
+            del _metadata_cache[next(iter(_metadata_cache))]
+        cached = canonical_json_bytes(cip25_like_metadata(world))
+    _metadata_cache[digest] = cached
+    return cached
+
+
 def write_metadata_json(world: World, outfile: str) -> None:
-    data = cip25_like_metadata(world)
-    with open(outfile, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    with open(outfile, 'wb') as f:
+        f.write(metadata_bytes(world))
+
+
+def chunk_string(value: str, limit: int = CIP25_MAX_STR_BYTES) -> Union[str, List[str]]:
+    """Return ``value`` unchanged if it fits ``limit`` UTF-8 bytes, else a list of chunks.
+
+    Chunks never split a multi-byte character, so ``limit`` must fit the
+    widest one (4 bytes).
+    """
+    if limit < _MAX_CHAR_BYTES:
+        raise ValueError(f"limit must be at least {_MAX_CHAR_BYTES} bytes, got {limit}")
+    data = value.encode("utf-8")
+    if len(data) <= limit:
+        return value
+    chunks: List[str] = []
+    start = 0
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # back off to a character boundary (continuation bytes are 0b10xxxxxx)
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(data[start:end].decode("utf-8"))
+        start = end
+    return chunks
+
+
+@dataclass
+class MintBundle:
+    """Metadata for one minting transaction: assets plus their shared attribute table."""
+
+    policy_id: str
+    assets: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    lists: Dict[str, List[Any]] = field(default_factory=dict)
+    # world_id -> bytes that world added to the encoded bundle (entry + newly shared lists)
+    world_sizes: Dict[str, int] = field(default_factory=dict)
+    size: int = 0
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            CIP25_LABEL: {self.policy_id: self.assets, "version": "2.0"},
+            ATTRIBUTE_TABLE_LABEL: self.lists,
+        }
+
+    def encode(self) -> bytes:
+        return canonical_json_bytes(self.metadata())
+
+
+def _json_len(value: Any) -> int:
+    return len(canonical_json_bytes(value))
+
+
+def _member_len(key: str, value_len: int, existing: int) -> int:
+    """Encoded bytes added by inserting ``"key":value`` into an object with ``existing`` members."""
+    return _json_len(key) + 1 + value_len + (1 if existing else 0)
+
+
+class _BundlePacker:
+    def __init__(self, policy_id: str, chunk_size: int) -> None:
+        self.policy_id = policy_id
+        self.chunk_size = chunk_size
+        self.bundle = MintBundle(policy_id)
+        self.bundle.size = len(self.bundle.encode())
+        self._list_keys: Dict[Tuple[Any, ...], str] = {}
+
+    def plan(self, world: World) -> Tuple[Dict[str, Any], Dict[str, List[Any]], int]:
+        """Asset entry, attribute lists it would add, and its incremental encoded size."""
+        new_lists: Dict[str, List[Any]] = {}
+        refs: Dict[str, str] = {}
+        for name in ATTRIBUTE_KEYS:
+            items = [chunk_string(str(v), self.chunk_size) for v in getattr(world, name)]
+            key = tuple(json.dumps(i) for i in items)
+            ref = self._list_keys.get(key)
+            if ref is None:
+                ref = next((k for k, v in new_lists.items() if v == items), None)
+            if ref is None:
+                ref = f"L{len(self.bundle.lists) + len(new_lists)}"
+                new_lists[ref] = items
+            refs[name] = ref
+        entry = {
+            "name": chunk_string(world.name, self.chunk_size),
+            "description": chunk_string(world.description, self.chunk_size),
+            "image": chunk_string(world.arweave_uri, self.chunk_size),
+            "world_id": chunk_string(world.world_id, self.chunk_size),
+            "created_by": chunk_string(world.created_by, self.chunk_size),
+            "created_at": chunk_string(world.created_at, self.chunk_size),
+            "attributes": refs,
+        }
+        size = _member_len(world.world_id, _json_len(entry), len(self.bundle.assets))
+        existing = len(self.bundle.lists)
+        for ref, items in new_lists.items():
+            size += _member_len(ref, _json_len(items), existing)
+            existing += 1
+        return entry, new_lists, size
+
+    def add(self, world: World, entry: Dict[str, Any], new_lists: Dict[str, List[Any]], size: int) -> None:
+        for ref, items in new_lists.items():
+            self.bundle.lists[ref] = items
+            self._list_keys[tuple(json.dumps(i) for i in items)] = ref
+        self.bundle.assets[world.world_id] = entry
+        self.bundle.world_sizes[world.world_id] = size
+        self.bundle.size += size
+
+
+def pack_minting_bundles(
+    worlds: Iterable[World],
+    policy_id: str,
+    budget_bytes: int = DEFAULT_BUNDLE_BUDGET,
+    chunk_size: int = CIP25_MAX_STR_BYTES,
+) -> Iterator[MintBundle]:
+    """Stream worlds into minting bundles whose encoded metadata fits ``budget_bytes``.
+
+    Worlds are packed greedily in input order; a bundle is yielded as soon as the
+    next world no longer fits. Sizes are tracked incrementally, so packing is
+    linear in the number of worlds. Size is measured on the canonical JSON form,
+    a close upper bound of the CBOR encoding used on chain.
+    """
+    packer = _BundlePacker(policy_id, chunk_size)
+    for world in worlds:
+        entry, new_lists, size = packer.plan(world)
+        if packer.bundle.assets and packer.bundle.size + size > budget_bytes:
+            yield packer.bundle
+            packer = _BundlePacker(policy_id, chunk_size)
+            entry, new_lists, size = packer.plan(world)
+        if packer.bundle.size + size > budget_bytes:
+            raise ValueError(f"World {world.world_id} needs {size} bytes; exceeds bundle budget {budget_bytes}")
+        packer.add(world, entry, new_lists, size)
+    if packer.bundle.assets:
+        yield packer.bundle
 
 
+def write_minting_bundles(bundles: Iterable[MintBundle], outdir: str) -> List[Dict[str, Any]]:
+    """Write ``bundle-NNNNN.json`` files and return a per-world size report."""
+    os.makedirs(outdir, exist_ok=True)
+    report: List[Dict[str, Any]] = []
+    for i, bundle in enumerate(bundles):
+        fname = f"bundle-{i:05d}.json"
+        with open(os.path.join(outdir, fname), 'wb') as f:
+            f.write(bundle.encode())
+        for world_id, size in bundle.world_sizes.items():
+            report.append({"world_id": world_id, "bundle": fname, "bytes": size, "bundle_bytes": bundle.size})
+    return report
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .model import KripkeModel, Transition, World
+
+# --- persistent map ---------------------------------------------------------
+#
+# A hash array mapped trie: 32-way nodes indexed by 5-bit slices of the key's
+# hash, with a bitmap so absent slots take no space. ``set``/``delete`` copy
+# only the nodes on the path to the key (O(log32 n)) and share the rest.
+
+_SHIFT = 5
+_MASK = 31
+_HASH_BITS = 64
+_MISSING = object()
+
+
+class _Leaf:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, h: int, key: Any, value: Any) -> None:
+        self.hash = h
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+    """Keys whose full hashes are equal."""
+
+    __slots__ = ("hash", "pairs")
+
+    def __init__(self, h: int, pairs: Tuple[Tuple[Any, Any], ...]) -> None:
+        self.hash = h
+        self.pairs = pairs
+
+
+class _Node:
+    __slots__ = ("bitmap", "array")
+
+    def __init__(self, bitmap: int, array: tuple) -> None:
+        self.bitmap = bitmap
+        self.array = array
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & ((1 << _HASH_BITS) - 1)
+
+
+def _merge(a: Any, b: _Leaf, shift: int) -> Any:
+    """Node holding entry ``a`` (leaf or collision) and leaf ``b`` with a different key."""
+    if a.hash == b.hash:
+        pairs = ((a.key, a.value),) if type(a) is _Leaf else a.pairs
+        return _Collision(a.hash, pairs + ((b.key, b.value),))
+    ia = (a.hash >> shift) & _MASK
+    ib = (b.hash >> shift) & _MASK
+    if ia == ib:
+        return _Node(1 << ia, (_merge(a, b, shift + _SHIFT),))
+    first, second = (a, b) if ia < ib else (b, a)
+    return _Node((1 << ia) | (1 << ib), (first, second))
+
+
+def _node_get(node: _Node, h: int, key: Any) -> Any:
+    shift = 0
+    while True:
+        bit = 1 << ((h >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+        entry = node.array[(node.bitmap & (bit - 1)).bit_count()]
+        kind = type(entry)
+        if kind is _Node:
+            node = entry
+            shift += _SHIFT
+        elif kind is _Leaf:
+            return entry.value if entry.key == key else _MISSING
+        else:
+            for k, v in entry.pairs:
+                if k == key:
+                    return v
+            return _MISSING
+
+
+def _node_set(node: _Node, h: int, key: Any, value: Any, shift: int) -> Tuple[_Node, bool]:
+    """(new node, whether a key was added)."""
+    bit = 1 << ((h >> shift) & _MASK)
+    idx = (node.bitmap & (bit - 1)).bit_count()
+    array = node.array
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, array[:idx] + (_Leaf(h, key, value),) + array[idx:]), True
+    entry = array[idx]
+    kind = type(entry)
+    if kind is _Node:
+        child, added = _node_set(entry, h, key, value, shift + _SHIFT)
+        if child is entry:
+            return node, False
+    elif kind is _Leaf:
+        if entry.key == key:
+            if entry.value is value:
+                return node, False
+            child, added = _Leaf(h, key, value), False
+        else:
+            child, added = _merge(entry, _Leaf(h, key, value), shift + _SHIFT), True
+    elif entry.hash == h:
+        pairs = tuple(p for p in entry.pairs if p[0] != key)
+        added = len(pairs) == len(entry.pairs)
+        child = _Collision(h, pairs + ((key, value),))
+    else:
+        child, added = _merge(entry, _Leaf(h, key, value), shift + _SHIFT), True
+    return _Node(node.bitmap, array[:idx] + (child,) + array[idx + 1:]), added
+
+
+def _node_delete(node: _Node, h: int, key: Any, shift: int) -> Optional[_Node]:
+    """New node without ``key`` (``node`` itself if absent, ``None`` if it became empty)."""
+    bit = 1 << ((h >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    idx = (node.bitmap & (bit - 1)).bit_count()
+    entry = node.array[idx]
+    kind = type(entry)
+    if kind is _Node:
+        child = _node_delete(entry, h, key, shift + _SHIFT)
+        if child is entry:
+            return node
+    elif kind is _Leaf:
+        if entry.key != key:
+            return node
+        child = None
+    else:
+        pairs = tuple(p for p in entry.pairs if p[0] != key)
+        if len(pairs) == len(entry.pairs):
+            return node
+        child = _Leaf(h, *pairs[0]) if len(pairs) == 1 else _Collision(h, pairs)
+    if child is None:
+        if node.bitmap == bit:
+            return None
+        return _Node(node.bitmap & ~bit, node.array[:idx] + node.array[idx + 1:])
+    return _Node(node.bitmap, node.array[:idx] + (child,) + node.array[idx + 1:])
+
+
+def _node_items(node: _Node) -> Iterator[Tuple[Any, Any]]:
+    for entry in node.array:
+        kind = type(entry)
+        if kind is _Node:
+            yield from _node_items(entry)
+        elif kind is _Leaf:
+            yield entry.key, entry.value
+        else:
+            yield from entry.pairs
+
+
+class PMap:
+    """Immutable mapping; ``set``/``delete`` return a new map sharing structure with this one."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: _Node = _EMPTY_NODE, size: int = 0) -> None:
+        self._root = root
+        self._size = size
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[Any, Any]]) -> "PMap":
+        m = cls()
+        for k, v in items:
+            m = m.set(k, v)
+        return m
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Any) -> bool:
+        return _node_get(self._root, _hash(key), key) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = _node_get(self._root, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return (k for k, _ in _node_items(self._root))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = _node_get(self._root, _hash(key), key)
+        return default if value is _MISSING else value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        return _node_items(self._root)
+
+    def set(self, key: Any, value: Any) -> "PMap":
+        root, added = _node_set(self._root, _hash(key), key, value, 0)
+        if root is self._root:
+            return self
+        return PMap(root, self._size + added)
+
+    def delete(self, key: Any) -> "PMap":
+        root = _node_delete(self._root, _hash(key), key, 0)
+        if root is self._root:
+            return self
+        return PMap(root if root is not None else _EMPTY_NODE, self._size - 1)
+
+
+# --- versioned Kripke frame -------------------------------------------------
+
+_EMPTY: frozenset = frozenset()
+
+
+class FrameVersion:
+    """One immutable version of the Kripke frame, valuation and active world.
+
+    Successors and true propositions are stored per world, so changing one
+    world copies only that world's entry plus an O(log n) trie path; every
+    other world is shared with the parent version. Modal operators follow
+    ``KripkeModel``'s conventions.
+    """
+
+    __slots__ = ("version", "worlds", "succ", "labels", "active_world", "tx_id", "note")
+
+    def __init__(
+        self,
+        version: int,
+        worlds: PMap,
+        succ: PMap,
+        labels: PMap,
+        active_world: str,
+        tx_id: Optional[str] = None,
+        note: str = "",
+    ) -> None:
+        self.version = version
+        self.worlds = worlds
+        self.succ = succ
+        self.labels = labels
+        self.active_world = active_world
+        self.tx_id = tx_id
+        self.note = note
+
+    @classmethod
+    def from_model(cls, model: KripkeModel, active_world: str = "w1") -> "FrameVersion":
+        labels: Dict[str, Set[str]] = {}
+        for prop, ws in model.valuation.items():
+            for w in ws:
+                labels.setdefault(w, set()).add(prop)
+        return cls(
+            0,
+            PMap.from_items(model.worlds.items()),
+            PMap.from_items((w, frozenset(s)) for w, s in model.relations.items()),
+            PMap.from_items((w, frozenset(ps)) for w, ps in labels.items()),
+            active_world,
+        )
+
+    # queries
+
+    def successors(self, world_id: str) -> frozenset:
+        return self.succ.get(world_id, _EMPTY)
+
+    def is_true(self, prop: str, world_id: str) -> bool:
+        return prop in self.labels.get(world_id, _EMPTY)
+
+    def is_necessary(self, prop: str, world_id: str) -> bool:
+        return all(prop in self.labels.get(w, _EMPTY) for w in self.successors(world_id))
+
+    def is_possible(self, prop: str, world_id: str) -> bool:
+        return any(prop in self.labels.get(w, _EMPTY) for w in self.successors(world_id))
+
+    def descendants(self, world_id: str) -> Set[str]:
+        """Worlds reachable from ``world_id`` in one or more steps."""
+        seen: Set[str] = set()
+        queue = deque(self.successors(world_id))
+        while queue:
+            w = queue.popleft()
+            if w not in seen:
+                seen.add(w)
+                queue.extend(self.successors(w) - seen)
+        return seen
+
+    def reachable(self, src: str, dst: str) -> bool:
+        return dst in self.descendants(src)
+
+    def edges(self) -> List[Transition]:
+        return [Transition(u, v) for u, vs in self.succ.items() for v in sorted(vs)]
+
+    def to_model(self) -> KripkeModel:
+        """Materialize as a mutable ``KripkeModel`` (O(size of the frame))."""
+        valuation: Dict[str, Set[str]] = {}
+        for w, props in self.labels.items():
+            for p in props:
+                valuation.setdefault(p, set()).add(w)
+        return KripkeModel(dict(self.worlds.items()), self.edges(), valuation)
+
+    # updates
+
+    def evolve(
+        self,
+        active_world: Optional[str] = None,
+        tx_id: Optional[str] = None,
+        add_worlds: Iterable[World] = (),
+        add_edges: Iterable[Tuple[str, str]] = (),
+        remove_edges: Iterable[Tuple[str, str]] = (),
+        set_true: Iterable[Tuple[str, str]] = (),
+        set_false: Iterable[Tuple[str, str]] = (),
+        note: str = "",
+    ) -> "FrameVersion":
+        """Next version with the given changes; cost is proportional to the changes.
+
+        ``set_true``/``set_false`` take ``(prop, world_id)`` pairs. Edges and
+        labels must refer to known worlds (including worlds added in the same call).
+        An added world's own ``edges`` are added like ``add_edges``.
+        """
+        worlds, succ, labels = self.worlds, self.succ, self.labels
+        add_worlds = list(add_worlds)
+        for w in add_worlds:
+            worlds = worlds.set(w.world_id, w)
+            if w.world_id not in succ:
+                succ = succ.set(w.world_id, _EMPTY)
+        declared = [(w.world_id, dst) for w in add_worlds for dst in w.edges]
+        for src, dst in declared + list(add_edges):
+            if src not in worlds or dst not in worlds:
+                raise ValueError(f"Unknown world in transition {Transition(src, dst)}")
+            succ = succ.set(src, succ.get(src, _EMPTY) | {dst})
+        for src, dst in remove_edges:
+            if src not in worlds or dst not in worlds:
+                raise ValueError(f"Unknown world in transition {Transition(src, dst)}")
+            succ = succ.set(src, succ.get(src, _EMPTY) - {dst})
+        for prop, w in set_true:
+            if w not in worlds:
+                raise ValueError(f"Unknown world {w} for proposition {prop}")
+            labels = labels.set(w, labels.get(w, _EMPTY) | {prop})
+        for prop, w in set_false:
+            if w not in worlds:
+                raise ValueError(f"Unknown world {w} for proposition {prop}")
+            labels = labels.set(w, labels.get(w, _EMPTY) - {prop})
+        active = active_world if active_world is not None else self.active_world
+        if active not in worlds:
+            raise ValueError(f"Unknown active world {active}")
+        return FrameVersion(self.version + 1, worlds, succ, labels, active, tx_id, note)
+
+
+class FrameHistory:
+    """Append-only sequence of ``FrameVersion``s; every version stays queryable."""
+
+    def __init__(self, initial: FrameVersion) -> None:
+        self.versions: List[FrameVersion] = [initial]
+
+    @classmethod
+    def from_model(cls, model: KripkeModel, active_world: str = "w1") -> "FrameHistory":
+        return cls(FrameVersion.from_model(model, active_world))
+
+    @property
+    def head(self) -> FrameVersion:
+        return self.versions[-1]
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __getitem__(self, version: int) -> FrameVersion:
+        return self.versions[version]
+
+    def commit(self, **changes: Any) -> FrameVersion:
+        """Append ``head.evolve(**changes)`` and return it."""
+        version = self.head.evolve(**changes)
+        self.versions.append(version)
+        return version
+
+    def apply_transition(self, record: Dict[str, Any], **amendments: Any) -> FrameVersion:
+        """New version for a passed transition record (a history entry), plus optional amendments."""
+        return self.commit(active_world=record["to_world"], tx_id=record["tx_id"], note=record.get("proposal_id", ""), **amendments)
@@ -1,59 +1,407 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from typing import Dict, Any, List
+import random
+import tempfile
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Deque, Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 from io import BytesIO
 
-import matplotlib.pyplot as plt
-import networkx as nx
+from .cardano_sim import iter_history
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+# matplotlib and networkx are imported inside the functions that draw or lay
+# out graphs, so importing this module stays cheap for non-plotting callers.
+
+Position = Tuple[float, float]
+
+# Above this many nodes, "auto" switches from spring to spectral layout and
+# incremental updates stop re-running the force simulation.
+LARGE_GRAPH_NODES = 500
+INCREMENTAL_ITERATIONS = 15
+# Reuse the previous layout as a seed if at least this share of nodes survived.
+INCREMENTAL_MIN_OVERLAP = 0.5
+LAYOUT_ALGORITHMS = ("auto", "spring", "spectral")
+# Layouts kept per cache (in memory and on disk); least recently used go first.
+LAYOUT_CACHE_MAX_ENTRIES = 64
+
+
+def graph_fingerprint(G: nx.DiGraph) -> str:
+    """Structural hash of a graph (node ids and edges, order-independent)."""
+    nodes = sorted(str(n) for n in G.nodes())
+    edges = sorted((str(u), str(v)) for u, v in G.edges())
+    return hashlib.sha256(json.dumps([nodes, edges]).encode("utf-8")).hexdigest()
+
+
+class LayoutCache:
+    """Node positions keyed by layout algorithm and graph fingerprint, persisted as JSON.
+
+    Also remembers the most recent layout so a slightly changed graph can be
+    laid out incrementally from it. ``cache_dir=None`` keeps everything in memory.
+    Files are replaced atomically, so concurrent writers never leave a torn layout.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = LAYOUT_CACHE_MAX_ENTRIES) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._layouts: Dict[str, Dict[str, Position]] = {}
+        self._latest: Optional[Dict[str, Position]] = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict[str, Position]]:
+        pos = self._layouts.pop(key, None)
+        if pos is None and self.cache_dir:
+            path = os.path.join(self.cache_dir, f"{key}.json")
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    pos = {n: tuple(xy) for n, xy in json.load(f).items()}
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+        if pos is not None:
+            self._layouts[key] = pos
+            self._evict_memory()
+        return pos
+
+    def put(self, key: str, pos: Dict[str, Position]) -> None:
+        self._layouts.pop(key, None)
+        self._layouts[key] = pos
+        self._latest = pos
+        self._evict_memory()
+        if self.cache_dir:
+            data = {str(n): [float(x), float(y)] for n, (x, y) in pos.items()}
+            self._write(f"{key}.json", data)
+            self._write("latest.json", data)
+            self._evict_disk()
+
+    def _write(self, name: str, data: Dict[str, List[float]]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, os.path.join(self.cache_dir, name))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _evict_memory(self) -> None:
+        while len(self._layouts) > self.max_entries:
+            del self._layouts[next(iter(self._layouts))]
+
+    def _evict_disk(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json") and entry.name != "latest.json":
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    pass
+        entries.sort()
+        for _, path in entries[:max(len(entries) - self.max_entries, 0)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # another process evicted it first
+
+    def latest(self) -> Optional[Dict[str, Position]]:
+        if self._latest is None and self.cache_dir:
+            path = os.path.join(self.cache_dir, "latest.json")
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._latest = {n: tuple(xy) for n, xy in json.load(f).items()}
+        return self._latest
+
+
+def _full_layout(G: nx.DiGraph, algorithm: str) -> Dict[Any, Any]:
+    import networkx as nx
+
+    if algorithm == "spectral" and G.number_of_nodes() > 2:
+        return nx.spectral_layout(G)
+    return nx.spring_layout(G, seed=7)
+
+
+def _seed_positions(G: nx.DiGraph, previous: Dict[str, Position]) -> Dict[Any, Position]:
+    """Keep surviving nodes in place; put new ones next to their placed neighbours."""
+    import networkx as nx
+
+    rng = random.Random(7)
+    pos: Dict[Any, Position] = {n: previous[str(n)] for n in G.nodes() if str(n) in previous}
+    for n in G.nodes():
+        if n in pos:
+            continue
+        placed = [pos[m] for m in nx.all_neighbors(G, n) if m in pos]
+        if placed:
+            cx = sum(p[0] for p in placed) / len(placed)
+            cy = sum(p[1] for p in placed) / len(placed)
+        else:
+            cx = cy = 0.0
+        pos[n] = (cx + rng.uniform(-0.05, 0.05), cy + rng.uniform(-0.05, 0.05))
+    return pos
+
+
+def compute_layout(
+    G: nx.DiGraph,
+    cache: Optional[LayoutCache] = None,
+    algorithm: str = "auto",
+) -> Dict[Any, Position]:
+    """Node positions for ``G``, reused from ``cache`` when the structure is unchanged.
+
+    ``algorithm`` is ``spring`` (force-directed), ``spectral`` (fast, for large
+    graphs) or ``auto`` (spring up to ``LARGE_GRAPH_NODES`` nodes). When the
+    graph changed only a little since the cache's latest layout, the old
+    positions seed the new layout: small graphs get a short spring refinement,
+    large graphs only place the new nodes.
+    """
+    import networkx as nx
+
+    if algorithm not in LAYOUT_ALGORITHMS:
+        raise ValueError(f"Unknown layout algorithm {algorithm!r}")
+    large = G.number_of_nodes() > LARGE_GRAPH_NODES
+    if algorithm == "auto":
+        algorithm = "spectral" if large else "spring"
+    key = f"{algorithm}-{graph_fingerprint(G)[:24]}"
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return {n: cached[str(n)] for n in G.nodes()}
+    previous = cache.latest() if cache is not None else None
+    overlap = sum(1 for n in G.nodes() if str(n) in previous) if previous else 0
+    if G.number_of_nodes() and overlap >= INCREMENTAL_MIN_OVERLAP * G.number_of_nodes():
+        pos = _seed_positions(G, previous)
+        if not large:
+            pos = nx.spring_layout(G, pos=pos, iterations=INCREMENTAL_ITERATIONS, seed=7)
+    else:
+        pos = _full_layout(G, algorithm)
+    pos = {n: (float(xy[0]), float(xy[1])) for n, xy in pos.items()}
+    if cache is not None:
+        cache.put(key, pos)
+    return pos
+
+
+def _plot_graph(G: nx.DiGraph, pos: Dict[Any, Position], active_world: str, labels: Dict[str, str]) -> None:
+    import matplotlib.pyplot as plt
+    import networkx as nx
 
-def draw_graph_png(G: nx.DiGraph, active_world: str, labels: Dict[str, str], outfile: str) -> None:
-    pos = nx.spring_layout(G, seed=7)
     plt.figure(figsize=(8, 6))
     node_colors = ["#ffcc00" if n == active_world else "#87ceeb" for n in G.nodes()]
     nx.draw(G, pos, with_labels=False, node_color=node_colors, arrows=True, arrowstyle='-|>')
     nx.draw_networkx_labels(G, pos, labels={n: labels.get(n, n) for n in G.nodes()}, font_size=8)
     plt.tight_layout()
+
+
+def draw_graph_png(
+    G: nx.DiGraph,
+    active_world: str,
+    labels: Dict[str, str],
+    outfile: str,
+    layout_cache: Optional[LayoutCache] = None,
+    algorithm: str = "auto",
+) -> None:
+    import matplotlib.pyplot as plt
+
+    _plot_graph(G, compute_layout(G, layout_cache, algorithm), active_world, labels)
     os.makedirs(os.path.dirname(outfile), exist_ok=True)
     plt.savefig(outfile)
     plt.close()
 
 
-def draw_timeline(history_path: str, outfile: str) -> None:
-    if not os.path.exists(history_path):
-        return
-    with open(history_path, 'r', encoding='utf-8') as f:
-        history = json.load(f)
-    if not history:
-        return
-    world_ids: List[str] = sorted(list({h["from_world"] for h in history} | {h["to_world"] for h in history}))
-    world_index: Dict[str, int] = {w: i for i, w in enumerate(world_ids)}
-    xs = list(range(len(history)))
-    ys = [world_index[h["to_world"]] for h in history]
-    labels = [h["to_world"] for h in history]
+def graph_png_bytes(
+    G: nx.DiGraph,
+    active_world: str,
+    labels: Dict[str, str],
+    layout_cache: Optional[LayoutCache] = None,
+    algorithm: str = "auto",
+) -> bytes:
+    import matplotlib.pyplot as plt
 
-    plt.figure(figsize=(9, 3))
-    plt.plot(xs, ys, marker='o')
-    for i, lbl in enumerate(labels):
-        plt.annotate(lbl, (xs[i], ys[i]), textcoords="offset points", xytext=(0, 8), ha='center', fontsize=8)
-    plt.yticks(list(world_index.values()), list(world_index.keys()))
-    plt.xlabel("Transition #")
-    plt.ylabel("World")
-    plt.title("Transition Timeline")
-    plt.tight_layout()
-    os.makedirs(os.path.dirname(outfile), exist_ok=True)
-    plt.savefig(outfile)
+    _plot_graph(G, compute_layout(G, layout_cache, algorithm), active_world, labels)
+    buf = BytesIO()
+    plt.savefig(buf, format='png')
     plt.close()
+    return buf.getvalue()
+
+
+# Level-of-detail rendering: clusters collapse into super-nodes once the graph
+# is too large to draw every world.
+LOD_MAX_NODES = 150
+LOD_MAX_EDGES = 400
+CLUSTER_PREFIX = "cluster:"
+# Neighbours of the active world beyond its share of the node budget collapse into this super-node.
+NEIGHBOURS_CLUSTER = f"{CLUSTER_PREFIX}neighbours"
+
+
+@dataclass
+class LodView:
+    """Collapsed view of a graph: ``graph`` is what gets drawn.
 
+    Super-nodes are named ``cluster:<smallest member id>`` and carry a ``count``
+    node attribute; ``clusters`` maps every cluster id to its members so a UI
+    can offer drill-down.
+    """
 
-def graph_png_bytes(G: nx.DiGraph, active_world: str, labels: Dict[str, str]) -> bytes:
-    pos = nx.spring_layout(G, seed=7)
+    graph: nx.DiGraph
+    clusters: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def graph_clusters(G: nx.DiGraph, max_clusters: int = LOD_MAX_NODES, method: str = "auto") -> Dict[str, List[str]]:
+    """Partition worlds into SCCs, or communities when SCCs alone are too many.
+
+    ``method`` is ``scc``, ``community`` or ``auto``. In ``auto`` mode an SCC
+    with more than ``max_clusters`` worlds (a cyclic frame is often a single
+    one) is split into communities of its own subgraph.
+    """
+    import networkx as nx
+
+    groups: Iterable[Iterable[Any]] = []
+    if method in ("scc", "auto"):
+        groups = list(nx.strongly_connected_components(G))
+    if method == "auto":
+        split: List[Iterable[Any]] = []
+        for group in groups:
+            if len(group) > max_clusters:
+                split.extend(nx.community.louvain_communities(G.subgraph(group).to_undirected(), seed=7))
+            else:
+                split.append(group)
+        groups = split
+    if method == "community" or (method == "auto" and len(groups) > max_clusters):
+        groups = nx.community.louvain_communities(G.to_undirected(as_view=True), seed=7)
+    clusters: Dict[str, List[str]] = {}
+    for group in groups:
+        members = sorted(group, key=str)
+        clusters[f"{CLUSTER_PREFIX}{members[0]}"] = members
+    return clusters
+
+
+def build_lod_view(
+    G: nx.DiGraph,
+    active_world: str,
+    max_nodes: int = LOD_MAX_NODES,
+    max_edges: int = LOD_MAX_EDGES,
+    method: str = "auto",
+    clusters: Optional[Dict[str, List[str]]] = None,
+) -> LodView:
+    """Collapse ``G`` to at most ``max_nodes`` nodes and ``max_edges`` edges.
+
+    Graphs within the budget are shown as-is. Otherwise the active world and
+    up to half the budget of its direct neighbours (successors first) are
+    shown individually, further neighbours collapse into ``cluster:neighbours``
+    and the remaining clusters become super-nodes; if those are still too
+    many, the smallest are merged into a single ``cluster:other`` node. Edges are aggregated with a
+    ``weight`` count and only the heaviest ``max_edges`` are kept.
+    """
+    import networkx as nx
+
+    shown: Set[Any] = set()
+    hidden_neighbours: List[Any] = []
+    if G.number_of_nodes() <= max_nodes:
+        shown = set(G.nodes())
+        clusters = {}
+    else:
+        if clusters is None:
+            clusters = graph_clusters(G, max_nodes, method)
+        if active_world in G:
+            successors = set(G.successors(active_world))
+            neighbours = sorted(
+                (successors | set(G.predecessors(active_world))) - {active_world},
+                key=lambda n: (n not in successors, str(n)),
+            )
+            limit = max(max_nodes // 2 - 1, 0)
+            shown = {active_world, *neighbours[:limit]}
+            hidden_neighbours = neighbours[limit:]
+
+    owner: Dict[Any, Any] = {}
+    counts: Dict[str, int] = {}
+    for cid, members in clusters.items():
+        for m in members:
+            if m in shown:
+                owner[m] = m
+            else:
+                owner[m] = cid
+                counts[cid] = counts.get(cid, 0) + 1
+    if hidden_neighbours:
+        clusters = dict(clusters)
+        clusters[NEIGHBOURS_CLUSTER] = sorted(hidden_neighbours, key=str)
+        for m in hidden_neighbours:
+            counts[owner[m]] -= 1
+            if not counts[owner[m]]:
+                del counts[owner[m]]
+            owner[m] = NEIGHBOURS_CLUSTER
+    budget = max(max_nodes - len(shown) - (1 if hidden_neighbours else 0), 1)
+    if len(counts) > budget:
+        ranked = sorted(counts, key=lambda c: (-counts[c], c))
+        overflow = set(ranked[budget - 1:])
+        other = f"{CLUSTER_PREFIX}other"
+        counts[other] = sum(counts.pop(c) for c in overflow)
+        clusters = dict(clusters)
+        clusters[other] = sorted((m for c in overflow for m in clusters[c]), key=str)
+        for m, o in owner.items():
+            if o in overflow:
+                owner[m] = other
+
+    H = nx.DiGraph()
+    for n in shown:
+        H.add_node(n, count=1)
+    for cid, count in counts.items():
+        H.add_node(cid, count=count)
+    if hidden_neighbours:
+        H.add_node(NEIGHBOURS_CLUSTER, count=len(hidden_neighbours))
+    weights: Dict[Tuple[Any, Any], int] = {}
+    for u, v in G.edges():
+        a, b = owner.get(u, u), owner.get(v, v)
+        if a != b:
+            weights[(a, b)] = weights.get((a, b), 0) + 1
+    heaviest = sorted(weights.items(), key=lambda kv: (-kv[1], str(kv[0])))[:max_edges]
+    H.add_weighted_edges_from((a, b, w) for (a, b), w in heaviest)
+    return LodView(graph=H, clusters=clusters)
+
+
+def drill_down(G: nx.DiGraph, view: LodView, cluster_id: str, active_world: str, **kwargs: Any) -> LodView:
+    """LOD view of one cluster's induced subgraph.
+
+    Clusters that still exceed the node budget are split into communities,
+    since an SCC cluster would otherwise collapse back into itself.
+    """
+    members = view.clusters.get(cluster_id)
+    if members is None:
+        raise KeyError(f"Unknown cluster {cluster_id!r}")
+    kwargs.setdefault("method", "community")
+    return build_lod_view(G.subgraph(members), active_world, **kwargs)
+
+
+def lod_graph_png_bytes(
+    view: LodView,
+    active_world: str,
+    labels: Dict[str, str],
+    layout_cache: Optional[LayoutCache] = None,
+) -> bytes:
+    """Render a ``LodView``; cost depends only on the collapsed graph size."""
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    H = view.graph
+    pos = compute_layout(H, layout_cache, "spring")
     plt.figure(figsize=(8, 6))
-    node_colors = ["#ffcc00" if n == active_world else "#87ceeb" for n in G.nodes()]
-    nx.draw(G, pos, with_labels=False, node_color=node_colors, arrows=True, arrowstyle='-|>')
-    nx.draw_networkx_labels(G, pos, labels={n: labels.get(n, n) for n in G.nodes()}, font_size=8)
+    nodes = list(H.nodes())
+    sizes = [120 + 80 * (H.nodes[n].get("count", 1) ** 0.5) for n in nodes]
+    colors = [
+        "#ffcc00" if n == active_world else ("#b0b0b0" if str(n).startswith(CLUSTER_PREFIX) else "#87ceeb")
+        for n in nodes
+    ]
+    nx.draw_networkx_nodes(H, pos, nodelist=nodes, node_size=sizes, node_color=colors)
+    widths = [min(0.5 + 0.5 * d.get("weight", 1) ** 0.5, 6.0) for _, _, d in H.edges(data=True)]
+    nx.draw_networkx_edges(H, pos, width=widths, arrows=True, arrowstyle='-|>', node_size=sizes, nodelist=nodes)
+    node_labels = {
+        n: (f"{n[len(CLUSTER_PREFIX):]} ({H.nodes[n]['count']})" if str(n).startswith(CLUSTER_PREFIX) else labels.get(n, n))
+        for n in nodes
+    }
+    nx.draw_networkx_labels(H, pos, labels=node_labels, font_size=7)
+    plt.axis("off")
     plt.tight_layout()
     buf = BytesIO()
     plt.savefig(buf, format='png')
@@ -61,31 +409,128 @@ def graph_png_bytes(G: nx.DiGraph, active_world: str, labels: Dict[str, str]) ->
     return buf.getvalue()
 
 
-def timeline_png_bytes(history_path: str) -> bytes:
-    if not os.path.exists(history_path):
-        return b""
-    with open(history_path, 'r', encoding='utf-8') as f:
-        history = json.load(f)
-    if not history:
-        return b""
-    world_ids: List[str] = sorted(list({h["from_world"] for h in history} | {h["to_world"] for h in history}))
+# Timeline: plotted points are capped at roughly one per horizontal pixel, and
+# per-point labels are only drawn while they stay legible.
+TIMELINE_MAX_POINTS = 900
+TIMELINE_ANNOTATE_MAX = 60
+TIMELINE_MARKERS_MAX = 300
+
+
+@dataclass
+class TimelineSeries:
+    """Transition indices (``xs``) and destination-world rows (``ys``) to plot."""
+
+    xs: List[int]
+    ys: List[int]
+    world_ids: List[str]
+    total: int
+
+
+def downsample_minmax(xs: List[int], ys: List[int], max_points: int) -> Tuple[List[int], List[int]]:
+    """Shape-preserving downsampling: first, min, max and last point of each x-bucket.
+
+    Keeps every spike (each visited world stays visible) with at most
+    ``max_points`` points.
+    """
+    n = len(xs)
+    if n <= max_points:
+        return list(xs), list(ys)
+    buckets = max(max_points // 4, 1)
+    keep: List[int] = []
+    for b in range(buckets):
+        lo, hi = b * n // buckets, (b + 1) * n // buckets
+        if lo >= hi:
+            continue
+        window = range(lo, hi)
+        i_min = min(window, key=ys.__getitem__)
+        i_max = max(window, key=ys.__getitem__)
+        keep.extend(sorted({lo, i_min, i_max, hi - 1}))
+    return [xs[i] for i in keep], [ys[i] for i in keep]
+
+
+def timeline_series(
+    history: Union[str, Iterable[Dict[str, Any]]],
+    last_n: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_points: int = TIMELINE_MAX_POINTS,
+) -> Optional[TimelineSeries]:
+    """Stream history (a ``history.json`` path or records) into a downsampled series, optionally windowed.
+
+    ``last_n`` keeps the most recent N transitions; ``since``/``until`` bound the
+    ISO-8601 timestamps (inclusive). Returns None when nothing is selected.
+    """
+    window: Deque[Tuple[int, str]] = deque(maxlen=last_n) if last_n else deque()
+    seen: Set[str] = set()
+    records = iter_history(history) if isinstance(history, str) else history
+    for i, h in enumerate(records):
+        ts = h.get("timestamp", "")
+        if (since and ts < since) or (until and ts > until):
+            continue
+        window.append((i, h["to_world"]))
+        seen.add(h["from_world"])
+        seen.add(h["to_world"])
+    if not window:
+        return None
+    world_ids = sorted(seen)
     world_index: Dict[str, int] = {w: i for i, w in enumerate(world_ids)}
-    xs = list(range(len(history)))
-    ys = [world_index[h["to_world"]] for h in history]
-    labels = [h["to_world"] for h in history]
+    xs = [i for i, _ in window]
+    ys = [world_index[w] for _, w in window]
+    total = len(xs)
+    xs, ys = downsample_minmax(xs, ys, max_points)
+    return TimelineSeries(xs=xs, ys=ys, world_ids=world_ids, total=total)
+
+
+def _plot_timeline(series: TimelineSeries) -> None:
+    import matplotlib.pyplot as plt
 
     plt.figure(figsize=(9, 3))
-    plt.plot(xs, ys, marker='o')
-    for i, lbl in enumerate(labels):
-        plt.annotate(lbl, (xs[i], ys[i]), textcoords="offset points", xytext=(0, 8), ha='center', fontsize=8)
-    plt.yticks(list(world_index.values()), list(world_index.keys()))
+    marker = 'o' if len(series.xs) <= TIMELINE_MARKERS_MAX else None
+    plt.plot(series.xs, series.ys, marker=marker, linewidth=1 if marker is None else 1.5)
+    if len(series.xs) <= TIMELINE_ANNOTATE_MAX:
+        for x, y in zip(series.xs, series.ys):
+            plt.annotate(series.world_ids[y], (x, y), textcoords="offset points", xytext=(0, 8), ha='center', fontsize=8)
+    plt.yticks(list(range(len(series.world_ids))), series.world_ids)
     plt.xlabel("Transition #")
     plt.ylabel("World")
-    plt.title("Transition Timeline")
+    title = "Transition Timeline"
+    if len(series.xs) < series.total:
+        title += f" ({series.total} transitions, downsampled)"
+    plt.title(title)
     plt.tight_layout()
+
+
+def draw_timeline(
+    history_path: str,
+    outfile: str,
+    last_n: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> None:
+    import matplotlib.pyplot as plt
+
+    series = timeline_series(history_path, last_n=last_n, since=since, until=until)
+    if series is None:
+        return
+    _plot_timeline(series)
+    os.makedirs(os.path.dirname(outfile), exist_ok=True)
+    plt.savefig(outfile)
+    plt.close()
+
+
+def timeline_png_bytes(
+    history: Union[str, Iterable[Dict[str, Any]]],
+    last_n: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> bytes:
+    import matplotlib.pyplot as plt
+
+    series = timeline_series(history, last_n=last_n, since=since, until=until)
+    if series is None:
+        return b""
+    _plot_timeline(series)
     buf = BytesIO()
     plt.savefig(buf, format='png')
     plt.close()
     return buf.getvalue()
-
-
@@ -52,6 +52,16 @@ def evaluate_proposal(
     votes: Dict[str, bool],
 ) -> VoteResult:
     votes_for, votes_against, total_weight = tally_votes(votes, voters)
+    return result_from_tally(proposal, votes_for, votes_against, total_weight)
+
+
+def result_from_tally(
+    proposal: Proposal,
+    votes_for: int,
+    votes_against: int,
+    total_weight: int,
+) -> VoteResult:
+    """Apply the proposal's quorum and threshold to already tallied weights."""
     participating_weight = votes_for + votes_against
     quorum_met = (participating_weight / total_weight) >= proposal.quorum if total_weight > 0 else False
     support = (votes_for / participating_weight) if participating_weight > 0 else 0.0
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from sim.graph_store import GraphStore
+from sim.model import KripkeModel, Transition, World
+
+
+def _make_examples(path) -> str:
+    worlds = [
+        World("w1", "w1", "", edges=["w2"]),
+        World("w2", "w2", "", edges=["w3", "w1"]),
+        World("w3", "w3", "", edges=["w4", "w2"]),
+        World("w4", "w4", "", edges=["w1"]),
+    ]
+    GraphStore().write_world_jsons(worlds, str(path / "worlds"))
+    return str(path)
+
+
+def _history_key(path):
+    return [(h["proposal_id"], h["arweave_from"], h["arweave_to"], h["votes_for"]) for h in json.loads(path.read_text())]
+
+
+@pytest.fixture
+def make_examples():
+    """Factory: writes the four-world cyclic frame (no valuation) under a directory and returns it."""
+    return _make_examples
+
+
+@pytest.fixture
+def history_key():
+    """Comparable per-record key of a ``history.json`` file."""
+    return _history_key
+
+
+@pytest.fixture
+def example_model() -> KripkeModel:
+    """The four-world cyclic frame with valuation ``p1``..``p4``."""
+    worlds = {
+        "w1": World("w1", "w1", "", [], [], ["w2"]),
+        "w2": World("w2", "w2", "", [], [], ["w3", "w1"]),
+        "w3": World("w3", "w3", "", [], [], ["w4", "w2"]),
+        "w4": World("w4", "w4", "", [], [], ["w1"]),
+    }
+    edges = [
+        Transition("w1", "w2"),
+        Transition("w2", "w3"),
+        Transition("w3", "w4"),
+        Transition("w4", "w1"),
+        Transition("w2", "w1"),
+        Transition("w3", "w2"),
+    ]
+    valuation = {
+        "p1": {"w1", "w2", "w3"},
+        "p2": {"w2", "w3", "w4"},
+        "p3": {"w3", "w4"},
+        "p4": {"w4"},
+    }
+    return KripkeModel(worlds, edges, valuation)
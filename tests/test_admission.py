@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from sim.admission import (
+    ADMITTED,
+    NECESSARY_UNMET,
+    NO_EDGE,
+    NOT_ACTIVE,
+    UNKNOWN_WORLD,
+    AdmissionGuard,
+)
+from sim.model import KripkeModel, Transition, World
+from sim.session import GovernanceSession
+from sim.sim_helpers import build_voters
+
+
+def guarded_model(model):
+    worlds = dict(model.worlds)
+    worlds["w3"] = World("w3", "w3", "", necessary=["p1", "p4"], edges=["w4", "w2"])  # p4 is false in w3
+    edges = [Transition(u, v) for u, succ in model.relations.items() for v in succ]
+    return KripkeModel(worlds, edges, model.valuation)
+
+
+def test_guard_reasons_follow_the_frame(example_model):
+    guard = AdmissionGuard(guarded_model(example_model))
+    assert guard.check("w1", "w2") == ADMITTED
+    assert guard.check("w1", "w3") == NO_EDGE
+    assert guard.check("w1", "w9") == UNKNOWN_WORLD
+    assert guard.check("w2", "w3") == NECESSARY_UNMET
+    assert guard.check("w2", "w1", active_world="w1") == NOT_ACTIVE
+    assert guard.check("w1", "w2", active_world="w1") == ADMITTED
+
+    proposals = [(f"p{i}", src, dst) for i, (src, dst) in enumerate([("w1", "w2"), ("w4", "w2"), ("w2", "w3"), ("w3", "w4")])]
+    reasons = guard.check_batch(proposals)
+    assert reasons == [guard.check(src, dst) for _, src, dst in proposals]
+    admitted, rejected = guard.admit(proposals)
+    assert admitted == [proposals[0], proposals[3]]
+    assert rejected == [(proposals[1], NO_EDGE), (proposals[2], NECESSARY_UNMET)]
+
+
+def test_unknown_necessary_proposition_is_never_satisfied():
+    worlds = {"a": World("a", "a", "", necessary=["missing"]), "b": World("b", "b", "")}
+    guard = AdmissionGuard(KripkeModel(worlds, [Transition("b", "a")], {}))
+    assert guard.check("b", "a") == NECESSARY_UNMET
+
+
+def test_rejected_proposals_cost_no_votes_or_history(tmp_path, make_examples):
+    plain, guarded = tmp_path / "plain", tmp_path / "guarded"
+    legal = [("p1", "w1", "w2"), ("p2", "w2", "w3"), ("p3", "w3", "w4")]
+    illegal = [("x1", "w1", "w4"), ("x2", "w9", "w1"), ("x3", "w4", "w3")]
+    mixed = [legal[0], illegal[0], legal[1], illegal[1], illegal[2], legal[2]]
+    kwargs = dict(approval_probability=1.0, participation_probability=1.0)
+
+    with GovernanceSession(make_examples(plain), voters=build_voters(10), rng=random.Random(3)) as session:
+        session.run_proposals(legal, **kwargs)
+    with GovernanceSession(make_examples(guarded), voters=build_voters(10), rng=random.Random(3), admission="static") as session:
+        results = session.run_proposals(mixed, **kwargs)
+        assert session.rejections == {NO_EDGE: 2, UNKNOWN_WORLD: 1}
+        assert session.run_proposal("x4", "w1", "w3") == (None, None)
+    assert [r for r in results if r == (None, None)] == [(None, None)] * 3
+    # Rejections draw no votes, so the admitted proposals see the same RNG stream.
+    history = json.loads((guarded / "history.json").read_text())
+    assert [h["proposal_id"] for h in history] == ["p1", "p2", "p3"]
+    assert [h["votes_for"] for h in history] == [h["votes_for"] for h in json.loads((plain / "history.json").read_text())]
+
+
+def test_strict_admission_tracks_the_active_world(tmp_path, make_examples):
+    examples = make_examples(tmp_path)
+    proposals = [("p1", "w1", "w2"), ("p2", "w1", "w2"), ("p3", "w2", "w3")]
+    with GovernanceSession(examples, voters=build_voters(10), rng=random.Random(0), admission="strict") as session:
+        results = session.run_proposals(proposals, approval_probability=1.0, participation_probability=1.0)
+        assert [tx is not None for tx, _ in results] == [True, False, True]
+        assert session.rejections == {NOT_ACTIVE: 1}
+        assert session.active_world == "w3"
+    with pytest.raises(ValueError):
+        GovernanceSession(examples, admission="loose")
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+
+from sim.archiver import MockArchiver
+from sim.async_archiver import ArchiveGatewayServer, AsyncArchiverClient
+from sim.sim_helpers import build_voters, run_proposals_async, default_proposals
+from sim.graph_store import GraphStore
+from sim.model import World
+
+
+def test_async_client_batches_and_matches_mock_uris():
+    payloads = [{"world_id": f"w{i}", "edges": []} for i in range(50)]
+
+    async def run():
+        async with ArchiveGatewayServer() as server:
+            async with AsyncArchiverClient(server.host, server.port, max_concurrency=2, max_batch=16) as client:
+                uris = await client.upload_many(payloads)
+            return uris, server
+
+    uris, server = asyncio.run(run())
+    mock = MockArchiver()
+    assert uris == [mock.upload_json(p) for p in payloads]
+    assert server.payloads == 50
+    assert server.requests <= 4  # bundled: 50 payloads / 16 per bundle
+    assert server.connections <= 2  # keep-alive connections reused
+
+
+def test_async_client_retries_transient_failures():
+    async def run():
+        async with ArchiveGatewayServer(fail_first=2) as server:
+            async with AsyncArchiverClient(server.host, server.port, backoff=0.001) as client:
+                return await client.upload_json({"a": 1})
+
+    assert asyncio.run(run()) == MockArchiver().upload_json({"a": 1})
+
+
+class ShortBundleGateway(ArchiveGatewayServer):
+    """Answers bundles with one id too few."""
+
+    def _route(self, method, path, body):
+        status, response = super()._route(method, path, body)
+        if path == "/bundle":
+            response = json.dumps({"ids": json.loads(response)["ids"][:-1]}).encode("utf-8")
+        return status, response
+
+
+def test_bundles_keep_payload_boundaries():
+    from sim.archiver import placeholder_uri
+    from sim.async_archiver import GatewayError
+
+    payloads = [b'{"a":\n1}', b'{"b":2}', b"", b"\n\n"]
+
+    async def run(server_cls):
+        async with server_cls() as server:
+            async with AsyncArchiverClient(server.host, server.port, max_batch=len(payloads)) as client:
+                return await asyncio.gather(*(client.upload_bytes(p) for p in payloads), return_exceptions=True)
+
+    assert asyncio.run(run(ArchiveGatewayServer)) == [placeholder_uri(p) for p in payloads]
+    assert all(isinstance(r, GatewayError) for r in asyncio.run(run(ShortBundleGateway)))
+
+
+class RejectingGateway(ArchiveGatewayServer):
+    def _route(self, method, path, body):
+        self.payloads += 1
+        return "413 Payload Too Large", b'{"error":"too large"}'
+
+
+def test_client_errors_are_reported_without_retrying():
+    from sim.async_archiver import GatewayError
+
+    async def run():
+        async with RejectingGateway() as server:
+            async with AsyncArchiverClient(server.host, server.port, backoff=0.001) as client:
+                try:
+                    await client.upload_json({"a": 1})
+                except GatewayError as exc:
+                    return str(exc), server.payloads
+
+    message, attempts = asyncio.run(run())
+    assert "413" in message and "too large" in message and attempts == 1
+
+
+def test_run_proposals_async_keeps_history_order(tmp_path):
+    worlds = [
+        World("w1", "w1", "", edges=["w2"]),
+        World("w2", "w2", "", edges=["w3", "w1"]),
+        World("w3", "w3", "", edges=["w4", "w2"]),
+        World("w4", "w4", "", edges=["w1"]),
+    ]
+    GraphStore().write_world_jsons(worlds, str(tmp_path / "worlds"))
+
+    async def run():
+        async with ArchiveGatewayServer() as server:
+            async with AsyncArchiverClient(server.host, server.port) as client:
+                return await run_proposals_async(
+                    str(tmp_path), default_proposals(), 0.5, 0.5, random.Random(1), 0.9, 1.0, build_voters(10), client,
+                )
+
+    results = asyncio.run(run())
+    passed = [tx.proposal_id for tx, _ in results if tx is not None]
+    history = json.loads((tmp_path / "history.json").read_text())
+    assert [h["proposal_id"] for h in history] == passed
+    assert all(h["arweave_from"].startswith("ar://placeholder-") for h in history)
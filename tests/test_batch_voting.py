@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+import sim.batch_voting as batch_voting
+from sim.batch_voting import AGAINST, FOR, ballot_matrix, evaluate_batch, voter_weights
+from sim.sim_helpers import build_voters
+from sim.voting import Proposal, Voter, evaluate_proposal, simulate_votes_random
+
+
+def reference(voters, votes, quorums, thresholds):
+    return [
+        evaluate_proposal(Proposal(f"p{i}", "w1", "w2", quorum=q, threshold=t), voters, cast)
+        for i, (cast, q, t) in enumerate(zip(votes, quorums, thresholds))
+    ]
+
+
+def test_batch_matches_evaluate_proposal_row_by_row(monkeypatch):
+    rng = random.Random(3)
+    voters = build_voters(25)
+    votes = [simulate_votes_random(voters, rng, rng.random(), rng.random()) for _ in range(300)]
+    votes += [{}, {"v1": False}, {vid: True for vid in voters}]  # no participation, all against, unanimous
+    quorums = [rng.choice([0.0, 0.25, 0.5, 1.0, rng.random()]) for _ in votes]
+    thresholds = [rng.choice([0.0, 0.5, 2 / 3, 1.0, rng.random()]) for _ in votes]
+    ids, weights = voter_weights(voters)
+    ballots = ballot_matrix(votes, ids)
+    expected = reference(voters, votes, quorums, thresholds)
+    assert evaluate_batch(ballots, weights, quorums, thresholds).to_results() == expected
+    # Small chunks give the same answer.
+    monkeypatch.setattr(batch_voting, "CHUNK_CELLS", 100)
+    results = evaluate_batch(ballots, weights, np.array(quorums), np.array(thresholds))
+    assert results.to_results() == expected
+    assert results[len(votes) - 3] == expected[-3]
+
+
+def test_zero_total_weight_never_meets_quorum():
+    voters = {"a": Voter("a", 0), "b": Voter("b", 0)}
+    ids, weights = voter_weights(voters)
+    votes = [{"a": True}, {}]
+    results = evaluate_batch(ballot_matrix(votes, ids), weights, quorum=0.0, threshold=0.0)
+    assert results.to_results() == reference(voters, votes, [0.0, 0.0], [0.0, 0.0])
+    assert not results.quorum_met.any()
+
+
+def test_large_weights_tally_exactly():
+    weights = np.array([2**60, 3, 2**59 + 1], dtype=np.int64)
+    ballots = np.array([[FOR, AGAINST, FOR], [AGAINST, 0, FOR]], dtype=np.int8)
+    results = evaluate_batch(ballots, weights)
+    assert results.votes_for.tolist() == [2**60 + 2**59 + 1, 2**59 + 1]
+    assert results.votes_against.tolist() == [3, 2**60]
+    with pytest.raises(ValueError):
+        evaluate_batch(ballots[:, :2], weights)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+
+from sim.bench import BENCHMARKS, BenchConfig, compare_to_baseline, load_baseline, run_benchmarks, write_results
+
+
+def test_every_benchmark_runs_and_round_trips(tmp_path):
+    config = BenchConfig(worlds=6, voters=5, history=20, repeat=1)
+    results = run_benchmarks(config)
+    assert [r.name for r in results] == list(BENCHMARKS)
+    assert all(len(r.runs_s) == 1 and r.ops > 0 for r in results)
+    assert {r.key for r in results} >= {"voting.simulate_tally[voters=5]", "cardano.submit_transition[history=20]"}
+
+    path = tmp_path / "results.json"
+    write_results(str(path), config, results)
+    doc = json.loads(path.read_text())
+    assert doc["config"]["worlds"] == 6
+    baseline = load_baseline(str(path))
+    assert not any(row["regressed"] for row in compare_to_baseline(results, baseline, tolerance=0.0))
+
+
+def test_regressions_are_flagged_against_baseline():
+    results = run_benchmarks(BenchConfig(worlds=6, repeat=2), names=["model.modal"])
+    key = results[0].key
+    fast = {key: {"min_s": results[0].min_s / 10}}
+    slow = {key: {"min_s": results[0].min_s * 10}}
+    assert compare_to_baseline(results, fast, noise_floor_s=0.0)[0]["regressed"]
+    assert not compare_to_baseline(results, slow, noise_floor_s=0.0)[0]["regressed"]
+    # A large relative slowdown below the absolute noise floor is not flagged.
+    assert not compare_to_baseline(results, fast, noise_floor_s=results[0].min_s)[0]["regressed"]
+    assert compare_to_baseline(results, {"other[worlds=6]": {"min_s": 1.0}}) == []
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+
+from sim.bisimulation import bisimulation_partition, evaluate_formula, minimize
+from sim.model import KripkeModel, Transition, World
+
+
+def naive_partition(model):
+    """Signature refinement to a fixpoint, as a reference."""
+    ids = sorted(model.worlds)
+    cls = {w: frozenset(p for p, ws in model.valuation.items() if w in ws) for w in ids}
+    while True:
+        sig = {w: (cls[w], frozenset(cls[v] for v in model.relations[w])) for w in ids}
+        if len(set(sig.values())) == len(set(cls.values())):
+            break
+        cls = sig
+    groups = {}
+    for w in ids:
+        groups.setdefault(cls[w], []).append(w)
+    return sorted(sorted(g) for g in groups.values())
+
+
+def random_model(rng, n):
+    ids = [f"w{i}" for i in range(n)]
+    edges = [Transition(rng.choice(ids), rng.choice(ids)) for _ in range(rng.randrange(3 * n))]
+    valuation = {f"p{j}": {w for w in ids if rng.random() < 0.3} for j in range(rng.randrange(3))}
+    return KripkeModel({w: World(w, w, "") for w in ids}, edges, valuation)
+
+
+def random_formula(rng, depth):
+    if depth == 0 or rng.random() < 0.3:
+        return rng.choice(["p0", "p1", "p2"])
+    op = rng.choice(["not", "and", "or", "box", "dia"])
+    if op in ("and", "or"):
+        return (op, random_formula(rng, depth - 1), random_formula(rng, depth - 1))
+    return (op, random_formula(rng, depth - 1))
+
+
+def test_partition_matches_reference_and_preserves_formulas():
+    rng = random.Random(0)
+    for _ in range(200):
+        model = random_model(rng, rng.randrange(1, 30))
+        assert bisimulation_partition(model) == naive_partition(model)
+        quotient = minimize(model)
+        for _ in range(5):
+            formula = random_formula(rng, 4)
+            assert quotient.evaluate(formula) == evaluate_formula(model, formula)
+        for w in model.worlds:
+            assert quotient.is_necessary("p0", w) == model.is_necessary("p0", w)
+            assert quotient.is_possible("p1", w) == model.is_possible("p1", w)
+
+
+def test_periodic_ring_collapses():
+    n = 120
+    ids = [f"w{i}" for i in range(n)]
+    edges = [Transition(ids[i], ids[(i + 1) % n]) for i in range(n)]
+    model = KripkeModel({w: World(w, w, "") for w in ids}, edges, {"p0": set(ids[::3])})
+    quotient = minimize(model)
+    assert quotient.stats()["quotient_worlds"] == 3
+    assert quotient.reduction_ratio == 40.0
+    assert quotient.evaluate(("dia", ("dia", "p0"))) == set(ids[1::3])
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import os
+
+from sim.file_cache import MtimeCache
+
+
+def test_mtime_cache_reloads_only_when_files_change(tmp_path):
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps([1]))
+    cache = MtimeCache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return json.loads(path.read_text())
+
+    assert cache.get("history", [str(path)], load) == [1]
+    assert cache.get("history", [str(path)], load) == [1]
+    assert len(loads) == 1 and cache.hits == 1
+
+    path.write_text(json.dumps([1, 2]))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get("history", [str(path)], load) == [1, 2]
+    assert len(loads) == 2
+
+
+def test_mtime_cache_tracks_directory_members(tmp_path):
+    wdir = tmp_path / "worlds"
+    wdir.mkdir()
+    (wdir / "w1.json").write_text("{}")
+    cache = MtimeCache()
+    assert cache.get("worlds", [str(wdir)], lambda: len(os.listdir(wdir))) == 1
+    (wdir / "w2.json").write_text("{}")
+    assert cache.get("worlds", [str(wdir)], lambda: len(os.listdir(wdir))) == 2
@@ -20,3 +20,50 @@ def test_cycles_and_reachability(tmp_path):
     assert set(store.descendants("w2")) >= {"w1", "w3", "w4"}
 
 
+def test_world_json_writes_skip_unchanged(tmp_path):
+    w1 = World("w1", "w1", "", edges=["w2"])
+    w2 = World("w2", "w2", "", edges=["w1"])
+    store = GraphStore()
+    wdir = str(tmp_path / "worlds")
+    assert store.write_world_jsons([w1, w2], wdir) == ["w1", "w2"]
+    assert store.write_world_jsons([w1, w2], wdir) == []
+    assert (tmp_path / "worlds" / "w1.json").read_bytes() == w1.canonical_bytes
+    reloaded = GraphStore()
+    loaded = reloaded.load_worlds_from_dir(wdir)
+    assert loaded["w2"].digest == w2.digest
+    w2b = World("w2", "w2", "amended", edges=["w1"])
+    assert reloaded.write_world_jsons([w1, w2b], wdir) == ["w2"]
+
+
+def test_write_cache_is_per_destination(tmp_path):
+    from sim.storage import SqliteStorage
+
+    w1 = World("w1", "w1", "", edges=["w2"])
+    w2 = World("w2", "w2", "", edges=["w1"])
+    store = GraphStore()
+    first, second = str(tmp_path / "a"), str(tmp_path / "b")
+    assert store.write_world_jsons([w1, w2], first) == ["w1", "w2"]
+    assert store.write_world_jsons([w1, w2], second) == ["w1", "w2"]
+    assert (tmp_path / "b" / "w2.json").read_bytes() == w2.canonical_bytes
+    # A deleted file is restored even though its content is unchanged.
+    (tmp_path / "a" / "w1.json").unlink()
+    assert store.write_world_jsons([w1, w2], first) == ["w1"]
+    with SqliteStorage(str(tmp_path / "one.db")) as one, SqliteStorage(str(tmp_path / "two.db")) as two:
+        assert store.save_to_storage([w1, w2], one) == ["w1", "w2"]
+        assert store.save_to_storage([w1, w2], two) == ["w1", "w2"]
+        assert store.save_to_storage([w1, w2], two) == []
+        assert set(two.load_worlds()) == {"w1", "w2"}
+
+
+def test_load_ignores_metadata_files(tmp_path):
+    from sim.tokenize import write_metadata_json
+
+    w1 = World("w1", "w1", "", edges=["w2"])
+    w2 = World("w2", "w2", "", edges=["w1"])
+    store = GraphStore()
+    wdir = tmp_path / "worlds"
+    store.write_world_jsons([w1, w2], str(wdir))
+    for w in (w1, w2):
+        write_metadata_json(w, str(wdir / f"{w.world_id}.metadata.json"))
+    loaded = GraphStore().load_worlds_from_dir(str(wdir))
+    assert loaded["w1"].edges == ["w2"] and loaded["w2"].edges == ["w1"]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+
+from sim.history_index import HistoryIndex
+
+
+def make_history(n: int):
+    worlds = ["w1", "w2", "w3", "w4"]
+    return [
+        {
+            "proposal_id": f"prop-{i % 6:03d}",
+            "from_world": worlds[i % 4],
+            "to_world": worlds[(i + 1) % 4],
+            "timestamp": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+        }
+        for i in range(n)
+    ]
+
+
+def test_history_index_filters_and_pages(tmp_path):
+    history = make_history(600)
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps(history, indent=2))
+    index = HistoryIndex.from_file(str(path))
+    assert len(index) == 600
+
+    w2 = index.query(world="w2")
+    assert w2 == [i for i, h in enumerate(history) if "w2" in (h["from_world"], h["to_world"])]
+
+    combined = index.query(world="w1", proposal="prop-000", since="2025-01-01T00:01:00Z", until="2025-01-01T00:04:59Z")
+    expected = [
+        i for i, h in enumerate(history)
+        if "w1" in (h["from_world"], h["to_world"]) and h["proposal_id"] == "prop-000"
+        and "2025-01-01T00:01:00Z" <= h["timestamp"] <= "2025-01-01T00:04:59Z"
+    ]
+    assert combined == expected and combined
+
+    everything = index.query()
+    assert index.page(everything, 2, 25) == history[50:75]
+    assert index.page(everything, 99, 25) == []
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import random
+
+import numpy as np
+import pytest
+
+from sim.holders import WeightSnapshot, ingest_snapshot
+from sim.random_walk import GovernanceWalk
+from sim.voting import Proposal, Voter, evaluate_proposal
+
+
+def write_holders(tmp_path, rows):
+    csv_path = tmp_path / "holders.csv"
+    jsonl_path = tmp_path / "holders.jsonl"
+    half = len(rows) // 2
+    csv_path.write_text("address,weight\n" + "".join(f"{a},{w}\n" for a, w in rows[:half]))
+    jsonl_path.write_text("".join(json.dumps({"address": a, "weight": w}) + "\n" for a, w in rows[half:]))
+    return [str(csv_path), str(jsonl_path)]
+
+
+def test_ingest_aggregates_duplicates_across_spilled_runs(tmp_path):
+    rng = random.Random(0)
+    rows = [(f"addr_{rng.randrange(300)}", rng.randrange(0, 1000)) for _ in range(2_000)]
+    expected = {}
+    for a, w in rows:
+        expected[a] = expected.get(a, 0) + w
+    expected = {a: w for a, w in expected.items() if w}
+    out = str(tmp_path / "weights.bin")
+    stats = ingest_snapshot(write_holders(tmp_path, rows), out, epoch=7, chunk_rows=150)
+    assert stats["runs"] > 1 and stats["rows"] == len(rows)
+
+    snap = WeightSnapshot(out)
+    assert (len(snap), snap.epoch, snap.total_weight) == (len(expected), 7, sum(expected.values()))
+    assert list(snap.addresses()) == sorted(expected)
+    assert {a: snap.weight_of(a) for a in expected} == expected
+    assert snap.index_of("addr_missing") is None and snap.weight_of("nope") == 0
+    # Same result when everything fits in one chunk.
+    single = str(tmp_path / "single.bin")
+    ingest_snapshot(write_holders(tmp_path, rows), single, epoch=7)
+    assert open(single, "rb").read() == open(out, "rb").read()
+
+
+def test_spilled_runs_keep_carriage_returns_in_addresses(tmp_path):
+    path = tmp_path / "h.jsonl"
+    path.write_text("".join(json.dumps({"address": a, "weight": 1}) + "\n" for a in ("a\rb", "c\u2028d", "a\rb")))
+    spilled, single = str(tmp_path / "spilled.bin"), str(tmp_path / "single.bin")
+    ingest_snapshot(str(path), spilled, chunk_rows=1)
+    ingest_snapshot(str(path), single)
+    assert WeightSnapshot(spilled).weight_of("a\rb") == 2
+    assert open(spilled, "rb").read() == open(single, "rb").read()
+
+
+def test_snapshot_voting_matches_voter_dicts(tmp_path, example_model):
+    rows = [(f"h{i:03d}", (i * 37) % 101 + 1) for i in range(200)]
+    out = str(tmp_path / "weights.bin")
+    ingest_snapshot(write_holders(tmp_path, rows), out)
+    snap = WeightSnapshot(out)
+    voters = {a: Voter(a, w) for a, w in rows}
+    rng = np.random.default_rng(4)
+    for quorum, threshold in [(0.5, 0.5), (0.9, 0.5), (0.3, 0.8)]:
+        participates, approves = snap.simulate(rng, approval_probability=0.55, participation_probability=0.8)
+        votes = {snap.address(i): bool(approves[i]) for i in np.flatnonzero(participates).tolist()}
+        proposal = Proposal("p", "w1", "w2", quorum=quorum, threshold=threshold)
+        assert snap.evaluate(proposal, participates, approves) == evaluate_proposal(proposal, voters, votes)
+
+    walk = GovernanceWalk(example_model, snap, seed=1)
+    walk.run(1_000)
+    assert walk.stats()["steps"] == 1_000
+
+
+def test_diffs_update_in_place_or_merge_new_holders(tmp_path):
+    out = str(tmp_path / "weights.bin")
+    ingest_snapshot(write_holders(tmp_path, [("a", 10), ("b", 5), ("c", 1), ("d", 4)]), out)
+    snap = WeightSnapshot(out)
+    reader = WeightSnapshot(out)
+
+    diff1 = tmp_path / "epoch1.csv"
+    diff1.write_text("address,weight\na,-4\nc,-1\nb,3\nb,-1\n")
+    stats = snap.apply_diff(str(diff1))
+    assert stats["rewritten"] is False and stats["epoch"] == 1 and stats["total_weight"] == 17
+    # The in-place update is visible through another open mapping without reloading.
+    assert reader.weight_of("a") == 6 and reader.weight_of("c") == 0 and len(reader) == 4
+
+    diff2 = tmp_path / "epoch2.jsonl"
+    diff2.write_text('{"address": "e", "weight": 2}\n{"address": "aa", "weight": 9}\n{"address": "d", "weight": -4}\n')
+    stats = snap.apply_diff(str(diff2), epoch=5)
+    assert stats["rewritten"] is True and stats["added"] == 2
+    assert list(snap.addresses()) == ["a", "aa", "b", "e"]
+    assert [int(w) for w in snap.weights] == [6, 9, 7, 2]
+    assert (snap.epoch, snap.total_weight) == (5, 24)
+    reader.refresh()
+    assert reader.total_weight == 24
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("address,weight\nb,-8\n")
+    with pytest.raises(ValueError):
+        snap.apply_diff(str(bad))
+    assert snap.weight_of("b") == 7 and snap.epoch == 5
+
+
+def test_rejects_malformed_holder_rows(tmp_path):
+    path = tmp_path / "h.jsonl"
+    path.write_text('{"address": "a", "weight": 1.5}\n')
+    with pytest.raises(ValueError, match="row 1"):
+        ingest_snapshot(str(path), str(tmp_path / "out.bin"))
+    path.write_text('{"address": "a", "weight": -1}\n')
+    with pytest.raises(ValueError):
+        ingest_snapshot(str(path), str(tmp_path / "out.bin"))
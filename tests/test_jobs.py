@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from sim.jobs import CANCELLED, DONE, FINISHED, JobParams, JobRunner
+from sim.sim_helpers import default_proposals
+
+
+def wait(job, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while job.status not in FINISHED and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_jobs_run_isolated_until_committed(tmp_path, make_examples):
+    examples_dir = make_examples(tmp_path)
+    runner = JobRunner(examples_dir)
+    try:
+        a = runner.submit(default_proposals(), JobParams(seed=1, approval_probability=0.9))
+        b = runner.submit(default_proposals(), JobParams(seed=2, approval_probability=0.9))
+        wait(a)
+        wait(b)
+        assert a.status == b.status == DONE
+        assert a.done == a.total == len(a.results)
+        assert not os.path.exists(os.path.join(examples_dir, "history.json"))
+
+        committed = runner.commit(a.job_id)
+        history = json.loads((tmp_path / "history.json").read_text())
+        assert committed == len(history) == sum(1 for r in a.results if r["passed"])
+        assert [h["tx_id"] for h in history] == [r["tx_id"] for r in a.results if r["passed"]]
+        assert not os.path.exists(a.workspace)
+        # b started from the same world as a, which has since moved on.
+        with pytest.raises(RuntimeError):
+            runner.commit(b.job_id)
+        assert len(json.loads((tmp_path / "history.json").read_text())) == committed
+        assert not b.committed
+    finally:
+        runner.shutdown()
+
+
+def test_commit_checks_the_world_the_job_started_from(tmp_path, make_examples):
+    examples_dir = make_examples(tmp_path)
+    runner = JobRunner(examples_dir)
+    try:
+        # With seed 10, prop-001 (w1->w2) fails and the first passed proposal leaves w2.
+        job = runner.submit(default_proposals(), JobParams(seed=10))
+        wait(job)
+        assert not job.results[0]["passed"] and job.results[1]["passed"]
+        assert job.start_world == "w1"
+        assert runner.commit(job.job_id) == sum(1 for r in job.results if r["passed"])
+    finally:
+        runner.shutdown()
+
+
+def test_job_cancellation_stops_early(tmp_path, make_examples):
+    examples_dir = make_examples(tmp_path)
+    runner = JobRunner(examples_dir, max_workers=1)
+    try:
+        job = runner.submit(default_proposals() * 2000, JobParams(seed=3))
+        job.cancel()
+        wait(job)
+        assert job.status == CANCELLED
+        assert job.done < job.total
+    finally:
+        runner.shutdown()
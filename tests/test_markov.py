@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import sim.markov as markov
+from sim.markov import GovernanceChain, pass_probability, transition_matrix
+from sim.random_walk import WalkParams
+from sim.sim_helpers import build_voters
+from sim.voting import Proposal, evaluate_proposal
+
+
+def frame_graph(model):
+    return nx.DiGraph([(u, v) for u, succ in model.relations.items() for v in succ])
+
+
+def enumerated_pass_probability(voters, params):
+    total = 0.0
+    part, appr = params.participation_probability, params.approval_probability
+    for choices in itertools.product((None, True, False), repeat=len(voters)):
+        prob = 1.0
+        votes = {}
+        for vid, choice in zip(voters, choices):
+            if choice is None:
+                prob *= 1 - part
+            else:
+                prob *= part * (appr if choice else 1 - appr)
+                votes[vid] = choice
+        proposal = Proposal("p", "a", "b", quorum=params.quorum, threshold=params.threshold)
+        if evaluate_proposal(proposal, voters, votes).passed:
+            total += prob
+    return total
+
+
+def test_pass_probability_is_exact_for_small_electorates(monkeypatch):
+    voters = build_voters(5)
+    for params in [WalkParams(), WalkParams(0.7, 0.6, 0.55, 0.8), WalkParams(0.0, 0.0, 0.3, 0.5)]:
+        assert pass_probability(voters, params) == pytest.approx(enumerated_pass_probability(voters, params), abs=1e-12)
+    params = WalkParams(approval_probability=0.55, participation_probability=0.7)
+    exact = pass_probability(build_voters(12), params)
+    monkeypatch.setattr(markov, "EXACT_GRID_CELLS", 0)
+    assert pass_probability(build_voters(12), params, samples=100_000) == pytest.approx(exact, abs=0.01)
+
+
+def test_chain_matches_dense_linear_algebra_and_kac(example_model):
+    chain = GovernanceChain.from_graph(frame_graph(example_model), build_voters(10), WalkParams(approval_probability=0.7))
+    P = chain.P.toarray()
+    assert np.allclose(P.sum(axis=1), 1.0)
+    vals, vecs = np.linalg.eig(P.T)
+    dense_pi = np.real(vecs[:, np.argmin(abs(vals - 1))])
+    dense_pi /= dense_pi.sum()
+    pi = chain.stationary_distribution()
+    assert np.allclose([pi[w] for w in chain.world_ids], dense_pi)
+
+    t = chain.index["w1"]
+    others = [i for i in range(len(P)) if i != t]
+    dense_h = np.linalg.solve(np.eye(len(others)) - P[np.ix_(others, others)], np.ones(len(others)))
+    hitting = chain.hitting_times("w1")
+    assert np.allclose([hitting[chain.world_ids[i]] for i in others], dense_h)
+    assert chain.return_time("w1") == pytest.approx(1 / pi["w1"])
+    summary = chain.summary("w1")
+    assert summary["worlds"]["w1"]["hitting_time"] == 0.0
+    assert summary["return_time"] == pytest.approx(summary["worlds"]["w1"]["return_time"])
+
+
+def test_iterative_solver_agrees_with_direct():
+    rng = random.Random(1)
+    n = 400
+    graph = nx.DiGraph()
+    for i in range(n):
+        graph.add_edge(f"w{i}", f"w{(i + 1) % n}")
+        graph.add_edge(f"w{i}", f"w{rng.randrange(n)}")
+    ids, matrix = transition_matrix(graph, 0.6)
+    direct = GovernanceChain(ids, matrix)
+    iterative = GovernanceChain(ids, matrix, direct_limit=0)
+    for a, b in [(direct.stationary_distribution(), iterative.stationary_distribution()),
+                 (direct.hitting_times("w0"), iterative.hitting_times("w0"))]:
+        assert np.allclose([a[w] for w in ids], [b[w] for w in ids], rtol=1e-7)
+
+
+def test_absorbing_worlds_and_unreachable_targets():
+    graph = nx.DiGraph([("w1", "w2"), ("w1", "w3"), ("w3", "w3"), ("w0", "w1")])
+    graph.add_node("w2")
+    ids, matrix = transition_matrix(graph, 0.5)
+    chain = GovernanceChain(ids, matrix)
+    with pytest.raises(ValueError):
+        chain.stationary_distribution()
+    pi = chain.stationary_distribution(start="w0")
+    assert pi == pytest.approx({"w0": 0.0, "w1": 0.0, "w2": 0.5, "w3": 0.5})
+    assert chain.stationary_distribution(start="w2")["w2"] == 1.0
+    hitting = chain.hitting_times("w2")
+    assert math.isinf(hitting["w1"]) and math.isinf(hitting["w3"]) and hitting["w2"] == 0.0
+    # w0 only proposes w1, which passes half the time.
+    assert chain.hitting_times("w1")["w0"] == pytest.approx(2.0)
+    summary = chain.summary("w2")
+    assert summary["worlds"]["w1"]["hitting_time"] is None and summary["worlds"]["w0"]["return_time"] is None
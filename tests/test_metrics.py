@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import random
+
+from sim.metrics import METRICS, Metrics
+from sim.sim_helpers import build_voters, run_single_proposal
+
+
+def test_disabled_metrics_record_nothing():
+    m = Metrics()
+    with m.span("stage"):
+        pass
+    m.count("events")
+    assert m.summary() == {"spans": {}, "counters": {}, "total_s": 0}
+
+
+def test_run_single_proposal_stages_and_exports(tmp_path, make_examples):
+    examples = make_examples(tmp_path / "examples")
+    METRICS.reset()
+    METRICS.enable()
+    try:
+        for i in range(5):
+            run_single_proposal(examples, f"p{i}", "w1", "w2", 0.0, 0.0, random.Random(i), 1.0, 1.0, build_voters(3))
+        summary = METRICS.summary()
+        METRICS.write_json(str(tmp_path / "metrics.json"))
+        METRICS.write_prometheus(str(tmp_path / "metrics.prom"))
+    finally:
+        METRICS.disable()
+        METRICS.reset()
+
+    stages = {"vote.simulate", "vote.tally", "world.read", "archive.upload", "history.write"}
+    assert set(summary["spans"]) == stages
+    assert all(s["count"] == 5 for s in summary["spans"].values())
+    assert summary["counters"] == {"proposals": 5, "proposals_passed": 5}
+    assert abs(sum(s["share"] for s in summary["spans"].values()) - 1.0) < 1e-9
+    assert json.loads((tmp_path / "metrics.json").read_text())["counters"]["proposals"] == 5
+    prom = (tmp_path / "metrics.prom").read_text()
+    assert 'pwsgt_stage_seconds_count{stage="history.write"} 5' in prom
+    assert 'pwsgt_events_total{event="proposals_passed"} 5' in prom
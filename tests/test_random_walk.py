@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from sim.random_walk import GovernanceWalk, WalkParams
+from sim.sim_helpers import build_voters
+
+
+def test_walk_follows_legal_edges_and_estimates_stationarity(example_model):
+    model = example_model
+    walk = GovernanceWalk(model, build_voters(10), WalkParams(approval_probability=0.7), seed=3)
+    walk.run(50_000)
+    stats = walk.stats()
+    legal = {(t, s) for t in model.worlds for s in model.successors(t)}
+    assert {(e["from"], e["to"]) for e in stats["edges"]} == legal
+    assert sum(w["visits"] for w in stats["worlds"].values()) == 50_000
+    for w in stats["worlds"].values():
+        # Kac: mean return time ≈ 1 / stationary probability
+        assert abs(w["mean_return_time"] * w["stationary_estimate"] - 1) < 0.05
+
+
+def test_walk_checkpoint_resumes_identically(tmp_path, example_model):
+    model = example_model
+    path = str(tmp_path / "walk.json")
+    a = GovernanceWalk(model, build_voters(10), seed=5)
+    a.run(1_000, checkpoint_path=path, checkpoint_every=250)
+    b = GovernanceWalk(model, build_voters(10), seed=999)
+    b.load_checkpoint(path)
+    a.run(1_000)
+    b.run(1_000)
+    assert a.stats() == b.stats()
+
+
+def test_walk_checkpoint_rejects_other_params_voters_or_edges(tmp_path, example_model):
+    path = str(tmp_path / "walk.json")
+    GovernanceWalk(example_model, build_voters(10), seed=5).run(100, checkpoint_path=path, checkpoint_every=50)
+    other_params = GovernanceWalk(example_model, build_voters(10), WalkParams(approval_probability=0.9))
+    other_voters = GovernanceWalk(example_model, build_voters(11))
+    example_model.relations["w4"].add("w3")
+    other_edges = GovernanceWalk(example_model, build_voters(10))
+    for walk in (other_params, other_voters, other_edges):
+        with pytest.raises(ValueError):
+            walk.load_checkpoint(path)
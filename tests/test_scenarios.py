@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+
+from sim.scenarios import run_scenarios, scenario_grid
+
+
+def test_merged_output_is_identical_for_any_worker_count(tmp_path, make_examples):
+    examples = make_examples(tmp_path / "examples")
+    scenarios = scenario_grid(seeds=range(4), steps=200, quorums=(0.4, 0.6))
+    outputs = []
+    for workers in (1, 3):
+        out = tmp_path / f"out{workers}"
+        results = run_scenarios(examples, scenarios, str(out), workers=workers)
+        assert [r["scenario"]["scenario_id"] for r in results] == sorted(s.scenario_id for s in scenarios)
+        outputs.append(((out / "history.json").read_bytes(), (out / "results.json").read_bytes()))
+        assert not (out / "shards").exists()
+    assert outputs[0] == outputs[1]
+
+    history = json.loads(outputs[0][0])
+    results = json.loads(outputs[0][1])
+    assert len(history) == sum(r["passed"] for r in results) > 0
+    legal = {("w1", "w2"), ("w2", "w3"), ("w2", "w1"), ("w3", "w4"), ("w3", "w2"), ("w4", "w1")}
+    assert all((h["from_world"], h["to_world"]) in legal for h in history)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from sim.scheduler import (
+    APPLIED,
+    CONFLICT,
+    FAILED,
+    REJECTED,
+    STALE,
+    ProposalScheduler,
+    ScheduledProposal,
+    random_schedule,
+)
+from sim.session import GovernanceSession
+from sim.sim_helpers import build_voters
+
+
+def ballots(window, approve, reject=()):
+    start, end = window
+    step = (end - start) / (len(approve) + len(reject) + 1)
+    voters = [(v, True) for v in approve] + [(v, False) for v in reject]
+    return tuple((start + step * (i + 1), v, choice) for i, (v, choice) in enumerate(voters))
+
+
+def test_conflicts_resolve_deterministically_before_archiving(tmp_path, make_examples):
+    examples = make_examples(tmp_path)
+    everyone = [f"v{i}" for i in range(1, 11)]
+    proposals = [
+        ScheduledProposal("a", "w1", "w2", 0, 2, ballots=ballots((0, 2), everyone)),
+        # Both leave w2 and close together; "c" has the higher support.
+        ScheduledProposal("b", "w2", "w3", 1, 4, ballots=ballots((1, 4), everyone[2:], everyone[:2])),
+        ScheduledProposal("c", "w2", "w1", 1.5, 4, ballots=ballots((1.5, 4), everyone)),
+        # Opened from w2 but closes after the world has moved on.
+        ScheduledProposal("d", "w2", "w3", 0.5, 6, ballots=ballots((0.5, 6), everyone)),
+        # Closes with "d" on the same stale source: stale too, not a conflict loss.
+        ScheduledProposal("f", "w2", "w1", 5, 6, ballots=ballots((5, 6), everyone[1:], everyone[:1])),
+        ScheduledProposal("e", "w1", "w2", 3, 7, ballots=ballots((3, 7), everyone[:2])),
+    ]
+    with GovernanceSession(examples, voters=build_voters(10)) as session:
+        scheduler = ProposalScheduler(session)
+        scheduler.extend(proposals)
+        outcomes = {o.proposal_id: o for o in scheduler.run_sync()}
+        assert session.active_world == "w1"
+    assert {pid: o.status for pid, o in outcomes.items()} == {"a": APPLIED, "b": CONFLICT, "c": APPLIED, "d": STALE, "e": FAILED, "f": STALE}
+    assert outcomes["b"].reason == "c" and outcomes["b"].tx is None
+    assert outcomes["f"].reason is None
+    history = json.loads((tmp_path / "history.json").read_text())
+    assert [h["proposal_id"] for h in history] == ["a", "c"]
+    assert scheduler.stats()["peak_open"] == 4
+
+
+def test_random_schedule_is_reproducible_and_chains_transitions(tmp_path, make_examples):
+    runs = []
+    for name in ("x", "y"):
+        examples = make_examples(tmp_path / name)
+        with GovernanceSession(examples, voters=build_voters(10), flush_every=0, history_tail=0) as session:
+            scheduler = ProposalScheduler(session, random.Random(5), approval_probability=0.7)
+            scheduler.extend(random_schedule(session.model, 2_000, random.Random(6), arrival_rate=50, mean_window=40))
+            scheduler.run_sync(until=60.0)
+            partial = scheduler.stats()["resolved"]
+            outcomes = scheduler.run_sync()
+        history = json.loads((tmp_path / name / "history.json").read_text())
+        runs.append(([(o.proposal_id, o.status) for o in outcomes], [h["proposal_id"] for h in history]))
+        stats = scheduler.stats()
+        assert 0 < partial < stats["resolved"] == 2_000 and stats["open"] == 0
+        assert stats["peak_open"] > 1_000
+        # Applied transitions form a walk along the frame from w1.
+        assert [h["from_world"] for h in history] == ["w1"] + [h["to_world"] for h in history[:-1]]
+        assert [o.proposal_id for o in outcomes if o.status == APPLIED] == runs[-1][1]
+    assert runs[0] == runs[1]
+
+
+def test_admission_rejects_at_open_and_bad_schedules_raise(tmp_path, make_examples):
+    examples = make_examples(tmp_path)
+    with GovernanceSession(examples, voters=build_voters(4), admission="static") as session:
+        scheduler = ProposalScheduler(session, random.Random(0), approval_probability=1.0, participation_probability=1.0)
+        scheduler.add(ScheduledProposal("ok", "w1", "w2", 0, 1))
+        scheduler.add(ScheduledProposal("bad", "w1", "w4", 0, 1))
+        with pytest.raises(ValueError):
+            scheduler.add(ScheduledProposal("ok", "w1", "w2", 0, 1))
+        with pytest.raises(ValueError):
+            scheduler.add(ScheduledProposal("late", "w1", "w2", 0, 1, ballots=((1.0, "v1", True),)))
+        outcomes = {o.proposal_id: o for o in scheduler.run_sync()}
+    assert outcomes["bad"].status == REJECTED and outcomes["bad"].reason == "no_edge"
+    assert outcomes["ok"].status == APPLIED
+    assert scheduler.stats()["peak_open"] == 1
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import random
+
+from sim.session import GovernanceSession
+from sim.sim_helpers import build_voters, default_proposals, run_single_proposal
+
+
+def test_session_matches_per_proposal_runner(tmp_path, make_examples, history_key):
+    a, b = tmp_path / "a", tmp_path / "b"
+    proposals = default_proposals() * 5
+    rng = random.Random(9)
+    voters = build_voters(10)
+    for pid, src, dst in proposals:
+        run_single_proposal(make_examples(a), pid, src, dst, 0.5, 0.5, rng, 0.6, 0.95, voters)
+
+    with GovernanceSession(make_examples(b), voters=voters, rng=random.Random(9), flush_every=4) as session:
+        session.run_proposals(proposals, approval_probability=0.6, participation_probability=0.95)
+        assert session.pending < 4
+    assert history_key(a / "history.json") == history_key(b / "history.json")
+    assert json.loads((b / "active_world.json").read_text())["active_world"] == session.active_world
+
+
+def test_session_flushes_on_policy_and_keeps_tail(tmp_path, make_examples):
+    examples = make_examples(tmp_path)
+    session = GovernanceSession(examples, rng=random.Random(1), flush_every=0, history_tail=3)
+    for pid, src, dst in default_proposals():
+        session.run_proposal(pid, src, dst, approval_probability=1.0, participation_probability=1.0)
+    assert session.pending == 6 and not (tmp_path / "history.json").exists()
+    session.close()
+    assert len(json.loads((tmp_path / "history.json").read_text())) == 6
+
+    reopened = GovernanceSession(examples, history_tail=3)
+    assert reopened.transitions == 6
+    assert [h["proposal_id"] for h in reopened.history_tail] == ["prop-004", "prop-005", "prop-006"]
+    assert reopened.active_world == "w2"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+from sim.bench import STARTUP_MODULES as SIM_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a non-plotting simulation process must not pay for at import time.
+HEAVY_MODULES = ("networkx", "matplotlib", "numpy", "scipy", "asyncio", "streamlit")
+
+
+def import_time_report(modules) -> Dict[str, int]:
+    """Run ``python -X importtime`` in a fresh interpreter; return cumulative µs per module."""
+    code = "import " + ", ".join(modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    report: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        report[name] = int(cumulative)
+    return report
+
+
+def test_sim_import_defers_heavy_dependencies():
+    report = import_time_report(SIM_MODULES)
+    loaded = sorted(m for m in report if m.split(".")[0] in HEAVY_MODULES)
+    assert not loaded, f"heavy modules imported at startup: {loaded}"
+    # Import time itself is tracked by the startup.import_sim benchmark.
+    assert set(SIM_MODULES) <= set(report)
+
+
+def test_run_vote_sim_script_imports_stay_light():
+    code = (
+        "import runpy, sys; sys.argv = ['run_vote_sim.py', '--help']\n"
+        "try:\n    runpy.run_path('scripts/run_vote_sim.py', run_name='__main__')\n"
+        "except SystemExit:\n    pass\n"
+        "print('heavy:' + ','.join(sorted(m for m in sys.modules if m.split('.')[0] in %r)))" % (HEAVY_MODULES,)
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert proc.stdout.strip().splitlines()[-1] == "heavy:"
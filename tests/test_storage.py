@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+import time
+
+import pytest
+
+from sim.history_index import HistoryIndex
+from sim.session import GovernanceSession
+from sim.sim_helpers import build_voters, default_proposals
+from sim.storage import JsonStorage, SqliteStorage, Storage, copy_storage, export_json
+
+
+def run_session(examples, storage=None):
+    with GovernanceSession(examples, voters=build_voters(10), rng=random.Random(3), flush_every=4, storage=storage) as session:
+        session.run_proposals(default_proposals() * 4, approval_probability=0.6, participation_probability=0.95)
+    return session
+
+
+def test_sqlite_session_matches_json_and_exports_layout(tmp_path, make_examples, history_key):
+    json_dir = make_examples(tmp_path / "json")
+    run_session(json_dir)
+
+    with SqliteStorage(str(tmp_path / "state.db")) as db:
+        copy_storage(JsonStorage(make_examples(tmp_path / "seed")), db)
+        session = run_session(str(tmp_path / "unused"), storage=db)
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.read_active()["active_world"] == session.active_world
+        total, tail = db.tail_history(2)
+        assert total == session.transitions and tail[-1]["tx_id"] == session.last_tx
+        export_json(db, str(tmp_path / "export"))
+
+    assert history_key(tmp_path / "json" / "history.json") == history_key(tmp_path / "export" / "history.json")
+    assert sorted(p.name for p in (tmp_path / "export" / "worlds").iterdir()) == ["w1.json", "w2.json", "w3.json", "w4.json"]
+    assert json.loads((tmp_path / "export" / "active_world.json").read_text())["active_world"] == session.active_world
+    assert not (tmp_path / "unused" / "history.json").exists()
+
+
+def test_history_and_active_world_commit_together(tmp_path, make_examples):
+    with SqliteStorage(str(tmp_path / "state.db")) as db:
+        copy_storage(JsonStorage(make_examples(tmp_path / "seed")), db)
+        run_session(str(tmp_path), storage=db)
+        before = (db.tail_history(0)[0], db.read_active())
+        last = db.tail_history(1)[1][0]
+        fresh = dict(last, tx_id="new-tx", to_world="w4")
+        with pytest.raises(sqlite3.IntegrityError):
+            db.append_transactions([fresh, last])  # duplicate tx_id fails the whole batch
+        assert (db.tail_history(0)[0], db.read_active()) == before
+
+        index = HistoryIndex(db.iter_history())
+        assert db.query_history(world="w3") == [index.records[i] for i in index.query(world="w3")]
+        assert db.query_history(proposal="prop-002", limit=1) == [index.records[index.query(proposal="prop-002")[0]]]
+
+
+def test_incomplete_backends_fail_at_construction():
+    class ReadOnly(Storage):
+        def load_worlds(self):
+            return {}
+
+    with pytest.raises(TypeError):
+        ReadOnly()
+
+
+def test_jobs_run_against_a_storage_backend(tmp_path, make_examples):
+    from sim.jobs import DONE, FINISHED, JobParams, JobRunner
+
+    with SqliteStorage(str(tmp_path / "state.db")) as db:
+        copy_storage(JsonStorage(make_examples(tmp_path / "seed")), db)
+        runner = JobRunner(str(tmp_path / "unused"), storage=db)
+        try:
+            job = runner.submit(default_proposals(), JobParams(seed=1, approval_probability=0.9))
+            deadline = time.time() + 30
+            while job.status not in FINISHED and time.time() < deadline:
+                time.sleep(0.01)
+            assert job.status == DONE
+            committed = runner.commit(job.job_id)
+        finally:
+            runner.shutdown()
+        passed = [r["tx_id"] for r in job.results if r["passed"]]
+        assert committed == len(passed) > 0
+        assert [r["tx_id"] for r in db.iter_history()] == passed
+        assert db.read_active()["last_tx"] == passed[-1]
+    assert not (tmp_path / "unused" / "history.json").exists()
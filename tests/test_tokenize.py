@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from sim.model import World
+from sim.tokenize import chunk_string, pack_minting_bundles
+
+
+def make_world(i: int) -> World:
+    return World(
+        f"w{i}",
+        f"World {i}",
+        "A long description that certainly exceeds the sixty-four byte CIP-25 string limit ✓",
+        necessary=["p1", "p2"],
+        possible=[f"transition_to_w{i + 1}"],
+        edges=[f"w{i + 1}"],
+    )
+
+
+def test_chunk_string_respects_byte_limit_and_characters():
+    text = "é" * 50  # 100 bytes
+    chunks = chunk_string(text)
+    assert isinstance(chunks, list)
+    assert "".join(chunks) == text
+    assert all(len(c.encode("utf-8")) <= 64 for c in chunks)
+    assert chunk_string("short") == "short"
+    assert chunk_string("a😀é", 4) == ["a", "😀", "é"]
+    with pytest.raises(ValueError):
+        chunk_string("é" * 5, 1)
+
+
+def test_bundles_fit_budget_and_share_attribute_lists():
+    bundles = list(pack_minting_bundles((make_world(i) for i in range(200)), "policy", budget_bytes=4000))
+    assert len(bundles) > 1
+    assert sum(len(b.assets) for b in bundles) == 200
+    for b in bundles:
+        encoded = b.encode()
+        assert len(encoded) == b.size <= 4000
+        assert sum(b.world_sizes.values()) < b.size
+        # ["p1", "p2"] is stored once per bundle
+        assert sum(1 for items in b.lists.values() if items == ["p1", "p2"]) == 1
+
+
+def test_metadata_cache_evicts_least_recently_used(monkeypatch):
+    import sim.tokenize as tokenize
+
+    monkeypatch.setattr(tokenize, "_METADATA_CACHE_SIZE", 2)
+    monkeypatch.setattr(tokenize, "_metadata_cache", {})
+    a, b, c = (World(w, w, "") for w in ("a", "b", "c"))
+    for world in (a, b, a, c):
+        tokenize.metadata_bytes(world)
+    assert list(tokenize._metadata_cache) == [a.digest, c.digest]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from sim.model import Transition, World
+from sim.session import GovernanceSession
+from sim.sim_helpers import build_voters, default_proposals
+from sim.versioned import FrameHistory, PMap
+
+
+class SameHash:
+    def __init__(self, v):
+        self.v = v
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, SameHash) and self.v == other.v
+
+
+def test_pmap_matches_dict_and_keeps_snapshots():
+    rng = random.Random(0)
+    m, d, snapshots = PMap(), {}, []
+    for i in range(5000):
+        k = rng.choice([rng.randrange(800), SameHash(rng.randrange(4))])
+        if rng.random() < 0.3:
+            m, _ = m.delete(k), d.pop(k, None)
+        else:
+            m, d[k] = m.set(k, i), i
+        if i % 500 == 0:
+            snapshots.append((m, dict(d)))
+    for snap, expected in snapshots + [(m, d)]:
+        assert len(snap) == len(expected)
+        assert dict(snap.items()) == expected
+        assert all(snap[k] == v for k, v in expected.items())
+
+
+def test_versions_share_structure_and_stay_queryable(example_model):
+    model = example_model
+    history = FrameHistory.from_model(model)
+    history.commit(active_world="w2")
+    history.commit(
+        add_worlds=[World("w5", "w5", "")],
+        add_edges=[("w4", "w5"), ("w5", "w1")],
+        set_true=[("p1", "w5")],
+        set_false=[("p1", "w1")],
+    )
+    v0, v1, v2 = history[0], history[1], history[2]
+    assert v1.worlds is v0.worlds and v1.succ is v0.succ and v1.active_world == "w2"
+    assert "w5" not in v0.worlds and "w5" not in v0.descendants("w1")
+    assert v2.reachable("w1", "w5") and not v0.reachable("w1", "w5")
+    assert v0.successors("w3") is v2.successors("w3")
+
+    for version, reference in ((v0, model), (v2, v2.to_model())):
+        for w in reference.worlds:
+            for p in ("p1", "p2", "p3", "p4"):
+                assert version.is_necessary(p, w) == reference.is_necessary(p, w)
+                assert version.is_possible(p, w) == reference.is_possible(p, w)
+    assert v0.to_model().relations == model.relations
+    assert Transition("w5", "w1") in v2.edges()
+    v3 = v2.evolve(add_worlds=[World("w6", "w6", "", edges=["w1", "w5"])])
+    assert v3.successors("w6") == {"w1", "w5"}
+    for change in (
+        {"remove_edges": [("w1", "w9")]},
+        {"set_true": [("p1", "w9")]},
+        {"set_false": [("p1", "w9")]},
+        {"add_worlds": [World("w7", "w7", "", edges=["w9"])]},
+    ):
+        with pytest.raises(ValueError):
+            v2.evolve(**change)
+
+
+def test_session_records_a_version_per_passed_proposal(tmp_path, make_examples):
+    examples = make_examples(tmp_path)
+    with GovernanceSession(examples, voters=build_voters(10), rng=random.Random(1), track_versions=True) as session:
+        results = session.run_proposals(default_proposals(), approval_probability=0.7, participation_probability=0.95)
+    passed = [tx for tx, _ in results if tx is not None]
+    assert len(session.versions) == len(passed) + 1
+    assert [v.tx_id for v in session.versions.versions[1:]] == [tx.tx_id for tx in passed]
+    assert session.versions.head.active_world == session.active_world
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import networkx as nx
+
+from sim.visualize import LayoutCache, compute_layout, graph_fingerprint
+
+
+def cycle_graph(n: int) -> nx.DiGraph:
+    G = nx.DiGraph()
+    G.add_edges_from((f"w{i}", f"w{(i % n) + 1}") for i in range(1, n + 1))
+    return G
+
+
+def test_layout_cache_hit_and_persistence(tmp_path):
+    G = cycle_graph(6)
+    cache = LayoutCache(str(tmp_path))
+    pos = compute_layout(G, cache)
+    assert compute_layout(G, cache) == pos
+    # a fresh cache instance reads the persisted layout
+    assert compute_layout(G, LayoutCache(str(tmp_path))) == pos
+    H = cycle_graph(6)
+    assert graph_fingerprint(H) == graph_fingerprint(G)
+    H.add_edge("w1", "w3")
+    assert graph_fingerprint(H) != graph_fingerprint(G)
+
+
+def test_layout_cache_is_capped_and_leaves_no_temp_files(tmp_path):
+    cache = LayoutCache(str(tmp_path), max_entries=2)
+    for i, key in enumerate("abc"):
+        cache.put(key, {"w1": (float(i), 0.0)})
+    assert cache.get("a") is None and cache.get("c") == {"w1": (2.0, 0.0)}
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert len(names) == 3 and "latest.json" in names
+    assert LayoutCache(str(tmp_path)).latest() == {"w1": (2.0, 0.0)}
+
+
+def test_incremental_layout_places_new_nodes_near_neighbours(tmp_path, monkeypatch):
+    import sim.visualize as viz
+
+    monkeypatch.setattr(viz, "LARGE_GRAPH_NODES", 3)  # exercise the large-graph path cheaply
+    G = cycle_graph(8)
+    cache = LayoutCache(str(tmp_path))
+    before = compute_layout(G, cache)
+    G.add_edge("w1", "w9")
+    after = compute_layout(G, cache)
+    assert all(after[n] == before[n] for n in before)
+    x, y = after["w9"]
+    assert abs(x - before["w1"][0]) < 0.1 and abs(y - before["w1"][1]) < 0.1
+
+
+def test_lod_view_bounds_nodes_and_keeps_active_neighbourhood():
+    from sim.visualize import build_lod_view, drill_down
+
+    G = nx.DiGraph()
+    # 40 disjoint 3-cycles plus a spoke from w0 into each
+    for c in range(40):
+        a, b, d = f"c{c}a", f"c{c}b", f"c{c}c"
+        G.add_edges_from([(a, b), (b, d), (d, a)])
+    G.add_edges_from([("w0", "c0a"), ("c1b", "w0")])
+    view = build_lod_view(G, "w0", max_nodes=10, max_edges=20)
+    H = view.graph
+    assert H.number_of_nodes() <= 10 and H.number_of_edges() <= 20
+    assert {"w0", "c0a", "c1b"} <= set(H.nodes())
+    assert sum(H.nodes[n]["count"] for n in H.nodes()) == G.number_of_nodes()
+    sub = drill_down(G, view, "cluster:c5a", "w0")
+    assert set(sub.graph.nodes()) == {"c5a", "c5b", "c5c"}
+
+
+def test_lod_view_caps_hub_neighbourhood_and_splits_giant_scc():
+    from sim.visualize import NEIGHBOURS_CLUSTER, build_lod_view, drill_down, graph_clusters
+
+    # One SCC (a ring) whose hub w1 links to every other world.
+    G = cycle_graph(400)
+    G.add_edges_from(("w1", f"w{i}") for i in range(3, 401))
+    view = build_lod_view(G, "w1", max_nodes=40)
+    H = view.graph
+    assert H.number_of_nodes() <= 40
+    assert "w1" in H and H.nodes[NEIGHBOURS_CLUSTER]["count"] > 350
+    assert sum(H.nodes[n]["count"] for n in H.nodes()) == 400
+    assert len(drill_down(G, view, NEIGHBOURS_CLUSTER, "w1", max_nodes=40).graph) <= 40
+    clusters = graph_clusters(cycle_graph(400), max_clusters=40)
+    assert 1 < len(clusters) and max(len(m) for m in clusters.values()) <= 40
+
+
+def test_timeline_series_streams_windows_and_downsamples(tmp_path):
+    import json
+
+    from sim.visualize import timeline_series
+
+    worlds = ["w1", "w2", "w3", "w4"]
+    history = [
+        {"from_world": worlds[i % 4], "to_world": worlds[(i + 1) % 4], "timestamp": f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z"}
+        for i in range(10_000)
+    ]
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps(history, indent=2))
+
+    full = timeline_series(str(path), max_points=400)
+    assert full.total == 10_000 and len(full.xs) <= 400
+    assert min(full.ys) == 0 and max(full.ys) == 3  # per-bucket extremes survive
+    assert full.xs == sorted(full.xs)
+
+    tail = timeline_series(str(path), last_n=50)
+    assert tail.total == 50 and tail.xs[0] == 9_950
+
+    ranged = timeline_series(str(path), since="2025-01-01T00:00:10Z", until="2025-01-01T00:00:19Z")
+    assert ranged.xs[0] == 10 and ranged.total >= 10